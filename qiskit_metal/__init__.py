@@ -14,7 +14,16 @@
 
 # pylint: disable=wrong-import-order
 # pylint: disable=wrong-import-position
-"""Qiskit Metal"""
+"""Qiskit Metal
+
+Importing qiskit_metal only sets up the config and logger.  The modules and
+the names of the user-accessible scope below are imported on first access
+(PEP 562).
+
+With the environment variable QISKIT_METAL_HEADLESS set, Qt is never
+imported and the matplotlib backend is left unchanged.  Use it for scripts,
+batch jobs and CI that do not need the GUI.
+"""
 __version__ = '0.1.5'
 __license__ = "Apache 2.0"
 __copyright__ = 'Copyright IBM 2019-2020'
@@ -25,6 +34,7 @@ __status__ = "Development"
 ### Windows OS catch for library geopandas not installed with setup.py
 
 import os
+import sys
 if os.name == 'nt':
     try:
         import geopandas
@@ -44,6 +54,26 @@ if os.name == 'nt':
 
 ###########################################################################
 ### Basic Setups
+def __is_headless() -> bool:  # pylint: disable=invalid-name
+    """True if the QISKIT_METAL_HEADLESS environment variable is set, or if
+    running the command line (qiskit-metal or python -m qiskit_metal)."""
+    if os.getenv('QISKIT_METAL_HEADLESS', None):
+        return True
+    argv = getattr(sys, 'argv', None) or ['']
+    if os.path.basename(argv[0]).startswith('qiskit-metal'):
+        return True
+    # Python 3.10+: the arguments of the interpreter itself
+    orig_argv = getattr(sys, 'orig_argv', [])
+    return any(orig_argv[i:i + 2] == ['-m', 'qiskit_metal']
+               for i in range(len(orig_argv) - 1))
+
+
+_HEADLESS = __is_headless()
+"""True to never import Qt.  Set by the QISKIT_METAL_HEADLESS environment
+variable; the command line always runs headless."""
+del __is_headless
+
+
 ## Setup Qt
 def __setup_Qt_backend():  # pylint: disable=invalid-name
     """Setup matplotlib to use Qt5's visualization.
@@ -104,16 +134,16 @@ def __setup_Qt_backend():  # pylint: disable=invalid-name
             # AA_DontUseNativeMenuBar
             # AA_MacDontSwapCtrlAndMeta
 
-    if not os.getenv('QISKIT_METAL_HEADLESS', None):
-        # pylint: disable=import-outside-toplevel
-        import matplotlib as mpl
-        mpl.use("Qt5Agg")
-        # pylint: disable=redefined-outer-name
-        import matplotlib.pyplot as plt
-        plt.ion()  # interactive
+    # pylint: disable=import-outside-toplevel
+    import matplotlib as mpl
+    mpl.use("Qt5Agg")
+    # pylint: disable=redefined-outer-name
+    import matplotlib.pyplot as plt
+    plt.ion()  # interactive
 
 
-__setup_Qt_backend()
+if not _HEADLESS:
+    __setup_Qt_backend()
 del __setup_Qt_backend
 
 ## Setup logging
@@ -135,30 +165,71 @@ from .toolbox_python.attr_dict import Dict
 # Due to order of imports
 from ._is_design import is_design, is_component
 
-# Core modules for user to use
-from .toolbox_metal.parsing import is_true
-from . import qlibrary
-from . import designs
-from . import draw
-from . import renderers
-from . import qgeometries
-from . import analyses
-from . import toolbox_python
-from . import toolbox_metal
-
-# Metal GUI
-from ._gui.main_window import MetalGUI
-
-# Utility modules
-# For plotting in matplotlib;  May be superseded by a renderer?
-from .renderers.renderer_mpl import mpl_toolbox as plt
-
-# Utility functions
-from .toolbox_python.display import Headings
-
-# Import default renderers
-from .renderers import setup_renderers
-
-# Common-use
-from .qlibrary import QComponent
-from .toolbox_metal.about import about, open_docs
+# Imported on first access, by __getattr__
+_lazy_modules = [
+    # Core modules for user to use
+    'qlibrary',
+    'designs',
+    'draw',
+    'renderers',
+    'qgeometries',
+    'analyses',
+    'toolbox_python',
+    'toolbox_metal',
+]
+_lazy_names = Dict(
+    is_true=('.toolbox_metal.parsing', 'is_true'),
+    # Metal GUI
+    MetalGUI=('._gui.main_window', 'MetalGUI'),
+    # Utility modules
+    # For plotting in matplotlib;  May be superseded by a renderer?
+    plt=('.renderers.renderer_mpl.mpl_toolbox', None),
+    # Utility functions
+    Headings=('.toolbox_python.display', 'Headings'),
+    # Import default renderers
+    setup_renderers=('.renderers', 'setup_renderers'),
+    # Common-use
+    QComponent=('.qlibrary', 'QComponent'),
+    about=('.toolbox_metal.about', 'about'),
+    open_docs=('.toolbox_metal.about', 'open_docs'),
+)
+
+
+def __getattr__(name: str):
+    """Import the modules and names of the user-accessible scope on first
+    access.
+
+    Args:
+        name (str): Name of the attribute.
+
+    Returns:
+        The module or object.
+
+    Raises:
+        AttributeError: If name is not part of the scope.
+    """
+    # pylint: disable=import-outside-toplevel
+    import importlib
+    if name in _lazy_modules:
+        value = importlib.import_module(f'.{name}', __name__)
+    elif name in _lazy_names:
+        module_name, attr = _lazy_names[name]
+        if name == 'MetalGUI' and _HEADLESS:
+            raise ImportError('MetalGUI is not available with '
+                              'QISKIT_METAL_HEADLESS set.')
+        value = importlib.import_module(module_name, __name__)
+        if attr:
+            value = getattr(value, attr)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_modules) | set(_lazy_names.keys()))
+
+
+if 'IPython' in sys.modules:
+    # Register the magics of the tutorials. Cheap, IPython is already loaded.
+    from .toolbox_python import display as _display
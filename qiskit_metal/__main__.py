@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Command line of Qiskit Metal, installed as ``qiskit-metal``.
+
+Build every variant of a design and export it, in parallel:
+
+.. code-block:: bash
+
+    qiskit-metal build my_chip.py --params variants.csv --out build -j 8
+    qiskit-metal build saved.metal --params variants.json --gmsh --elmer
+
+See qiskit_metal.toolbox_metal.batch for the build scripts and the
+parameter tables.
+"""
+
+import argparse
+import sys
+from typing import List
+
+from . import __version__
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Parser of the command line.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog='qiskit-metal',
+        description='Qiskit Metal | for quantum device design & analysis')
+    parser.add_argument('--version',
+                        action='version',
+                        version=f'%(prog)s {__version__}')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    build = commands.add_parser(
+        'build',
+        help='build design variants and export them',
+        description='Build each variant of the designs, one per row of the '
+        'parameter table, in parallel worker processes, export it into the '
+        'output directory and write a json manifest with the timings.')
+    build.add_argument('sources',
+                       nargs='+',
+                       help='design build scripts (.py) or saved designs '
+                       '(.metal)')
+    build.add_argument('-p',
+                       '--params',
+                       help='parameter table (.csv or .json), one row per '
+                       'variant')
+    build.add_argument('-o',
+                       '--out',
+                       default='metal_build',
+                       help='output directory (default: %(default)s)')
+    build.add_argument('-j',
+                       '--jobs',
+                       type=int,
+                       default=None,
+                       help='number of worker processes (default: number of '
+                       'cores)')
+    build.add_argument('--no-gds',
+                       dest='gds',
+                       action='store_false',
+                       help='do not export the GDS files')
+    build.add_argument('--gmsh',
+                       action='store_true',
+                       help='export the Gmsh meshes')
+    build.add_argument('--elmer',
+                       action='store_true',
+                       help='write the ElmerFEM capacitance simulation inputs')
+    build.add_argument('--manifest',
+                       default='manifest.json',
+                       help='file name of the manifest, in the output '
+                       'directory (default: %(default)s)')
+    return parser
+
+
+def _print_progress(done: int, total: int, result: dict):
+    """Print one line per finished variant.
+
+    Args:
+        done (int): Number of variants done.
+        total (int): Number of variants.
+        result (dict): Result of the variant.
+    """
+    line = (f"[{done}/{total}] {result['name']}: {result['status']} "
+            f"({result['timings'].get('total', 0):.1f} s)")
+    if result['error']:
+        line += '\n' + result['error']
+    print(line, flush=True)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the command line.
+
+    Args:
+        argv (List[str]): Arguments.  None for sys.argv[1:].
+            Defaults to None.
+
+    Returns:
+        int: Exit status.  0 if every variant was built, 1 otherwise.
+    """
+    args = _parser().parse_args(argv)
+
+    # pylint: disable=import-outside-toplevel
+    from .toolbox_metal.batch import run_batch
+    from .toolbox_metal.exceptions import InputError
+
+    try:
+        report = run_batch(args.sources,
+                           args.out,
+                           table=args.params,
+                           jobs=args.jobs,
+                           gds=args.gds,
+                           gmsh=args.gmsh,
+                           elmer=args.elmer,
+                           manifest=args.manifest,
+                           callback=_print_progress)
+    except (InputError, OSError) as error:
+        print(f'qiskit-metal: error: {error}', file=sys.stderr)
+        return 2
+
+    print(f"{report['num_ok']} of {len(report['variants'])} variants built "
+          f"in {report['wall_time']:.1f} s with {report['jobs']} workers.")
+    return 0 if report['num_error'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,9 +16,9 @@ import logging
 import os
 import webbrowser
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Callable, List
 
-from PySide2.QtCore import Qt, QTimer
+from PySide2.QtCore import Qt, QThreadPool, QTimer
 from PySide2.QtGui import QIcon, QPixmap
 from PySide2.QtWidgets import (QAction, QDialog, QDockWidget, QFileDialog,
                                QLabel, QMainWindow, QMessageBox, QVBoxLayout)
@@ -32,6 +32,7 @@ from qiskit_metal._gui.widgets.qlibrary_display.proxy_model_qlibrary import \
 
 from .. import config, qlibrary
 from ..designs.design_base import QDesign
+from ..toolbox_metal.qlibrary_index import QLibraryIndex
 from .elements_window import ElementsWindow
 from .net_list_window import NetListWindow
 from .main_window_base import (QMainWindowBaseHandler, QMainWindowExtensionBase,
@@ -42,6 +43,7 @@ from .renderer_hfss_gui import RendererHFSSWidget
 from .renderer_q3d_gui import RendererQ3DWidget
 from .utility._handle_qt_messages import slot_catch_error
 from .utility._toolbox_qt import doShowHighlighWidget
+from .utility._worker import JobProgressDialog, Worker
 from .widgets.all_components.table_model_all_components import \
     QTableModel_AllComponents
 from .widgets.build_history.build_history_scroll_area import \
@@ -208,7 +210,7 @@ class QMainWindowExtension(QMainWindowExtensionBase):
         self.logger.info(
             r'Rebuilding all components in the model (and refreshing widgets)...'
         )
-        self.gui.rebuild()
+        self.gui.rebuild(background=True)
         #self.gui.ui.mainViewTab.doShow()
 
     @slot_catch_error()
@@ -318,6 +320,12 @@ class MetalGUI(QMainWindowBaseHandler):
 
         self.build_log_window = None
 
+        # Long jobs, such as rebuilds and exports, run one at a time on a
+        # worker thread. See run_job.
+        self._thread_pool = QThreadPool(self.main_window)
+        self._thread_pool.setMaxThreadCount(1)
+        self._job = None  # type: JobProgressDialog
+
         self._setup_component_widget()
         self._setup_plot_widget()
         self._setup_design_components_widget()
@@ -671,8 +679,15 @@ class MetalGUI(QMainWindowBaseHandler):
         self.QLIBRARY_ROOT = qlibrary_abs_path
         self.QLIBRARY_FOLDERNAME = qlibrary.__name__
 
+        # Index of the QComponent classes, read without importing them
+        index_config = config.GUI_CONFIG.qlibrary_index
+        self.qlibrary_index = QLibraryIndex(index_config.file)
+        self.qlibrary_index.update([self.QLIBRARY_ROOT] +
+                                   list(index_config.user_paths))
+
         # create model for Qlibrary directory
-        dock.library_model = QFileSystemLibraryModel(self.path_imgs)
+        dock.library_model = QFileSystemLibraryModel(self.path_imgs,
+                                                     self.qlibrary_index)
 
         dock.library_model.setRootPath(self.QLIBRARY_ROOT)
 
@@ -693,7 +708,8 @@ class MetalGUI(QMainWindowBaseHandler):
                 dock.library_model.index(dock.library_model.rootPath())))
 
         # try empty one if no work
-        view.setItemDelegate(LibraryDelegate(self.main_window))
+        view.setItemDelegate(
+            LibraryDelegate(self.main_window, self.qlibrary_index))
         view.itemDelegate().tool_tip_signal.connect(view.setToolTip)
 
         view.qlibrary_filepath_signal.connect(
@@ -784,16 +800,137 @@ class MetalGUI(QMainWindowBaseHandler):
         """
         return self.plot_win.canvas
 
-    def rebuild(self, autoscale: bool = False):
+    def rebuild(self, autoscale: bool = False, background: bool = False):
         """
         Rebuild all components in the design from scratch and refresh the gui.
-        """
 
-        self.design.rebuild()
+        Args:
+            autoscale (bool): Autoscale the plot after the rebuild.
+                Defaults to False.
+            background (bool): Rebuild on a worker thread, with a progress
+                dialog that can cancel the rebuild, and refresh the gui when
+                done.  The call then returns right away.  Defaults to False.
+        """
+        if not background:
+            self.design.rebuild()
+            self._rebuild_done(autoscale)
+            return
+
+        self.run_job(self.design.rebuild,
+                     label='Rebuilding the design...',
+                     on_done=lambda: self._rebuild_done(autoscale))
+
+    def _rebuild_done(self, autoscale: bool = False):
+        """Refresh the gui after a rebuild.  Also called when a rebuild in
+        the background failed or was cancelled, as part of the components
+        may have been rebuilt.
+
+        Args:
+            autoscale (bool): Autoscale the plot.  Defaults to False.
+        """
         self.refresh()
         if autoscale:
             self.autoscale()
 
+    @property
+    def is_busy(self) -> bool:
+        """True while a job started by run_job is running."""
+        return self._job is not None
+
+    def run_job(self,
+                fn: Callable,
+                *args,
+                label: str = 'Working...',
+                on_finished: Callable = None,
+                on_done: Callable = None,
+                **kwargs) -> Worker:
+        """Run fn(*args, progress=callback, **kwargs) on a worker thread, so
+        that the gui is not frozen.
+
+        The job should call callback(done, total, name) to report its
+        progress.  The callback raises an exception once the user clicks
+        Cancel, which stops the job.  While the job runs, the widgets which
+        edit the design are disabled, and a window modal progress dialog is
+        shown if the job takes more than half a second.  Jobs run one at a
+        time.
+
+        Args:
+            fn (Callable): The job.  Must accept the keyword argument progress.
+            *args: Arguments of the job.
+            label (str): Text of the progress dialog.  Defaults to
+                'Working...'.
+            on_finished (Callable): Called with the result of the job if it
+                succeeded, in the gui thread.  Defaults to None.
+            on_done (Callable): Called without argument when the job ends,
+                also if it failed or was cancelled, in the gui thread.
+                Defaults to None.
+            **kwargs: Keyword arguments of the job.
+
+        Returns:
+            Worker: The job.  Call its cancel method to stop it.  None if
+            another job is running.
+        """
+        if self.is_busy:
+            self.logger.warning(
+                f'Cannot start "{label}" while "{self._job.label}" runs.')
+            return None
+
+        def job_done():
+            self._job = None
+            self._set_design_widgets_enabled(True)
+            if on_done:
+                on_done()
+
+        # The dialog is only shown after a delay, so that it does not flash
+        # for short jobs.  Until then, the widgets must not edit the design.
+        self._set_design_widgets_enabled(False)
+        worker = Worker(fn, *args, **kwargs)
+        self._job = JobProgressDialog(worker,
+                                      label,
+                                      parent=self.main_window,
+                                      on_finished=on_finished,
+                                      on_done=job_done,
+                                      logger=self.logger)
+        self._thread_pool.start(worker)
+        return worker
+
+    def _set_design_widgets_enabled(self, enabled: bool):
+        """Enable or disable the widgets which can edit the design: the
+        menus, the design toolbar, the docks and the plot.  The log stays
+        enabled.
+
+        Args:
+            enabled (bool): False to disable them
+        """
+        widgets = [
+            self.ui.menubar, self.ui.toolBarDesign, self.ui.dockDesign,
+            self.ui.dockComponent, self.ui.dockLibrary, self.ui.dockConnectors,
+            self.ui.dockVariables
+        ]
+        if self.plot_win:
+            widgets.append(self.plot_win.centralWidget())
+        for widget in widgets:
+            widget.setEnabled(enabled)
+
+    def rebuild_component(self, name: str):
+        """Rebuild one component, then refresh only its row of the
+        components table and its geometry in the plot.
+
+        Args:
+            name (str): Name of the component
+        """
+        self.design.components[name].rebuild()
+        self.refresh_component(name)
+
+    def refresh_component(self, name: str):
+        """Refresh the widgets for one component, after it was rebuilt.
+
+        Args:
+            name (str): Name of the component
+        """
+        self.ui.proxyModel.sourceModel().refresh_component(name)
+        self.canvas.refresh_component(name)
+
     def refresh(self):
         """Refreshes everything. Overkill in general.
 
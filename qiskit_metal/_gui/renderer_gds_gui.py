@@ -99,20 +99,39 @@ class RendererGDSWidget(QMainWindow):
 
         If the list of components to export is smaller than the total
         number of components, highlight_qcomponents is included as an
-        argument. Otherwise it is not.
+        argument. Otherwise it is not.  The export runs on a worker thread of
+        the gui.
         """
         filename = self.ui.lineEdit.text()
         components_to_export = self.get_checked()
-        a_gds = self.design.renderers.gds
         if filename and components_to_export:
             if len(components_to_export) == len(self.design.components):
-                a_gds.export_to_gds(filename)
-            else:
-                a_gds.export_to_gds(filename,
-                                    highlight_qcomponents=components_to_export)
+                components_to_export = None
+            self._gui.run_job(self._export_to_gds,
+                              filename,
+                              components_to_export,
+                              label=f'Exporting {filename}...')
             self.close()
         else:
             QMessageBox.warning(
                 self, "Error",
                 "Please enter a valid file name and \n select at least one component."
             )
+
+    def _export_to_gds(self, filename: str, components: list, progress=None):
+        """Job of export_file.  The export cannot be cancelled once started.
+
+        Args:
+            filename (str): File name which can also include directory path.
+            components (list): Names of the components to export.  None to
+                export all of them.
+            progress (Callable): Progress callback of the job.  Defaults to
+                None.
+        """
+        if progress:
+            progress(0, 1, 'Rendering the components...')
+        a_gds = self.design.renderers.gds
+        if components is None:
+            a_gds.export_to_gds(filename)
+        else:
+            a_gds.export_to_gds(filename, highlight_qcomponents=components)
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Run long jobs, such as a rebuild or an export, on a QThreadPool so that
+the GUI is not frozen.  The job reports its progress and is cancelled
+cooperatively, when it next reports progress.
+"""
+
+import threading
+import traceback
+from typing import Callable
+
+from PySide2.QtCore import QObject, QRunnable, Qt, Signal, Slot
+from PySide2.QtWidgets import QProgressDialog, QWidget
+
+__all__ = ['JobCancelled', 'Worker', 'JobProgressDialog']
+
+
+class JobCancelled(Exception):
+    """Raised in the worker thread, by the progress callback of a job which
+    was cancelled."""
+
+
+class WorkerSignals(QObject):
+    """Signals of a Worker.  A QRunnable is not a QObject, so it cannot have
+    signals itself.
+
+    Signals:
+        progress (int, int, str): Number of steps done, total number of
+            steps and name of the current step.
+        finished (object): The result of the job.
+        error (str): The traceback of the exception raised by the job.
+        cancelled: The job was cancelled.
+    """
+    progress = Signal(int, int, str)
+    finished = Signal(object)
+    error = Signal(str)
+    cancelled = Signal()
+
+
+class Worker(QRunnable):
+    """Run fn(*args, progress=callback, **kwargs) on a QThreadPool.
+
+    The callback has the signature callback(done: int, total: int, name: str)
+    and raises JobCancelled once cancel() was called.  Exactly one of the
+    signals finished, error or cancelled is emitted at the end.
+    """
+
+    def __init__(self, fn: Callable, *args, **kwargs):
+        """
+        Args:
+            fn (Callable): The job.  Must accept the keyword argument progress.
+            *args: Arguments of the job.
+            **kwargs: Keyword arguments of the job.
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Ask the job to stop when it next reports progress."""
+        self._cancel.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True if cancel() was called."""
+        return self._cancel.is_set()
+
+    def report_progress(self, done: int, total: int, name: str = ''):
+        """Progress callback given to the job.  Called from the worker thread.
+
+        Args:
+            done (int): Number of steps done.
+            total (int): Total number of steps.
+            name (str): Name of the current step.  Defaults to ''.
+
+        Raises:
+            JobCancelled: If the job was cancelled.
+        """
+        if self.is_cancelled:
+            raise JobCancelled()
+        self.signals.progress.emit(done, total, name)
+
+    @Slot()
+    def run(self):
+        """Run the job, in a thread of the pool."""
+        try:
+            result = self.fn(*self.args,
+                             progress=self.report_progress,
+                             **self.kwargs)
+        except JobCancelled:
+            self.signals.cancelled.emit()
+        except Exception:  # pylint: disable=broad-except
+            self.signals.error.emit(traceback.format_exc())
+        else:
+            self.signals.finished.emit(result)
+
+
+class JobProgressDialog(QProgressDialog):
+    """Window modal progress dialog of a Worker, with a Cancel button.
+
+    The dialog stops the user from editing the design while the job runs,
+    without blocking the event loop.  It is only shown once the job has run
+    for half a second, so the caller should disable its widgets before.  The
+    callbacks are called in the GUI thread when the job ends.
+    """
+
+    def __init__(self,
+                 worker: Worker,
+                 label: str,
+                 parent: QWidget = None,
+                 on_finished: Callable = None,
+                 on_done: Callable = None,
+                 logger=None):
+        """
+        Args:
+            worker (Worker): The job.
+            label (str): Text of the dialog.
+            parent (QWidget): The parent window.  Defaults to None.
+            on_finished (Callable): Called with the result if the job
+                succeeded.  Defaults to None.
+            on_done (Callable): Called without argument when the job ends,
+                also if it failed or was cancelled.  Defaults to None.
+            logger (logging.Logger): Logs errors.  Defaults to None.
+        """
+        super().__init__(label, 'Cancel', 0, 0, parent)
+        self.worker = worker
+        self.label = label
+        self.on_finished = on_finished
+        self.on_done = on_done
+        self.logger = logger
+
+        self.setWindowTitle('Qiskit Metal')
+        self.setWindowModality(Qt.WindowModal)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        # Do not flash the dialog for short jobs
+        self.setMinimumDuration(500)
+
+        self.canceled.connect(self.cancel_job)
+        worker.signals.progress.connect(self.on_progress)
+        worker.signals.finished.connect(self.on_job_finished)
+        worker.signals.error.connect(self.on_job_error)
+        worker.signals.cancelled.connect(self.on_job_cancelled)
+
+    @Slot()
+    def cancel_job(self):
+        """Handles click on Cancel."""
+        self.setLabelText(f'{self.label}\nCancelling...')
+        self.worker.cancel()
+
+    @Slot(int, int, str)
+    def on_progress(self, done: int, total: int, name: str):
+        """Show the progress of the job.
+
+        Args:
+            done (int): Number of steps done.
+            total (int): Total number of steps.
+            name (str): Name of the current step.
+        """
+        if self.worker.is_cancelled:
+            return
+        self.setMaximum(total)
+        self.setValue(done)
+        if name:
+            self.setLabelText(f'{self.label}\n{name}')
+
+    @Slot(object)
+    def on_job_finished(self, result):
+        """The job succeeded.
+
+        Args:
+            result (object): Returned by the job.
+        """
+        self._end()
+        if self.on_finished:
+            self.on_finished(result)
+
+    @Slot(str)
+    def on_job_error(self, message: str):
+        """The job raised an exception.
+
+        Args:
+            message (str): The traceback.
+        """
+        if self.logger:
+            self.logger.error(f'{self.label} failed:\n{message}')
+        self._end()
+
+    @Slot()
+    def on_job_cancelled(self):
+        """The job stopped after a cancel."""
+        if self.logger:
+            self.logger.info(f'{self.label} was cancelled.')
+        self._end()
+
+    def _end(self):
+        """Close the dialog and call on_done."""
+        # Closing the dialog emits canceled
+        self.canceled.disconnect(self.cancel_job)
+        self.close()
+        self.deleteLater()
+        if self.on_done:
+            self.on_done()
@@ -35,13 +35,20 @@ class QTableModel_AllComponents(QAbstractTableModel):
     MVC class
     See https://doc.qt.io/qt-5/qabstracttablemodel.html
 
+    The model follows the changes of the design through
+    QDesign.add_change_callback.  It keeps the ids of the components in the
+    order of the rows, and only notifies the view of the rows which changed.
+
     Can be accessed with
         t = gui.ui.tableComponents
         model = t.model()
         index = model.index(1,0)
         model.data(index)
     """
-    __timer_interval = 500  # ms
+
+    # Emitted by the design callback, which can run in a worker thread.
+    # Queued to the GUI thread in that case.
+    _design_changed = QtCore.Signal(str, object)
 
     def __init__(self,
                  gui,
@@ -63,52 +70,150 @@ class QTableModel_AllComponents(QAbstractTableModel):
             'Name', 'QComponent class', 'QComponent module', 'Build status',
             'id'
         ]
-        self._row_count = -1
 
-        self._create_timer()
+        # Component id of each row, and the reverse
+        self._ids = []
+        self._rows = {}
+        # The design whose changes are followed
+        self._design = None
+
+        # Rows changed since the last flush, and whether rows were added
+        self._dirty_rows = set()
+        self._resize_pending = False
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush)
+
+        self._design_changed.connect(self._apply_design_change)
 
     @property
     def design(self):
         """Returns the design."""
         return self.gui.design
 
-    def _create_timer(self):
-        """Refresh the model number of rows, etc.
+    def _follow_design(self):
+        """Follow the changes of the design of the gui, if it was swapped."""
+        if self._design is self.design:
+            return
+        if self._design is not None:
+            self._design.remove_change_callback(self._on_design_change)
+        self._design = self.design
+        if self._design is not None:
+            self._design.add_change_callback(self._on_design_change)
+
+    def _on_design_change(self, event: str, component_id: int):
+        """Callback of the design.  Can be called from any thread.
 
-        there must be a smarter way?
+        Args:
+            event (str): 'add', 'delete', 'rename', 'rebuild' or 'reset'.
+            component_id (int): Id of the component.
         """
-        self._timer = QtCore.QTimer(self)
-        self._timer.start(self.__timer_interval)
-        self._timer.timeout.connect(self.refresh_auto)
+        try:
+            self._design_changed.emit(event, component_id)
+        except RuntimeError:
+            # The model was deleted with the gui
+            self._design.remove_change_callback(self._on_design_change)
 
-    def refresh(self):
-        """Force refresh.
+    @QtCore.Slot(str, object)
+    def _apply_design_change(self, event: str, component_id: int):
+        """Update the rows after a change of the design.
 
-        Completly rebuild the model.
+        Args:
+            event (str): 'add', 'delete', 'rename', 'rebuild' or 'reset'.
+            component_id (int): Id of the component.
         """
-        self.modelReset.emit()
+        if event == 'reset':
+            self.refresh()
+
+        elif event == 'add':
+            if component_id in self._rows:
+                self._mark_dirty(component_id)
+                return
+            row = len(self._ids)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._ids.append(component_id)
+            self._rows[component_id] = row
+            self.endInsertRows()
+            self._resize_pending = True
+            self._flush_timer.start()
+
+        elif event == 'delete':
+            row = self._rows.get(component_id)
+            if row is None:
+                return
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._ids[row]
+            self._rows = {id_: num for num, id_ in enumerate(self._ids)}
+            self.endRemoveRows()
+            # The pending rows after the removed one move up
+            self._dirty_rows = {
+                num - (num > row) for num in self._dirty_rows if num != row
+            }
 
-    def refresh_auto(self):
-        """Automatic refresh, update row count, view, etc."""
-        # We could not do if the widget is hidden
-        new_count = self.rowCount()
+        else:
+            self._mark_dirty(component_id)
 
-        # if the number of rows have changed
-        if self._row_count != new_count:
-            #self.logger.info('Number of components changed')
+    def _mark_dirty(self, component_id: int):
+        """Notify the view that a row changed, at the next flush.
 
-            # When a model is reset it should be considered that all
-            # information previously retrieved from it is invalid.
-            # This includes but is not limited to the rowCount() and
-            # columnCount(), flags(), data retrieved through data(), and roleNames().
-            # This will loose the current selection.
-            self.modelReset.emit()
+        Args:
+            component_id (int): Id of the component.
+        """
+        row = self._rows.get(component_id)
+        if row is not None:
+            self._dirty_rows.add(row)
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Notify the view of the rows changed since the last flush, in one
+        dataChanged."""
+        if self._dirty_rows:
+            first, last = min(self._dirty_rows), max(self._dirty_rows)
+            self._dirty_rows.clear()
+            self.dataChanged.emit(self.index(first, 0),
+                                  self.index(last,
+                                             self.columnCount() - 1))
+        if self._resize_pending:
+            self._resize_pending = False
+            self.update_view()
 
+    def refresh(self):
+        """Force refresh.
+
+        Reads the components of the design again.  The model is only reset if
+        the components are not the ones in the rows, which loses the
+        selection.
+        """
+        self._follow_design()
+        ids = list(self.design._components.keys()) if self.design else []  # pylint: disable=protected-access
+        if ids == self._ids:
+            if ids:
+                self._dirty_rows.update((0, len(ids) - 1))
+                self._flush_timer.start()
+            return
+
+        # When a model is reset it should be considered that all
+        # information previously retrieved from it is invalid.
+        self.beginResetModel()
+        self._ids = ids
+        self._rows = {id_: num for num, id_ in enumerate(ids)}
+        self._dirty_rows.clear()
+        self.endResetModel()
+
+        if self._tableView:
             # for some reason the horizontal header is hidden even if i call this in init
             self._tableView.horizontalHeader().show()
+        self.update_view()
 
-            self._row_count = new_count
-            self.update_view()
+    def refresh_component(self, name: str):
+        """Refresh the row of one component.
+
+        Args:
+            name (str): Name of the component
+        """
+        if self.design and name in self.design.name_to_id:
+            self._mark_dirty(self.design.name_to_id[name])
 
     def update_view(self):
         """Updates the view."""
@@ -124,16 +229,13 @@ class QTableModel_AllComponents(QAbstractTableModel):
         Returns:
             int: The number of rows
         """
-        if self.design:  # should we just enforce this
-            num = int(len(self.design.components))
+        num = len(self._ids)
+        if self._tableView:
             if num == 0:
                 self._tableView.show_placeholder_text()
             else:
                 self._tableView.hide_placeholder_text()
-            return num
-        else:
-            self._tableView.show_placeholder_text()
-            return 0
+        return num
 
     def columnCount(self, parent: QModelIndex = None):
         """Returns the number of columns.
@@ -200,25 +302,28 @@ class QTableModel_AllComponents(QAbstractTableModel):
             str: Data depending on the index and role
         """
 
-        if not index.isValid() or not self.design:
+        if not index.isValid() or not self.design or \
+                index.row() >= len(self._ids):
             return
 
-        component_name = list(self.design.components.keys())[index.row()]
+        # pylint: disable=protected-access
+        component = self.design._components.get(self._ids[index.row()])
+        if component is None:
+            # Deleted from a worker thread, the row is removed soon
+            return
 
         if role == Qt.DisplayRole:
 
             if index.column() == 0:
-                return str(component_name)
+                return str(component.name)
             elif index.column() == 1:
-                return str(
-                    self.design.components[component_name].__class__.__name__)
+                return str(component.__class__.__name__)
             elif index.column() == 2:
-                return str(
-                    self.design.components[component_name].__class__.__module__)
+                return str(component.__class__.__module__)
             elif index.column() == 3:
-                return str(self.design.components[component_name].status)
+                return str(component.status)
             elif index.column() == 4:
-                return str(self.design.components[component_name].id)
+                return str(component.id)
 
         # The font used for items rendered with the default delegate. (QFont)
         elif role == Qt.FontRole:
@@ -229,7 +334,6 @@ class QTableModel_AllComponents(QAbstractTableModel):
 
         elif role == Qt.BackgroundRole:
 
-            component = self.design.components[component_name]
             if component.status != 'good':  # Did the component fail the build
                 #    and index.column()==0:
                 if not self._tableView:
@@ -242,11 +346,9 @@ class QTableModel_AllComponents(QAbstractTableModel):
         elif role == Qt.DecorationRole:
 
             if index.column() == 0:
-                component = self.design.components[component_name]
                 if component.status != 'good':  # Did the component fail the build
                     return QIcon(":/sample_shapes/warning")
 
         elif role == Qt.ToolTipRole or role == Qt.StatusTipRole:
-            component = self.design.components[component_name]
             text = f"""Component name= "{component.name}" instance of class "{component.__class__.__name__}" from module "{component.__class__.__module__}" """
             return text
@@ -476,8 +476,7 @@ class QTreeModel_Base(QAbstractItemModel):
                         else:  # if top-level option
                             dic[lbl] = value
                         if self.optionstype == 'component':
-                            self.component.rebuild()
-                            self.gui.refresh()
+                            self.gui.rebuild_component(self.component.name)
                         return True
         return False
 
@@ -24,7 +24,7 @@ import random
 from pathlib import Path
 
 from PySide2 import QtGui
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QTimer, Signal
 from PySide2.QtWidgets import QAction, QDockWidget, QTextEdit
 
 from .... import Dict, __version__, config
@@ -41,9 +41,17 @@ class QTextEditLogger(QTextEdit):
     """A text edit logger class.
 
     This class extends the `QTextEdit` class
+
+    Messages logged by the handlers are queued, then shown in batches by a
+    timer.  Only the last GUI_CONFIG.logger.num_lines messages are kept.
     """
     timestamp_len = 19
     _logo = 'metal_logo.png'
+    _flush_interval = 100  # ms
+
+    # Emitted from the thread of the handler when the queue stops being
+    # empty.  Queued to the GUI thread if needed.
+    _flush_requested = Signal()
 
     def __init__(self, img_path='/', dock_window: QDockWidget = None):
         """Widget to handle logging. Based on QTextEdit, an advanced WYSIWYG
@@ -78,8 +86,19 @@ class QTextEditLogger(QTextEdit):
         self.text_format = QtGui.QTextCharFormat()
         self.text_format.setFontFamily('Consolas')
 
-        self.logged_lines = collections.deque(
-            [], config.GUI_CONFIG.logger.num_lines)
+        num_lines = config.GUI_CONFIG.logger.num_lines
+        self.logged_lines = collections.deque([], num_lines)
+        # Bound the text shown, older lines are removed from the top
+        self.document().setMaximumBlockCount(num_lines)
+
+        # Messages of the handlers not shown yet.  Appended from any thread.
+        self._pending = collections.deque([], num_lines)
+        self._flush_pending = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self._flush_interval)
+        self._flush_timer.timeout.connect(self.flush)
+        self._flush_requested.connect(self._flush_timer.start)
 
         self.setup_menu()
 
@@ -310,20 +329,50 @@ class QTextEditLogger(QTextEdit):
         """Clear and reprint all log lines, thus refreshing toggles for
         timestamp, etc."""
         self.clear()
-        for name, record in self.logged_lines:
-            if name in self.get_all_checked():
-                self.log_message(record, name != 'Errors')
+        self._show_messages(self.logged_lines)
 
     def log_message_to(self, name, record):
-        """Set where to log messages to.
+        """Set where to log messages to.  The message is shown at the next
+        flush.  Can be called from any thread.
 
         Args:
             name (str): The name
             record (bool): True to send to records, False otherwise
         """
-        self.logged_lines.append((name, record))
-        if name in self.get_all_checked():
-            self.log_message(record, name != 'Errors')
+        self._pending.append((name, record))
+        if not self._flush_pending:
+            self._flush_pending = True
+            self._flush_requested.emit()
+
+    def flush(self):
+        """Show the messages queued by log_message_to, in one batch."""
+        self._flush_pending = False
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        self.logged_lines.extend(batch)
+        self._show_messages(batch)
+
+    def _show_messages(self, messages: list):
+        """Show messages in one edit of the document.
+
+        Args:
+            messages (list): Tuples of the logger name and the message.
+        """
+        checked = self.get_all_checked()
+        messages = [
+            (name, record) for name, record in messages if name in checked
+        ][-self.logged_lines.maxlen:]
+        if not messages:
+            return
+
+        cursor = self.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.beginEditBlock()
+        for name, record in messages:
+            self._insert_message(cursor, record, name != 'Errors')
+        cursor.endEditBlock()
+        self._scroll_to_end()
 
     def log_message(self, message, format_as_html=True):
         """Do the actual logging.
@@ -335,6 +384,20 @@ class QTextEditLogger(QTextEdit):
         # set the write positon
         cursor = self.textCursor()
         cursor.movePosition(QtGui.QTextCursor.End)
+        self._insert_message(cursor, message, format_as_html)
+        self._scroll_to_end()
+
+    def _insert_message(self,
+                        cursor: QtGui.QTextCursor,
+                        message: str,
+                        format_as_html=True):
+        """Insert a message in a new line at the cursor.
+
+        Args:
+            cursor (QtGui.QTextCursor): At the end of the document.
+            message (str): The message to log.
+            format_as_html (bool): True to format as HTML, False otherwise.  Defaults to True.
+        """
         cursor.insertBlock()  # add a new block, which makes a new line
 
         # add message
@@ -357,6 +420,8 @@ class QTextEditLogger(QTextEdit):
         else:
             cursor.insertText(message, self.text_format)
 
+    def _scroll_to_end(self):
+        """Scroll to the last message, if autoscroll is on."""
         # make sure that the message is visible and scrolled ot
         if self.action_scroll_auto.isChecked():
             self.moveCursor(QtGui.QTextCursor.End)
@@ -421,6 +486,9 @@ class LogHandler_for_QTextLog(logging.Handler):
         sequences. Used to display text that might contain such characters in
         HTML.
 
+        The message is queued, and shown later by the GUI thread, so this can
+        be called from any thread.
+
         Args:
             record (LogRecord): The log recorder
         """
@@ -25,6 +25,7 @@ from PySide2.QtWidgets import QItemDelegate, QStyle, QStyleOptionViewItem, QWidg
 
 from qiskit_metal._gui.widgets.qlibrary_display.file_model_qlibrary import QFileSystemLibraryModel
 from qiskit_metal.toolbox_metal.exceptions import QLibraryGUIException
+from qiskit_metal.toolbox_metal.qlibrary_index import QLibraryIndex
 
 
 class LibraryDelegate(QItemDelegate):
@@ -35,14 +36,19 @@ class LibraryDelegate(QItemDelegate):
 
     tool_tip_signal = Signal(str)
 
-    def __init__(self, parent: QWidget = None):
+    def __init__(self,
+                 parent: QWidget = None,
+                 library_index: QLibraryIndex = None):
         """
          Initializer for LibraryDelegate
 
         Args:
             parent(QWidget): parent
+            library_index(QLibraryIndex): Gives the TOOLTIP without importing
+                the QComponent.  Defaults to None, to import it.
         """
         super().__init__(parent)
+        self.library_index = library_index
         #  The Delegate may belong to a view using a ProxyModel but even so
         #  the source model for that Proxy Model(s) should be a QFileSystemLibraryModel
         self.source_model_type = QFileSystemLibraryModel
@@ -111,12 +117,14 @@ class LibraryDelegate(QItemDelegate):
             model = index.model()
             full_path = source_model.filePath(model.mapToSource(index))
 
-            # try:
-            try:
-                current_class = self.get_class_from_abs_file_path(full_path)
-                information = current_class.TOOLTIP
-            except:
-                information = ""
+            if self.library_index is not None:
+                information = self.library_index.tooltip(full_path)
+            else:
+                try:
+                    current_class = self.get_class_from_abs_file_path(full_path)
+                    information = current_class.TOOLTIP
+                except:
+                    information = ""
 
             self.tool_tip_signal.emit(information)
 
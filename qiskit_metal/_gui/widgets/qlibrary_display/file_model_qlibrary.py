@@ -22,6 +22,7 @@ from PySide2.QtCore import QModelIndex, QTimeZone, Qt, QSize
 from PySide2.QtGui import QIcon, QPixmap
 from PySide2.QtWidgets import QFileSystemModel
 from qiskit_metal._gui.utility.utils import findProperty
+from qiskit_metal.toolbox_metal.qlibrary_index import QLibraryIndex
 
 
 class QFileSystemLibraryModel(QFileSystemModel):
@@ -36,9 +37,16 @@ class QFileSystemLibraryModel(QFileSystemModel):
     defaultFilename = None
     size = 64
 
-    def __init__(self, path_imgs):
+    def __init__(self, path_imgs, library_index: QLibraryIndex = None):
+        """
+        Args:
+            path_imgs (Path): Folder of the images of the GUI.
+            library_index (QLibraryIndex): Gives the icon and name of the
+                QComponent files.  Defaults to None, to read the files.
+        """
         super().__init__()
         self.path_imgs = path_imgs
+        self.library_index = library_index
         self.defaultFilename = str(path_imgs / "metal_logo.png")
         pixmap = QPixmap(self.defaultFilename).scaled(
             QSize(self.size, self.size), Qt.KeepAspectRatio,
@@ -64,8 +72,9 @@ class QFileSystemLibraryModel(QFileSystemModel):
                 qfileinfo = self.fileInfo(index)
                 absoluteFilename = str(qfileinfo.absoluteFilePath())
                 if role == Qt.DecorationRole:
-                    matches = findProperty(absoluteFilename,
-                                           "\.\. image::[\r\n]+([^\r\n]+)")
+                    matches = self._find_property(
+                        absoluteFilename, 'icon',
+                        "\.\. image::[\r\n]+([^\r\n]+)")
                     if matches is not None and len(matches) != 0:
                         iconfile = matches[0].lstrip()
                         pathFilename = self.path_imgs / "components" / iconfile
@@ -87,8 +96,9 @@ class QFileSystemLibraryModel(QFileSystemModel):
                     if relativeFilename in self.nameCache:
                         return self.nameCache[relativeFilename]
                     else:
-                        matches = findProperty(absoluteFilename,
-                                               "\.\. meta::[\r\n]+([^\r\n]+)")
+                        matches = self._find_property(
+                            absoluteFilename, 'name',
+                            "\.\. meta::[\r\n]+([^\r\n]+)")
                         if matches is not None and len(matches) != 0:
                             displayName = matches[0].lstrip()
                             self.nameCache[relativeFilename] = displayName
@@ -100,3 +110,23 @@ class QFileSystemLibraryModel(QFileSystemModel):
                     return QSize(10, 25)
 
         return super().data(index, role)
+
+    def _find_property(self, filename: str, key: str, search_target: str):
+        """Find a property of a QComponent file, from the library index if
+        there is one, or else by reading the file.
+
+        Args:
+            filename (str): Absolute path of the file.
+            key (str): Key of the property in the index entry.
+            search_target (str): Regular expression of the property in the
+                file.
+
+        Returns:
+            list: The matches, like findProperty.
+        """
+        if self.library_index is None:
+            return findProperty(filename, search_target)
+        entry = self.library_index.get(filename)
+        if entry is None or not entry[key]:
+            return []
+        return [entry[key]]
@@ -165,12 +165,12 @@ class PropValTable(QAbstractTableModel):
                 oldkey = list(self._data.keys())[r]
                 if value != oldkey:
                     self.design.rename_variable(oldkey, value)
-                    self._gui.rebuild()
+                    self._gui.rebuild(background=True)
                     return True
 
             elif c == 1:
                 self._data[list(self._data.keys())[r]] = value
-                self._gui.rebuild()
+                self._gui.rebuild(background=True)
                 return True
 
         return False
@@ -76,6 +76,11 @@ GUI_CONFIG = Dict(
     main_window=Dict(
         title='Qiskit Metal — The Quantum Builder',
         auto_size=False,  # Autosize on creation of window
+    ),
+    qlibrary_index=Dict(
+        file=os.path.join(os.path.expanduser('~'), '.qiskit_metal',
+                          'qlibrary_index.json'),
+        user_paths=[],  # More folders of QComponent files to index
     ))
 """
 GUI_CONFIG
@@ -109,6 +114,13 @@ Logger settings
 
 ---------------------------
 Main window defaults
+
+
+**qlibrary_index**
+
+---------------------------
+Where the index of the QComponent classes of the library browser is saved
+(None to not save it), and the folders indexed besides the qlibrary.
 """
 
 log = Dict(format='%(asctime)s %(levelname)s [%(funcName)s]: %(message)s',
@@ -17,7 +17,8 @@ import importlib
 #import inspect
 #import os
 from datetime import datetime
-from typing import Any, Dict as Dict_, Iterable, List, TYPE_CHECKING, Union
+from typing import (Any, Callable, Dict as Dict_, Iterable, List, TYPE_CHECKING,
+                    Union)
 
 import pandas as pd
 
@@ -142,6 +143,13 @@ class QDesign():
 
         self._qnet = QNet()
 
+        # Design rule checker used by check(). Created on first use.
+        self._design_check = None
+
+        # Called when components change, see add_change_callback.
+        # Not saved with the design.
+        self._change_callbacks = []
+
         # Dict used to populate the columns of QGeometry table i.e. path,
         # junction, poly etc.
         self.renderer_defaults_by_table = Dict()
@@ -439,6 +447,46 @@ class QDesign():
         self._components.clear()
 
         self._qgeometry.clear_all_tables()
+        self._notify_change('reset')
+
+    def add_change_callback(self, callback: Callable):
+        """Call callback(event, component_id) after each change of the
+        components of the design.  Used by the GUI to update its views
+        without polling the design.
+
+        The events are 'add', 'delete', 'rename' and 'rebuild', for the
+        component component_id, and 'reset' when all the components were
+        deleted, with component_id None.  The callback is called in the
+        thread which changed the design.
+
+        Args:
+            callback (Callable): Called as callback(event, component_id).
+        """
+        if getattr(self, '_change_callbacks', None) is None:
+            # Designs saved before the callbacks existed.
+            self._change_callbacks = []
+        if callback not in self._change_callbacks:
+            self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback: Callable):
+        """Stop calling a callback given to add_change_callback.
+
+        Args:
+            callback (Callable): The callback.
+        """
+        callbacks = getattr(self, '_change_callbacks', None) or []
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _notify_change(self, event: str, component_id: int = None):
+        """Call the callbacks given to add_change_callback.
+
+        Args:
+            event (str): 'add', 'delete', 'rename', 'rebuild' or 'reset'.
+            component_id (int): Id of the component.  Defaults to None.
+        """
+        for callback in list(getattr(self, '_change_callbacks', None) or []):
+            callback(event, component_id)
 
     def _get_new_qcomponent_id(self):
         """Give new id that QComponent can use.
@@ -463,10 +511,52 @@ class QDesign():
 
         return self._qcomponent_latest_name_id[prefix]
 
-    def rebuild(self):  # remake_all_components
-        """Remakes all components with their current parameters."""
-        for _, obj in self._components.items():  # pylint: disable=unused-variable
+    def rebuild(self, progress: Callable = None):  # remake_all_components
+        """Remakes all components with their current parameters.
+
+        Args:
+            progress (Callable): Called as progress(done, total, name) before
+                each component is rebuilt, and once at the end.  Raising an
+                exception in it stops the rebuild.  Used by the GUI to show
+                progress and to cancel a rebuild.  Defaults to None.
+        """
+        total = len(self._components)
+        for num, obj in enumerate(list(self._components.values())):
+            if progress:
+                progress(num, total, obj.name)
             obj.rebuild()
+        if progress:
+            progress(total, total, '')
+
+    def check(self,
+              incremental: bool = False,
+              options: dict = None) -> pd.DataFrame:
+        """Run the design rule checks (overlap, spacing, width, keep-out) on
+        the design.
+
+        The same QDesignCheck is used for every call, so with incremental=True
+        only the components which changed since the previous call are
+        checked again. Meant to be called after each rebuild, for example by
+        the GUI.
+
+        Args:
+            incremental (bool): Only check the components which changed since
+                the last check.  Defaults to False.
+            options (dict): Rules to update the options of the checker with.
+                See QDesignCheck.default_options.  Defaults to None.
+
+        Returns:
+            pd.DataFrame: One row per violation.
+        """
+        # pylint: disable=import-outside-toplevel
+        from qiskit_metal.qlibrary.core.design_check import QDesignCheck
+
+        # Designs saved before check() existed do not have the attribute.
+        if getattr(self, '_design_check', None) is None:
+            self._design_check = QDesignCheck(self)
+        if options:
+            self._design_check.options.update(options)
+        return self._design_check.run(incremental=incremental)
 
     def rename_component(self, component_id: int, new_component_name: str):
         """Rename component.  The component_id is expected.  However, if user
@@ -525,6 +615,7 @@ class QDesign():
             # do rename
             # pylint: disable=protected-access
             self._components[component_id]._name = new_component_name
+            self._notify_change('rename', a_component_id)
 
             return True
         logger.warning(
@@ -623,6 +714,7 @@ class QDesign():
 
             # remove from design dict of components
             self._components.pop(component_id, None)
+            self._notify_change('delete', component_id)
         else:
             # if not in components dict
             logger.warning(
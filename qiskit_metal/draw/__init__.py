@@ -23,10 +23,28 @@ from shapely.ops import unary_union
 
 from . import basic
 from . import utility
-from . import mpl
 
 # Useful functions
 from .utility import get_poly_pts, Vector
 from .basic import rectangle, is_rectangle, flip_merge, rotate, translate, scale, buffer,\
-    rotate_position, _iter_func_geom_, union, subtract
-from .mpl import render, figure_spawn
+    rotate_position, _iter_func_geom_, union, subtract, rotate_matrix,\
+    translate_matrix, scale_matrix, affine, compose
+
+
+def __getattr__(name: str):
+    """Import mpl, which imports matplotlib.pyplot, on first access.
+
+    Args:
+        name (str): Name of the attribute.
+
+    Returns:
+        The module or function.
+
+    Raises:
+        AttributeError: If name is not part of the module.
+    """
+    if name in ('mpl', 'render', 'figure_spawn'):
+        # pylint: disable=import-outside-toplevel
+        from . import mpl
+        return mpl if name == 'mpl' else getattr(mpl, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
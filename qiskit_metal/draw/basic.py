@@ -39,7 +39,8 @@ from .utility import get_poly_pts
 
 __all__ = [
     'rectangle', 'is_rectangle', 'flip_merge', 'rotate', 'rotate_position',
-    '_iter_func_geom_', 'translate', 'scale', 'buffer', 'union', 'subtract'
+    '_iter_func_geom_', 'translate', 'scale', 'buffer', 'union', 'subtract',
+    'rotate_matrix', 'translate_matrix', 'scale_matrix', 'affine', 'compose'
 ]
 
 
@@ -270,6 +271,175 @@ def _iter_func_geom_(func, objs, *args, overwrite=False, **kwargs):
         return objs
 
 
+def _collect_geom_(objs, geoms: list) -> bool:
+    """Collect the shapely geometries held by objs into geoms, in the same
+    order that `_iter_func_geom_` visits them.
+
+    Args:
+        objs (Dict, List, Tuple or BaseGeometry): Set of objects
+        geoms (list): List to which the geometries are appended
+
+    Returns:
+        bool: False if objs holds anything other than (nested) geometries,
+        such as a QComponent, which the batch path does not handle.
+    """
+    if isinstance(objs, Mapping):
+        return all(_collect_geom_(val, geoms) for val in objs.values())
+    elif isinstance(objs, Iterable):
+        if isinstance(objs, MultiPolygon):
+            objs = objs.geoms
+        return all(_collect_geom_(val, geoms) for val in objs)
+    elif isinstance(objs, BaseGeometry):
+        geoms.append(objs)
+        return True
+    return False
+
+
+def rotate_matrix(angle: float,
+                  origin=(0, 0),
+                  use_radians: bool = False) -> np.ndarray:
+    r"""3x3 affine matrix of a 2D rotation about a fixed origin.
+
+    Uses the same arithmetic as shapely.affinity.rotate, so applying it
+    gives the same coordinates.
+
+    Args:
+        angle (float): Rotation angle
+        origin (tuple or Point): Origin point.  Defaults to (0, 0).
+        use_radians (bool): True to use radians.  Defaults to False.
+
+    Returns:
+        np.ndarray: The matrix
+        ::
+
+            / cos(r) -sin(r) xoff \
+            | sin(r)  cos(r) yoff |
+            \   0       0      1  /
+    """
+    if not use_radians:
+        angle = angle * np.pi / 180.0
+    cosp = np.cos(angle)
+    sinp = np.sin(angle)
+    if abs(cosp) < 2.5e-16:
+        cosp = 0.0
+    if abs(sinp) < 2.5e-16:
+        sinp = 0.0
+    x0, y0 = _origin_xy(origin)
+    return np.array([[cosp, -sinp, x0 - x0 * cosp + y0 * sinp],
+                     [sinp, cosp, y0 - x0 * sinp - y0 * cosp], [0., 0., 1.]])
+
+
+def translate_matrix(xoff: float = 0.0, yoff: float = 0.0) -> np.ndarray:
+    """3x3 affine matrix of a 2D translation.
+
+    Args:
+        xoff (float): x-direction offset.  Defaults to 0.0.
+        yoff (float): y-direction offset.  Defaults to 0.0.
+
+    Returns:
+        np.ndarray: The matrix
+    """
+    return np.array([[1., 0., xoff], [0., 1., yoff], [0., 0., 1.]])
+
+
+def scale_matrix(xfact: float = 1.0,
+                 yfact: float = 1.0,
+                 origin=(0, 0)) -> np.ndarray:
+    """3x3 affine matrix of a 2D scaling about a fixed origin.
+
+    Args:
+        xfact (float): x-direction scale factor.  Defaults to 1.0.
+        yfact (float): y-direction scale factor.  Defaults to 1.0.
+        origin (tuple or Point): Origin point.  Defaults to (0, 0).
+
+    Returns:
+        np.ndarray: The matrix
+    """
+    x0, y0 = _origin_xy(origin)
+    return np.array([[xfact, 0., x0 - x0 * xfact], [0., yfact, y0 - y0 * yfact],
+                     [0., 0., 1.]])
+
+
+def _origin_xy(origin):
+    """x, y of an origin given as a Point or a coordinate tuple."""
+    if isinstance(origin, Point):
+        return origin.x, origin.y
+    return float(origin[0]), float(origin[1])
+
+
+def _is_fixed_origin(origin) -> bool:
+    """True if the origin does not depend on the geometry ('center' or
+    'centroid'), so one matrix applies to every geometry."""
+    return not isinstance(origin, str)
+
+
+def affine(qgeometry, matrix: np.ndarray, overwrite=False):
+    """Apply a 2D affine matrix to all the geometry in qgeometry in one pass.
+
+    The nested dicts and lists are flattened into one shapely geometry array,
+    the coordinates of all of them are transformed with a single
+    `shapely.transform` call, and the structure is then rebuilt. Anything the
+    batch path cannot handle (components, 3D geometry) falls back to
+    transforming each geometry with shapely.affinity.affine_transform.
+
+    Args:
+        qgeometry (Dict, List, Tuple or BaseGeometry): Set of objects
+        matrix (np.ndarray): 3x3 (or 2x3) affine matrix, as made by
+            `rotate_matrix`, `translate_matrix`, `scale_matrix`
+        overwrite (bool): True to overwrite.  Defaults to False.
+
+    Returns:
+        geometry: Transformed geometry, same structure as the input
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    (a, b, xoff), (d, e, yoff) = matrix[0], matrix[1]
+
+    geoms = []
+    if not _collect_geom_(qgeometry, geoms) or shapely.has_z(geoms).any():
+        return _iter_func_geom_(shapely.affinity.affine_transform,
+                                qgeometry, [a, b, d, e, xoff, yoff],
+                                overwrite=overwrite)
+    if not geoms:
+        return _iter_func_geom_(lambda obj: obj, qgeometry, overwrite=overwrite)
+
+    def transform_coords(coords):
+        # Elementwise, like shapely.affinity.affine_transform, rather than a
+        # matrix product, so the results are the same to the last bit.
+        x, y = coords[:, 0], coords[:, 1]
+        return np.column_stack((a * x + b * y + xoff, d * x + e * y + yoff))
+
+    transformed = iter(shapely.transform(geoms, transform_coords))
+    return _iter_func_geom_(lambda obj: next(transformed),
+                            qgeometry,
+                            overwrite=overwrite)
+
+
+def compose(qgeometry, *matrices, overwrite=False):
+    """Chain several affine matrices and apply them to qgeometry in one pass.
+
+    The matrices are applied in the order given. Typical use at the end of a
+    QComponent make():
+    ::
+
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
+
+    which is equivalent to a `rotate` about (0, 0) followed by a `translate`.
+
+    Args:
+        qgeometry (Dict, List, Tuple or BaseGeometry): Set of objects
+        matrices (np.ndarray): 3x3 affine matrices
+        overwrite (bool): True to overwrite.  Defaults to False.
+
+    Returns:
+        geometry: Transformed geometry, same structure as the input
+    """
+    matrix = np.identity(3)
+    for mat in matrices:
+        matrix = np.asarray(mat, dtype=float) @ matrix
+    return affine(qgeometry, matrix, overwrite=overwrite)
+
+
 def rotate(qgeometry,
            angle,
            origin='center',
@@ -310,6 +480,10 @@ def rotate(qgeometry,
         xoff = x0 - x0 * cos(r) + y0 * sin(r)
         yoff = y0 - x0 * sin(r) - y0 * cos(r)
     """
+    if _is_fixed_origin(origin):
+        return affine(qgeometry,
+                      rotate_matrix(angle, origin, use_radians),
+                      overwrite=overwrite)
     return _iter_func_geom_(shapely.affinity.rotate,
                             qgeometry,
                             angle,
@@ -338,6 +512,10 @@ def translate(qgeometry, xoff=0.0, yoff=0.0, zoff=0.0, overwrite=False):
         | 0  0  1 zoff |
         \ 0  0  0   1  /
     '''
+    if zoff == 0:
+        return affine(qgeometry,
+                      translate_matrix(xoff, yoff),
+                      overwrite=overwrite)
     return _iter_func_geom_(shapely.affinity.translate,
                             qgeometry,
                             xoff=xoff,
@@ -387,6 +565,10 @@ def scale(qgeometry,
         yoff = y0 - y0 * yfact
         zoff = z0 - z0 * zfact
     '''
+    if zfact == 1 and _is_fixed_origin(origin):
+        return affine(qgeometry,
+                      scale_matrix(xfact, yfact, origin),
+                      overwrite=overwrite)
     return _iter_func_geom_(shapely.affinity.scale,
                             qgeometry,
                             xfact=xfact,
@@ -413,15 +595,12 @@ def rotate_position(qgeometry,
         geometry: Rotate dand translated, same as input
     """
 
-    def rotate_position_shapely(sobj):
-        pos1 = list(shapely.affinity.rotate(Point(pos), angle).coords)[0]
-        sobj = shapely.affinity.rotate(sobj, angle,
-                                       pos_rot)  # rotate about pos_rot
-        return shapely.affinity.translate(sobj, *pos1)  # move to position
-
-    return _iter_func_geom_(rotate_position_shapely,
-                            qgeometry,
-                            overwrite=overwrite)
+    pos1 = list(shapely.affinity.rotate(Point(pos), angle).coords)[0]
+    # rotate about pos_rot, then move to position
+    return compose(qgeometry,
+                   rotate_matrix(angle, pos_rot),
+                   translate_matrix(*pos1[:2]),
+                   overwrite=overwrite)
 
 
 def buffer(qgeometry,
@@ -230,22 +230,34 @@ def remove_colinear_pts(points):
     Returns:
         ndarray: A copy of the input array without colinear points
     """
-    remove_idx = []
-    for i in range(2, len(points)):
-        v1 = array(points[i - 2]) - array(points[i - 1])
-        v2 = array(points[i - 1]) - array(points[i - 0])
-        if Vector.are_same(v1, v2):
-            remove_idx += [i - 1]
-        elif Vector.angle_between(v1, v2) == 0:
-            remove_idx += [i - 1]
-    points = np.delete(points, remove_idx, axis=0)
+    points = np.asarray(points)
+    eps_tol = 100 * np.finfo(float).eps
+
+    if len(points) > 2:
+        # The same tests as Vector.are_same and Vector.angle_between, for
+        # every three consecutive points at once.
+        v1 = np.asarray(points[:-2] - points[1:-1], dtype=float)
+        v2 = np.asarray(points[1:-1] - points[2:], dtype=float)
+        same = np.sqrt(((v1 - v2)**2).sum(axis=1)) < eps_tol
+
+        unit = []
+        for vec in (v1, v2):
+            vec = np.where(np.abs(vec) <= eps_tol, 0., vec)
+            _norm = np.sqrt((vec**2).sum(axis=1))[:, np.newaxis]
+            unit.append(np.divide(vec, _norm, out=vec.copy(), where=_norm != 0))
+        angle = np.arccos(np.clip((unit[0] * unit[1]).sum(axis=1), -1.0, 1.0))
+
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:-1] = ~(same | (angle == 0))
+        points = points[keep]
+    else:
+        points = np.array(points)
 
     # remove  consecutive duplicates
-    remove_idx = []
-    for i in range(1, len(points)):
-        if norm(points[i] - points[i - 1]) == 0:
-            remove_idx += [i]
-    points = np.delete(points, remove_idx, axis=0)
+    if len(points) > 1:
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.sqrt(((points[1:] - points[:-1])**2).sum(axis=1)) != 0
+        points = points[keep]
 
     return points
 
@@ -36,7 +36,6 @@ import qiskit_metal.qlibrary as qlibrary
 from qiskit_metal import config
 from qiskit_metal.draw import BaseGeometry
 from qiskit_metal.toolbox_python.attr_dict import Dict
-from qiskit_metal.toolbox_python.display import format_dict_ala_z
 from qiskit_metal.qlibrary.core._parsed_dynamic_attrs import ParsedDynamicAttributes_Component
 
 if not config.is_building_docs():
@@ -433,6 +432,7 @@ class QComponent():
         # pylint: disable=protected-access
         self.design._components[self.id] = self
         self.design.name_to_id[self.name] = self._id
+        self.design._notify_change('add', self._id)
 
     @classmethod
     def get_template_options(cls,
@@ -723,6 +723,10 @@ name='{strname}'{other_args}
             )
             raise error
 
+        finally:
+            # pylint: disable=protected-access
+            self.design._notify_change('rebuild', self._id)
+
     def delete(self):
         """Delete the QComponent.
 
@@ -1203,6 +1207,9 @@ name='{strname}'{other_args}
         # id = {hex(id(self))}
         # options = pprint.pformat(self.options)
 
+        # display imports IPython, which is slow to import
+        # pylint: disable=import-outside-toplevel
+        from qiskit_metal.toolbox_python.display import format_dict_ala_z
         options = format_dict_ala_z(self.options)
         text = f"{b}name:    {b1}{self.name}{e}\n"\
             f"{b}class:   {b1}{self.__class__.__name__:<22s}{e}\n"\
@@ -1,86 +1,813 @@
-### BASIC PROGRAM THAT LOOKS FOR OVERLAP BETWEEN QCOMPONENTS
-from numpy import size
-import geopandas as gpd
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Design rule checks (DRC) for the qgeometry of a QDesign.
+
+The checks work on the qgeometry tables of the design.  Paths and junctions
+are buffered by half their width, so that every row is compared as the
+polygon which will be fabricated.  Candidate pairs of geometries are found
+with one bulk ``shapely.STRtree`` query per chip and layer, and the exact
+geometric tests are evaluated on the candidate pairs with vectorized shapely
+functions.  This keeps the checks fast for chips with ~100k shapes.
+
+For full-chip sign-off checks, options.tile_size splits every chip into
+tiles, which overlap by the largest rule distance and are checked in worker
+processes.  Violations found in more than one tile are reported once.
+
+Rules:
+    * overlap: Metal (subtract=False) geometries of two different components
+      on the same chip and layer overlap each other.
+    * min_spacing: Two metal geometries on the same chip and layer are
+      closer than min_spacing, without touching.
+    * min_width: A metal geometry has a part which is narrower than min_width.
+    * keepout: A (non-helper) geometry intersects a keep-out region
+      registered with :meth:`QDesignCheck.add_keepout`.
+
+Example use:
+
+    .. code-block:: python
+
+        from qiskit_metal.qlibrary.core.design_check import QDesignCheck
+
+        drc = QDesignCheck(design, options=dict(min_spacing='5um',
+                                                min_width='2um'))
+        violations = drc.run()
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+import numpy as np
 import pandas as pd
+import shapely
+
+from ... import Dict
+from ...toolbox_metal.parsing import is_true
+
+if TYPE_CHECKING:
+    from ...designs import QDesign
+
+__all__ = ['QDesignCheck', 'VIOLATION_COLUMNS']
+
+VIOLATION_COLUMNS = [
+    'rule', 'chip', 'layer', 'component_1', 'name_1', 'component_2', 'name_2',
+    'value', 'limit', 'x', 'y', 'location'
+]
+"""Columns of the DataFrame of violations returned by QDesignCheck."""
+
+# qgeometry tables which are compared by the checks.
+_DRC_TABLES = ('poly', 'path', 'junction')
+
+
+def empty_violations() -> pd.DataFrame:
+    """Return an empty table of violations.
+
+    Returns:
+        pd.DataFrame: Table with the columns in VIOLATION_COLUMNS.
+    """
+    return pd.DataFrame(columns=VIOLATION_COLUMNS)
+
+
+def _violations(rule: str, frame: pd.DataFrame, idx_1: np.ndarray,
+                idx_2: Union[np.ndarray, None], value: np.ndarray, limit: float,
+                location: np.ndarray) -> pd.DataFrame:
+    """Assemble a table of violations from positional indices into frame.
+
+    Args:
+        rule (str): Name of the rule.
+        frame (pd.DataFrame): Geometry frame which was checked.
+        idx_1 (np.ndarray): Position of the first geometry of each violation.
+        idx_2 (Union[np.ndarray, None]): Position of the second geometry
+            of each violation.  None for single geometry rules.
+        value (np.ndarray): Measured value of each violation.
+        limit (float): Value of the rule.
+        location (np.ndarray): Shapely geometry locating each violation.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    if len(idx_1) == 0:
+        return empty_violations()
+    first = frame.iloc[idx_1]
+    centers = shapely.centroid(location)
+    table = pd.DataFrame(
+        dict(rule=rule,
+             chip=first['chip'].values,
+             layer=first['layer'].values,
+             component_1=first['component_name'].values,
+             name_1=first['name'].values,
+             component_2=None,
+             name_2=None,
+             value=value,
+             limit=limit,
+             x=shapely.get_x(centers),
+             y=shapely.get_y(centers),
+             location=location))
+    if idx_2 is not None:
+        second = frame.iloc[idx_2]
+        table['component_2'] = second['component_name'].values
+        table['name_2'] = second['name'].values
+    return table
+
+
+def _candidate_pairs(geoms: np.ndarray,
+                     predicate: str = 'intersects',
+                     distance: float = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the unique pairs (i < j) of geometries which satisfy predicate,
+    using a single bulk STRtree query.
+
+    Args:
+        geoms (np.ndarray): Array of shapely geometries.
+        predicate (str): STRtree predicate.  Defaults to 'intersects'.
+        distance (float): Distance for the 'dwithin' predicate.
+            Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Positions of first and second geometry
+        of each pair.
+    """
+    tree = shapely.STRtree(geoms)
+    idx_1, idx_2 = tree.query(geoms, predicate=predicate, distance=distance)
+    keep = idx_1 < idx_2
+    return idx_1[keep], idx_2[keep]
+
+
+def check_overlap(frame: pd.DataFrame, area_tol: float) -> pd.DataFrame:
+    """Metal geometries of different components which overlap.
+
+    Args:
+        frame (pd.DataFrame): Geometry frame of a single chip and layer.
+        area_tol (float): Overlaps with a smaller area are ignored.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    geoms = frame['geometry'].values
+    idx_1, idx_2 = _candidate_pairs(geoms)
+    comps = frame['component'].values
+    keep = comps[idx_1] != comps[idx_2]
+    idx_1, idx_2 = idx_1[keep], idx_2[keep]
+
+    overlap = shapely.intersection(geoms[idx_1], geoms[idx_2])
+    area = shapely.area(overlap)
+    keep = area > area_tol
+    return _violations('overlap', frame, idx_1[keep], idx_2[keep], area[keep],
+                       0., overlap[keep])
+
+
+def check_spacing(frame: pd.DataFrame, min_spacing: float,
+                  tol: float) -> pd.DataFrame:
+    """Metal geometries which are closer than min_spacing but do not touch.
+
+    Args:
+        frame (pd.DataFrame): Geometry frame of a single chip and layer.
+        min_spacing (float): Minimum allowed distance between geometries.
+        tol (float): Numerical tolerance of distances.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    geoms = frame['geometry'].values
+    idx_1, idx_2 = _candidate_pairs(geoms,
+                                    predicate='dwithin',
+                                    distance=min_spacing - tol)
+    distance = shapely.distance(geoms[idx_1], geoms[idx_2])
+    keep = distance > tol
+    idx_1, idx_2, distance = idx_1[keep], idx_2[keep], distance[keep]
+    gaps = shapely.shortest_line(geoms[idx_1], geoms[idx_2])
+    return _violations('min_spacing', frame, idx_1, idx_2, distance,
+                       min_spacing, gaps)
+
+
+def check_width(frame: pd.DataFrame, min_width: float,
+                area_tol: float) -> pd.DataFrame:
+    """Metal geometries which have a part narrower than min_width.
+
+    Paths and junctions are tested against their width column.  Polygons are
+    tested with a morphological opening (erode then dilate by min_width/2);
+    the part of the polygon which does not survive the opening is too narrow.
+
+    Args:
+        frame (pd.DataFrame): Geometry frame of a single chip and layer.
+        min_width (float): Minimum allowed width.
+        area_tol (float): Residuals with a smaller area are ignored.
+
+    Returns:
+        pd.DataFrame: Table of violations. The value is the width for paths
+        and junctions, and the area of the too narrow part for polygons.
+    """
+    geoms = frame['geometry'].values
+    widths = frame['width'].values
+    is_line = ~np.isnan(widths)
+
+    # Paths and junctions
+    idx_line = np.flatnonzero(is_line & (widths > 0) & (widths < min_width))
+    lines = _violations('min_width', frame, idx_line, None, widths[idx_line],
+                        min_width, geoms[idx_line])
+
+    # Polygons
+    idx_poly = np.flatnonzero(~is_line)
+    polys = geoms[idx_poly]
+    opened = shapely.buffer(shapely.buffer(polys,
+                                           -min_width / 2.,
+                                           join_style='mitre'),
+                            min_width / 2.,
+                            join_style='mitre')
+    residual = shapely.difference(polys, opened)
+    area = shapely.area(residual)
+    keep = area > area_tol
+    polys = _violations('min_width', frame, idx_poly[keep], None, area[keep],
+                        min_width, residual[keep])
+
+    return pd.concat([lines, polys], ignore_index=True)
+
+
+def check_keepout(frame: pd.DataFrame, keepouts: pd.DataFrame,
+                  area_tol: float) -> pd.DataFrame:
+    """Geometries which intersect a keep-out region.
+
+    Args:
+        frame (pd.DataFrame): Geometry frame of a single chip and layer.
+        keepouts (pd.DataFrame): Keep-out regions that apply to the frame.
+        area_tol (float): Intersections with a smaller area are ignored.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    tree = shapely.STRtree(frame['geometry'].values)
+    idx_keepout, idx_geom = tree.query(keepouts['geometry'].values,
+                                       predicate='intersects')
+    geoms = frame['geometry'].values[idx_geom]
+    inside = shapely.intersection(geoms,
+                                  keepouts['geometry'].values[idx_keepout])
+    area = shapely.area(inside)
+    # Zero width lines have no area, but are still inside the keep-out.
+    is_line = shapely.area(geoms) == 0
+    keep = (area > area_tol) | (is_line & (shapely.length(inside) > 0))
+    table = _violations('keepout', frame, idx_geom[keep], None, area[keep], 0.,
+                        inside[keep])
+    table['component_2'] = None
+    table['name_2'] = keepouts['name'].values[idx_keepout[keep]]
+    return table
+
+
+def run_rules(frame: pd.DataFrame,
+              rules: dict,
+              keepouts: pd.DataFrame = None,
+              tol: float = 1e-9) -> pd.DataFrame:
+    """Run all the enabled rules on a geometry frame.
+
+    This is the engine used by QDesignCheck.  It only needs the geometry
+    frame and plain values, so it can be called on any subset of a design.
+
+    Args:
+        frame (pd.DataFrame): Geometry frame, see
+            QDesignCheck.get_geometry_frame.
+        rules (dict): Parsed rules; keys are overlap (bool), min_spacing and
+            min_width (float, 0 disables) and layer_rules (dict of layer to
+            dict of min_spacing and/or min_width).
+        keepouts (pd.DataFrame): Table of keep-out regions with columns
+            name, chip, layer and geometry.  Defaults to None.
+        tol (float): Numerical tolerance. Distances and areas smaller than
+            tol are ignored.  Defaults to 1e-9.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    results = [empty_violations()]
+    layer_rules = rules.get('layer_rules', {}) or {}
+
+    for (chip, layer), group in frame.groupby(['chip', 'layer'], sort=True):
+        this_rules = {**rules, **layer_rules.get(layer, {})}
+        metal = group[~group['subtract'].values]
+
+        if metal.shape[0] > 0:
+            if this_rules.get('overlap'):
+                results.append(check_overlap(metal, tol))
+
+            min_spacing = this_rules.get('min_spacing', 0)
+            if min_spacing > 0:
+                results.append(check_spacing(metal, min_spacing, tol))
+
+            min_width = this_rules.get('min_width', 0)
+            if min_width > 0:
+                results.append(check_width(metal, min_width, tol))
+
+        if keepouts is not None and keepouts.shape[0] > 0:
+            mask = (keepouts['chip'] == chip) & (keepouts['layer'].isna() |
+                                                 (keepouts['layer'] == layer))
+            if mask.any():
+                results.append(check_keepout(group, keepouts[mask], tol))
+
+    results = [table for table in results if table.shape[0] > 0]
+    if not results:
+        return empty_violations()
+    return pd.concat(results, ignore_index=True)
+
+
+def rule_halo(rules: dict) -> float:
+    """Largest distance over which a rule relates two geometries.
+
+    Args:
+        rules (dict): Parsed rules, see run_rules.
+
+    Returns:
+        float: Halo which tiles need to overlap by.
+    """
+    distances = [rules.get('min_spacing', 0), rules.get('min_width', 0)]
+    for values in (rules.get('layer_rules', {}) or {}).values():
+        distances += [values.get('min_spacing', 0), values.get('min_width', 0)]
+    return max(distances)
+
+
+def make_tiles(bounds: Tuple[float, float, float, float], tile_size: float,
+               halo: float) -> np.ndarray:
+    """Split a bounding box into a grid of square tiles, which overlap their
+    neighbours by halo.
+
+    Args:
+        bounds (Tuple[float, float, float, float]): minx, miny, maxx, maxy.
+        tile_size (float): Edge length of a tile, without the halo.
+        halo (float): Distance each tile is grown by on every side.
+
+    Returns:
+        np.ndarray: Array of shapely boxes, one per tile.
+    """
+    minx, miny, maxx, maxy = bounds
+    num_x = max(int(np.ceil((maxx - minx) / tile_size)), 1)
+    num_y = max(int(np.ceil((maxy - miny) / tile_size)), 1)
+    x_0, y_0 = np.meshgrid(minx + tile_size * np.arange(num_x),
+                           miny + tile_size * np.arange(num_y))
+    x_0, y_0 = x_0.ravel(), y_0.ravel()
+    return shapely.box(x_0 - halo, y_0 - halo, x_0 + tile_size + halo,
+                       y_0 + tile_size + halo)
+
+
+def _run_rules_on_tile(args: tuple) -> pd.DataFrame:
+    """Worker of run_rules_tiled. Module level, so that it can be pickled.
+
+    Args:
+        args (tuple): Arguments of run_rules.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    return run_rules(*args)
+
+
+def run_rules_tiled(frame: pd.DataFrame,
+                    rules: dict,
+                    keepouts: pd.DataFrame = None,
+                    tol: float = 1e-9,
+                    chip_bounds: dict = None,
+                    tile_size: float = 1.,
+                    workers: int = None) -> pd.DataFrame:
+    """Run run_rules over a grid of tiles of every chip, in worker processes.
+
+    Each tile holds every geometry that intersects the tile grown by the rule
+    halo, so that every violation is found in at least one tile.  Geometries
+    are not clipped, so a violation found in several tiles is identical in
+    each of them, and the duplicates are dropped.
+
+    Args:
+        frame (pd.DataFrame): Geometry frame, see
+            QDesignCheck.get_geometry_frame.
+        rules (dict): Parsed rules, see run_rules.
+        keepouts (pd.DataFrame): Table of keep-out regions.  Defaults to None.
+        tol (float): Numerical tolerance.  Defaults to 1e-9.
+        chip_bounds (dict): Key is chip name, value is the (minx, miny, maxx,
+            maxy) box to tile.  The box is grown to include all geometry of
+            the chip.  Defaults to None, which uses the geometry bounds.
+        tile_size (float): Edge length of a tile.  Defaults to 1.
+        workers (int): Number of worker processes.  Defaults to None, which
+            uses all cores. 1 runs the tiles in this process.
+
+    Returns:
+        pd.DataFrame: Table of violations.
+    """
+    chip_bounds = chip_bounds or {}
+    halo = rule_halo(rules)
+
+    jobs = []
+    for chip, group in frame.groupby('chip', sort=True):
+        geoms = group['geometry'].values
+        bounds = shapely.total_bounds(geoms)
+        if chip in chip_bounds and chip_bounds[chip]:
+            box = chip_bounds[chip]
+            bounds = (min(bounds[0], box[0]), min(bounds[1], box[1]),
+                      max(bounds[2], box[2]), max(bounds[3], box[3]))
+
+        tiles = make_tiles(bounds, tile_size, halo)
+        idx_tile, idx_geom = shapely.STRtree(geoms).query(tiles)
+        order = np.argsort(idx_tile, kind='stable')
+        idx_tile, idx_geom = idx_tile[order], idx_geom[order]
+        splits = np.flatnonzero(np.diff(idx_tile)) + 1
+
+        chip_keepouts = None
+        if keepouts is not None:
+            chip_keepouts = keepouts[keepouts['chip'] == chip]
+        for positions in np.split(idx_geom, splits):
+            if len(positions) > 0:
+                # Keep the order of the frame, so pairs are reported the same
+                # way in every tile.
+                tile = group.iloc[np.sort(positions)]
+                jobs.append((tile, rules, chip_keepouts, tol))
+
+    if workers == 1 or len(jobs) < 2:
+        results = [_run_rules_on_tile(job) for job in jobs]
+    else:
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(len(jobs) // (4 * workers), 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_run_rules_on_tile, jobs, chunksize=chunksize))
+
+    results = [table for table in results if table.shape[0] > 0]
+    if not results:
+        return empty_violations()
+    violations = pd.concat(results, ignore_index=True)
+    violations = violations.drop_duplicates(subset=[
+        'rule', 'chip', 'layer', 'component_1', 'name_1', 'component_2',
+        'name_2', 'x', 'y'
+    ])
+    return violations.reset_index(drop=True)
+
+
+def component_hashes(tables: dict, names: dict = None) -> dict:
+    """Hash the content of every component in the qgeometry tables.
+
+    The hash covers every column of every row of the component, with the
+    geometry as WKB, so any edit of the component changes its hash.
+
+    Args:
+        tables (dict): The qgeometry tables, key is the table name.
+        names (dict): Key is component id, value is the component name,
+            which is added to the hash.  Defaults to None.
+
+    Returns:
+        dict: Key is component id, value is the hash.
+    """
+    hashes = dict()
+    for table_name in _DRC_TABLES:
+        table = tables.get(table_name)
+        if table is None or table.shape[0] == 0:
+            continue
+        keys = table.drop(columns='geometry').astype(str)
+        keys['geometry'] = shapely.to_wkb(table['geometry'].values)
+        row_hashes = pd.Series(
+            pd.util.hash_pandas_object(keys, index=False).values)
+        for comp_id, values in row_hashes.groupby(table['component'].values,
+                                                  sort=False):
+            hashes[comp_id] = hash(
+                (hashes.get(comp_id), table_name, tuple(values)))
+    for comp_id, name in (names or {}).items():
+        hashes[comp_id] = hash((hashes.get(comp_id), name))
+    return hashes
 
 
 class QDesignCheck():
-    """QDesign_Check contains various design checks, such as
-    testing designs in qiskit metal for unintended overlap
-    between components and/or connections between components.
+    """QDesignCheck runs design rule checks on a QDesign, such as testing for
+    unintended overlap between components, minimum spacing and width, and
+    keep-out regions.
+
+    Default Options:
+        * overlap: 'True' -- Check for overlapping metal of different
+          components.
+        * min_spacing: '0um' -- Minimum spacing between metal. 0 disables.
+        * min_width: '0um' -- Minimum width of metal. 0 disables.
+        * layer_rules: Dict() -- Per layer overrides. Key is the layer
+          number, value is a Dict with min_spacing and/or min_width.
+        * tile_size: '0mm' -- Edge length of the tiles for full-chip checks.
+          0 checks each chip in one piece, in this process.
+        * workers: '0' -- Number of worker processes checking the tiles.
+          0 uses all cores.
+
+    Note:
+        Paths are buffered with flat caps and mitred corners, without the
+        fillet.  This is conservative for the spacing check at corners.
     """
 
-    def __init__(self, design: 'QDesign'):
+    default_options = Dict(overlap='True',
+                           min_spacing='0um',
+                           min_width='0um',
+                           layer_rules=Dict(),
+                           tile_size='0mm',
+                           workers='0')
+    """Default options"""
+
+    def __init__(self, design: 'QDesign', options: dict = None):
+        """
+        Args:
+            design (QDesign): The design to check.
+            options (dict): Rules, which overwrite default_options.
+                Defaults to None.
+        """
         self.design = design
+        self.options = deepcopy(self.default_options)
+        if options:
+            self.options.update(options)
+
+        # Keep-out regions, added by add_keepout
+        self._keepouts = []
+
+        # Results of the last run, used by run(incremental=True)
+        self._last = None
 
     def update_design(self, design: 'QDesign'):
+        """Change the design to check.
+
+        Args:
+            design (QDesign): The new design.
+        """
         self.design = design
 
-    def overlap_tester(self):
-        design = self
-        """This particular function tests for overlap amongst qcomponents
-        and CPWs. It will catch qubit/qubit overlap, qubit, CPW overlap
-        and CPW/CPW overlap.
+    @property
+    def logger(self):
+        """Return the logger of the design."""
+        return self.design.logger
+
+    def add_keepout(self,
+                    geometry: shapely.geometry.base.BaseGeometry,
+                    chip: str = 'main',
+                    layer: int = None,
+                    name: str = None):
+        """Add a region in which no geometry may be placed.
+
+        Args:
+            geometry (BaseGeometry): Region of the keep-out.
+            chip (str): Chip name.  Defaults to 'main'.
+            layer (int): Layer the keep-out applies to.  Defaults to None,
+                which applies the keep-out to all layers of the chip.
+            name (str): Name of the keep-out, reported in the violations.
+                Defaults to None, which auto names it.
         """
+        if name is None:
+            name = f'keepout_{len(self._keepouts)}'
+        self._keepouts.append(
+            dict(name=name,
+                 chip=chip,
+                 layer=np.nan if layer is None else int(layer),
+                 geometry=geometry))
+        self._last = None
+
+    def clear_keepouts(self):
+        """Remove all the keep-out regions."""
+        self._keepouts.clear()
+        self._last = None
 
-        for unique_int in self.design._components:
-            print(" ")
-            print("Component ID:")
-            print(unique_int)
-            comp = unique_int
-
-            # Get the GeoSeries tables separately for polys and paths, then combine.
-            poly = self.design._components[unique_int].qgeometry_table('poly')
-            path = self.design._components[unique_int].qgeometry_table('path')
-            combined = gpd.GeoDataFrame(
-                pd.concat([poly, path], ignore_index=True))
-            combined_geo = combined["geometry"]
-
-            # loop within a loop to calculate distance between components
-            for unique_int in self.design._components:
-
-                main_counter = 0.0
-
-                # don't calculate distance between a component and itself
-                if unique_int == comp:
-                    #print("Don't check for collisions between component and itself.")
-                    pass
-                else:
-                    poly_inner = self.design._components[
-                        unique_int].qgeometry_table('poly')
-                    path_inner = self.design._components[
-                        unique_int].qgeometry_table('path')
-                    combined_inner = gpd.GeoDataFrame(
-                        pd.concat([poly_inner, path_inner], ignore_index=True))
-                    combined_geo_inner = combined_inner["geometry"]
-
-                    collision_counter_outer = 0.0
-
-                    n = int(size(combined_geo_inner))
-                    for i in range(0, n):
-
-                        #print("inner element:", i)
-                        el_inner = combined_geo.crosses(combined_geo_inner[i])
-
-                        m = int(size(el_inner))
-                        collision_counter = 0.0
-                        for j in range(0, m):
-                            if el_inner[j] == 1:
-                                collision_counter = collision_counter + 1.0
-                            else:
-                                pass
-                        if collision_counter > 0.0:
-                            collision_counter_outer = collision_counter_outer + 1.0
-                        else:
-                            pass
-
-                    if collision_counter_outer > 0.0:
-                        main_counter = main_counter + 1.0
-                    else:
-                        pass
-
-                if main_counter > 0.0:
-                    print("Has a collision with the following QComponent:",
-                          unique_int)
-                else:
-                    pass
+    @property
+    def keepouts(self) -> pd.DataFrame:
+        """Table of the keep-out regions."""
+        return pd.DataFrame(self._keepouts,
+                            columns=['name', 'chip', 'layer', 'geometry'])
+
+    def parse_rules(self) -> Dict:
+        """Parse the options into the rules used by run_rules.
+
+        Returns:
+            Dict: Parsed rules.
+        """
+        parsed = self.design.parse_value(self.options)
+        layer_rules = {
+            int(layer): Dict(values)
+            for layer, values in (parsed.layer_rules or {}).items()
+        }
+        return Dict(overlap=is_true(parsed.overlap),
+                    min_spacing=float(parsed.min_spacing),
+                    min_width=float(parsed.min_width),
+                    layer_rules=layer_rules)
+
+    def get_geometry_frame(self,
+                           chips: Union[str, List[str]] = None,
+                           component_ids: list = None) -> pd.DataFrame:
+        """Gather the qgeometry tables into one frame of polygons to check.
+
+        Helper geometries are dropped.  Paths and junctions with a width are
+        buffered into polygons.
+
+        Args:
+            chips (Union[str, List[str]]): Chip name or names. Defaults to
+                None, which uses all chips.
+            component_ids (list): Only use these components.  Defaults to
+                None, which uses all components.
+
+        Returns:
+            pd.DataFrame: Frame with columns component, component_name, name,
+            table, chip, layer, subtract, width and geometry.  Width is NaN
+            for polygons.
+        """
+        if isinstance(chips, str):
+            chips = [chips]
+        mitre_limit = self.design.template_options.geometry.buffer_mitre_limit
+
+        frames = []
+        for table_name in _DRC_TABLES:
+            if table_name not in self.design.qgeometry.tables:
+                continue
+            table = self.design.qgeometry.tables[table_name]
+            mask = ~table['helper'].astype(bool)
+            if chips is not None:
+                mask &= table['chip'].isin(chips)
+            if component_ids is not None:
+                mask &= table['component'].isin(component_ids)
+            table = table[mask]
+
+            geometry = np.asarray(table['geometry'].values, dtype=object)
+            if 'width' in table.columns:
+                width = table['width'].astype(float).fillna(0.).values
+                buffered = shapely.buffer(geometry,
+                                          width / 2.,
+                                          cap_style='flat',
+                                          join_style='mitre',
+                                          mitre_limit=mitre_limit)
+                # Zero width lines are kept as lines
+                geometry = np.where(width > 0, buffered, geometry)
+            else:
+                width = np.full(len(geometry), np.nan)
+
+            frames.append(
+                pd.DataFrame(
+                    dict(component=table['component'].values,
+                         name=table['name'].values,
+                         table=table_name,
+                         chip=table['chip'].values,
+                         layer=table['layer'].astype(int).values,
+                         subtract=table['subtract'].astype(bool).values,
+                         width=width,
+                         geometry=geometry)))
+
+        frame = pd.concat(frames, ignore_index=True)
+        frame = frame[~shapely.is_empty(frame['geometry'].values)]
+        frame['component_name'] = frame['component'].map(
+            self._component_names())
+        return frame.reset_index(drop=True)
+
+    def _component_names(self) -> dict:
+        """Return dict with key of component id and value of name."""
+        return {
+            comp_id: comp.name
+            for comp_id, comp in self.design._components.items()  # pylint: disable=protected-access
+        }
+
+    def run(self,
+            chips: Union[str, List[str]] = None,
+            incremental: bool = False) -> pd.DataFrame:
+        """Run all the enabled design rule checks.
+
+        When options.tile_size is set, each chip is split into tiles from its
+        size in the design (design.get_x_y_for_chip), and the tiles are
+        checked in options.workers processes.
+
+        With incremental=True, the results of the last run are reused. Only
+        the components whose content hash changed since then are checked,
+        against the geometry within the rule halo around them.  A full check
+        is run if there is no last run, or the chips, rules or keep-outs
+        changed.
+
+        Args:
+            chips (Union[str, List[str]]): Chip name or names. Defaults to
+                None, which checks all chips.
+            incremental (bool): Only check the components which changed since
+                the last run.  Defaults to False.
+
+        Returns:
+            pd.DataFrame: One row per violation, see VIOLATION_COLUMNS.
+            The location column holds a shapely geometry of the violation,
+            and x, y its centroid.
+        """
+        if isinstance(chips, str):
+            chips = [chips]
+        tol = 10**-self.design.template_options.PRECISION
+        rules = self.parse_rules()
+        names = self._component_names()
+        hashes = component_hashes(self.design.qgeometry.tables, names)
+
+        last = self._last
+        if incremental and last is not None and last.chips == chips and \
+                last.rules == rules:
+            violations, frame = self._run_incremental(rules, tol, names, hashes)
+            self._last.update(frame=frame,
+                              violations=violations,
+                              names=names,
+                              hashes=hashes)
+            self._log_summary(violations)
+            return violations.copy()
+
+        frame = self.get_geometry_frame(chips)
+        tile_size = float(self.design.parse_value(self.options.tile_size))
+        if tile_size > 0:
+            chip_bounds = dict()
+            for chip in frame['chip'].unique():
+                if hasattr(self.design, 'get_x_y_for_chip'):
+                    bounds, status = self.design.get_x_y_for_chip(chip)
+                    if status == 0:
+                        chip_bounds[chip] = bounds
+            workers = int(self.design.parse_value(self.options.workers))
+            violations = run_rules_tiled(frame,
+                                         rules,
+                                         self.keepouts,
+                                         tol,
+                                         chip_bounds=chip_bounds,
+                                         tile_size=tile_size,
+                                         workers=workers or None)
+        else:
+            violations = run_rules(frame, rules, self.keepouts, tol)
+
+        self._last = Dict(chips=chips,
+                          rules=rules,
+                          frame=frame,
+                          violations=violations,
+                          names=names,
+                          hashes=hashes)
+        self._log_summary(violations)
+        return violations.copy()
+
+    def _run_incremental(self, rules: Dict, tol: float, names: dict,
+                         hashes: dict) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Update the violations of the last run for the changed components.
+
+        Args:
+            rules (Dict): Parsed rules.
+            tol (float): Numerical tolerance.
+            names (dict): Key is component id, value is the current name.
+            hashes (dict): Key is component id, value is the current hash.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Updated table of violations,
+            and updated geometry frame.
+        """
+        last = self._last
+        changed = {
+            comp_id for comp_id in set(hashes) | set(last.hashes)
+            if hashes.get(comp_id) != last.hashes.get(comp_id)
+        }
+        if not changed:
+            return last.violations, last.frame
+
+        # Reuse the buffered geometry of the unchanged components.
+        frame = last.frame[~last.frame['component'].isin(changed)]
+        frame = pd.concat(
+            [frame,
+             self.get_geometry_frame(last.chips, component_ids=changed)],
+            ignore_index=True)
+
+        # Changed geometry and its neighbourhood within the rule halo.
+        geoms = frame['geometry'].values
+        is_changed = frame['component'].isin(changed).values
+        _, idx_near = shapely.STRtree(geoms).query(geoms[is_changed],
+                                                   predicate='dwithin',
+                                                   distance=rule_halo(rules) +
+                                                   tol)
+        near = is_changed.copy()
+        near[idx_near] = True
+        found = run_rules(frame[near], rules, self.keepouts, tol)
+
+        new_names = {names.get(comp_id) for comp_id in changed} - {None}
+        old_names = {last.names.get(comp_id) for comp_id in changed} - {None}
+        found = found[found['component_1'].isin(new_names) |
+                      found['component_2'].isin(new_names)]
+        kept = last.violations[~(
+            last.violations['component_1'].isin(old_names) |
+            last.violations['component_2'].isin(old_names))]
+
+        violations = pd.concat([kept, found], ignore_index=True)
+        return violations, frame
+
+    def overlap_tester(self) -> pd.DataFrame:
+        """Test for overlap amongst qcomponents and CPWs. It will catch
+        qubit/qubit overlap, qubit/CPW overlap and CPW/CPW overlap.
+
+        Returns:
+            pd.DataFrame: One row per pair of overlapping geometries,
+            see VIOLATION_COLUMNS.
+        """
+        frame = self.get_geometry_frame()
+        tol = 10**-self.design.template_options.PRECISION
+        violations = run_rules(frame, dict(overlap=True), None, tol)
+        self._log_summary(violations)
+        return violations
+
+    def _log_summary(self, violations: pd.DataFrame):
+        """Log the number of violations of each rule.
+
+        Args:
+            violations (pd.DataFrame): Table of violations.
+        """
+        if violations.shape[0] == 0:
+            self.logger.info('Design check found no violations.')
+            return
+        for rule, count in violations['rule'].value_counts().items():
+            self.logger.warning(
+                f'Design check found {count} violation(s) of rule={rule}.')
@@ -195,8 +195,8 @@ class CoupledLineTeeCustom(QComponent):
         
         #Rotate and Translate
         c_items = [prime_cpw, second_cpw, second_cpw_etch, prime_cpw_etch]
-        c_items = draw.rotate(c_items, p.orientation, origin=(0, 0))
-        c_items = draw.translate(c_items, p.pos_x, p.pos_y)
+        c_items = draw.compose(c_items, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [prime_cpw, second_cpw, second_cpw_etch, prime_cpw_etch] = c_items
         
         #Add to qgeometry tables
@@ -169,8 +169,8 @@ class TunableCoupler01(BaseQubit):
             cap_island, cap_subtract, rect_jj, con_body, con_sub, flux_line,
             con_pin
         ]
-        c_items = draw.rotate(c_items, p.orientation, origin=(0, 0))
-        c_items = draw.translate(c_items, p.pos_x, p.pos_y)
+        c_items = draw.compose(c_items, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [
             cap_island, cap_subtract, rect_jj, con_body, con_sub, flux_line,
             con_pin
@@ -119,8 +119,8 @@ class TunableCoupler02(BaseQubit):
             JJ, bus_vertical_left, bus_vertical_right, bus_left, bus_right,
             left_pad, right_pad, fbl, pocket
         ]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, xoff=p.pos_x, yoff=p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [
             JJ, bus_vertical_left, bus_vertical_right, bus_left, bus_right,
             left_pad, right_pad, fbl, pocket
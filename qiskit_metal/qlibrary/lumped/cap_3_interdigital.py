@@ -133,8 +133,8 @@ class Cap3Interdigital(QComponent):
 
         # Rotates and translates all the objects as requested. Uses package functions
         # in 'draw_utility' for easy rotation/translation
-        polys1 = draw.rotate(polys1, p.orientation, origin=(0, 0))
-        polys1 = draw.translate(polys1, xoff=p.pos_x, yoff=p.pos_y)
+        polys1 = draw.compose(polys1, draw.rotate_matrix(p.orientation),
+                              draw.translate_matrix(p.pos_x, p.pos_y))
         [
             top_pin_line, bot_pin_line, pad_top, pad_bot, cent_finger,
             left_finger, right_finger, pocket, trace_top, trace_bot
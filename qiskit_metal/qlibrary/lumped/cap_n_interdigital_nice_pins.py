@@ -196,8 +196,8 @@ class CapNInterdigital(QComponent):
 
         #Rotate and Translate
         c_items = [north_cpw, south_cpw, cap_body, cap_etch]
-        c_items = draw.rotate(c_items, p.orientation, origin=(0, 0))
-        c_items = draw.translate(c_items, p.pos_x, p.pos_y)
+        c_items = draw.compose(c_items, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [north_cpw, south_cpw, cap_body, cap_etch] = c_items
 
         #Add to qgeometry tables
@@ -114,8 +114,8 @@ class ResonatorCoilRect(QComponent):
         ])
 
         c_items = [spiral_list, spiral_etch, points]
-        c_items = draw.rotate(c_items, p.orientation, origin=(0, 0))
-        c_items = draw.translate(c_items, p.pos_x, p.pos_y)
+        c_items = draw.compose(c_items, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [spiral_list, spiral_etch, points] = c_items
         ##############################################
         # add elements
@@ -133,8 +133,8 @@ class SQUID_LOOP(QComponent):
                              segment_b_lower, segment_c, segment_d, plate2)
 
         # now translate and rotate the final structure
-        design1 = draw.rotate(design1, p.orientation, origin=(0, 0))
-        design1 = draw.translate(design1, p.pos_x, p.pos_y)
+        design1 = draw.compose(design1, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
 
         geom = {'design': design1}
         self.add_qgeometry('poly', geom, layer=p.layer, subtract=False)
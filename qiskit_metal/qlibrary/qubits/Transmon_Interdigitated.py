@@ -199,23 +199,22 @@ class TransmonInterdigitated(QComponent):
             -0.5 * p.pad_height - p.finger_height - 0.5 * p.finger_space)
 
         # now translate the final structure according to the user input
-        bottom = draw.rotate(bottom, p.orientation, origin=(0, 0))
-        bottom = draw.translate(bottom, p.pos_x, p.pos_y)
-        top = draw.rotate(top, p.orientation, origin=(0, 0))
-        top = draw.translate(top, p.pos_x, p.pos_y)
-        coupling_capacitor = draw.rotate(coupling_capacitor,
-                                         p.orientation,
-                                         origin=(0, 0))
-        coupling_capacitor = draw.translate(coupling_capacitor, p.pos_x,
-                                            p.pos_y)
-        cc_topleft = draw.rotate(cc_topleft, p.orientation, origin=(0, 0))
-        cc_topleft = draw.translate(cc_topleft, p.pos_x, p.pos_y)
-        cc_topright = draw.rotate(cc_topright, p.orientation, origin=(0, 0))
-        cc_topright = draw.translate(cc_topright, p.pos_x, p.pos_y)
-        rect_jj = draw.rotate(rect_jj, p.orientation, origin=(0, 0))
-        rect_jj = draw.translate(rect_jj, p.pos_x, p.pos_y)
-        pocket = draw.rotate(pocket, p.orientation, origin=(0, 0))
-        pocket = draw.translate(pocket, p.pos_x, p.pos_y)
+        bottom = draw.compose(bottom, draw.rotate_matrix(p.orientation),
+                              draw.translate_matrix(p.pos_x, p.pos_y))
+        top = draw.compose(top, draw.rotate_matrix(p.orientation),
+                           draw.translate_matrix(p.pos_x, p.pos_y))
+        coupling_capacitor = draw.compose(
+            coupling_capacitor, draw.rotate_matrix(p.orientation),
+            draw.translate_matrix(p.pos_x, p.pos_y))
+        cc_topleft = draw.compose(cc_topleft, draw.rotate_matrix(p.orientation),
+                                  draw.translate_matrix(p.pos_x, p.pos_y))
+        cc_topright = draw.compose(cc_topright,
+                                   draw.rotate_matrix(p.orientation),
+                                   draw.translate_matrix(p.pos_x, p.pos_y))
+        rect_jj = draw.compose(rect_jj, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
+        pocket = draw.compose(pocket, draw.rotate_matrix(p.orientation),
+                              draw.translate_matrix(p.pos_x, p.pos_y))
 
         # add each shape separately
         geom1 = {'pad_bot': bottom}
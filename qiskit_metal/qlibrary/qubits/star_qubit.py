@@ -273,8 +273,8 @@ class StarQubit(QComponent):
         total = draw.union(total1, rect1, rect2)
 
         objects = [total, jjunction]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, p.pos_x, p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [total, jjunction] = objects
 
         self.add_qgeometry('poly', {'circle_inner': total},
@@ -319,8 +319,8 @@ class StarQubit(QComponent):
         pins_cpl = self.make_rotation(pins, 3)
 
         objects = [contacts, pins_cpl]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, p.pos_x, p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [contacts, pins_cpl] = objects
 
         ##################################################################
@@ -399,8 +399,8 @@ class StarQubit(QComponent):
         pins_rdout = self.make_rotation(pins, 2)
 
         objects = [contact_rdout, pins_rdout]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, p.pos_x, p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [contact_rdout, pins_rdout] = objects
 
         ##################################################################
@@ -455,8 +455,8 @@ class StarQubit(QComponent):
         ##################################################################
         # Add geometry and Qpin connections
         objects = [circle_outer]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, p.pos_x, p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [circle_outer] = objects
         self.add_qgeometry('poly', {'circle_outer': circle_outer},
                            subtract=True,
@@ -132,8 +132,8 @@ class TransmonConcentric(BaseQubit):
 
         # Translate and rotate all shapes
         objects = [outer_pad, inner_pad, jj_t, jj_b, pocket, rr, fbl]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, xoff=p.pos_x, yoff=p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [outer_pad, inner_pad, jj_t, jj_b, pocket, rr, fbl] = objects
 
         # define a function that both rotates and translates the qpin coordinates
@@ -239,8 +239,8 @@ class TransmonConcentricType2(BaseQubit):
             outer_pad, inner_pad, JJ, finger_NE, finger_NW, finger_SW, finger_E,
             box, finger_N, padtop, coupler_NE, coupler_NW, coupler_SW
         ]
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, xoff=p.pos_x, yoff=p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [
             outer_pad, inner_pad, JJ, finger_NE, finger_NW, finger_SW, finger_E,
             box, finger_N, padtop, coupler_NE, coupler_NW, coupler_SW
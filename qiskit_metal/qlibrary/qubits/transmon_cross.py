@@ -138,8 +138,8 @@ class TransmonCross(BaseQubit):  # pylint: disable=invalid-name
 
         #rotate and translate
         polys = [cross, cross_etch, rect_jj]
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
 
         [cross, cross_etch, rect_jj] = polys
 
@@ -260,8 +260,8 @@ class TransmonCross(BaseQubit):  # pylint: disable=invalid-name
         polys = draw.translate(polys, -(cross_length + cross_gap + g_s + c_g),
                                0)
         polys = draw.rotate(polys, claw_rotate, origin=(0, 0))
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
         [connector_arm, connector_etcher, port_line] = polys
 
         # Generates qgeometry for the connector pads
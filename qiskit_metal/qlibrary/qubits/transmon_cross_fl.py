@@ -103,8 +103,8 @@ class TransmonCrossFL(TransmonCross):  # pylint: disable=invalid-name
                         pf.t_width / 2 + pf.t_gap))
 
         # Rotate and translate based on crossmon location
-        parts = draw.rotate(parts, p.orientation, origin=(0, 0))
-        parts = draw.translate(parts, p.pos_x, p.pos_y)
+        parts = draw.compose(parts, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
 
         [h_line, v_line] = parts
 
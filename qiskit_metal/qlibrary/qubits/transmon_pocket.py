@@ -177,8 +177,8 @@ class TransmonPocket(BaseQubit):
         # NOTE: Should modify so rotate/translate accepts qgeometry, would allow for
         # smoother implementation.
         polys = [rect_jj, pad_top, pad_bot, rect_pk]
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
         [rect_jj, pad_top, pad_bot, rect_pk] = polys
 
         # Use the geometry to create Metal qgeometry
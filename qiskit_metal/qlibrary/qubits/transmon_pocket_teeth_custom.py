@@ -278,8 +278,8 @@ class TransmonPocketTeethCustom(BaseQubit):
         # NOTE: Should modify so rotate/translate accepts qgeometry, would allow for
         # smoother implementation.
         polys = [rect_jj, pad_top, pad_bot, rect_pk]
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
         # additional pocket moving
         polys[-1] = draw.translate(polys[-1], p.pocket_dx, p.pocket_dy)
         
@@ -164,8 +164,8 @@ class ReadoutResFC(QComponent):
 
         # rotate and translate
         polys = [ro, ro_etch, port_line]
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
 
         # update each object
         [ro, ro_etch, port_line] = polys
@@ -184,8 +184,8 @@ class ResonatorLumped(QComponent):
         # first translate so that the origin is at the middle of the loop
         objects = draw.translate(objects, 0.0, -0.5 * p.box_height)
         # now translate and rotate according to the values specified in the dictionary
-        objects = draw.rotate(objects, p.orientation, origin=(0, 0))
-        objects = draw.translate(objects, xoff=p.pos_x, yoff=p.pos_y)
+        objects = draw.compose(objects, draw.rotate_matrix(p.orientation),
+                               draw.translate_matrix(p.pos_x, p.pos_y))
         [
             perimeter, initial, arc, arc_left_1, arc_left_2, arc_left_3,
             arc_left_4, arc_left_5, arc_left_6, arc_left_7, arc_right_1,
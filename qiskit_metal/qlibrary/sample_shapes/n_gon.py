@@ -61,8 +61,8 @@ class NGon(QComponent):
         # Converts said list into a shapely polygon
         n_polygon = draw.Polygon(n_polygon)
 
-        n_polygon = draw.rotate(n_polygon, p.orientation, origin=(0, 0))
-        n_polygon = draw.translate(n_polygon, p.pos_x, p.pos_y)
+        n_polygon = draw.compose(n_polygon, draw.rotate_matrix(p.orientation),
+                                 draw.translate_matrix(p.pos_x, p.pos_y))
 
         ##############################################
         # add qgeometry
@@ -85,8 +85,9 @@ class NSquareSpiral(QComponent):
         spiral_list.append((-point_value, -point_value))
         spiral_list = draw.LineString(spiral_list)
 
-        spiral_list = draw.rotate(spiral_list, p.orientation, origin=(0, 0))
-        spiral_list = draw.translate(spiral_list, p.pos_x, p.pos_y)
+        spiral_list = draw.compose(spiral_list,
+                                   draw.rotate_matrix(p.orientation),
+                                   draw.translate_matrix(p.pos_x, p.pos_y))
 
         ##############################################
         # add qgeometry
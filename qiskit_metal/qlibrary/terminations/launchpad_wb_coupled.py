@@ -157,8 +157,8 @@ class LaunchpadWirebondCoupled(QComponent):
 
         # Rotates and translates all the objects as requested. Uses package functions
         # in 'draw_utility' for easy rotation/translation
-        polys1 = draw.rotate(polys1, p.orientation, origin=(0, 0))
-        polys1 = draw.translate(polys1, xoff=p.pos_x, yoff=p.pos_y)
+        polys1 = draw.compose(polys1, draw.rotate_matrix(p.orientation),
+                              draw.translate_matrix(p.pos_x, p.pos_y))
         [main_pin_line, launch_pad, ind_stub, pocket] = polys1
 
         # Adds the object to the qgeometry table
@@ -52,8 +52,8 @@ class OpenToGround(QComponent):
                                     p.termination_gap, (p.width / 2 + p.gap))
         # Rotates and translates the connector polygons (and temporary port_line)
         polys = [open_termination, port_line]
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = draw.compose(polys, draw.rotate_matrix(p.orientation),
+                             draw.translate_matrix(p.pos_x, p.pos_y))
         [open_termination, port_line] = polys
 
         # Subtracts out ground plane on the layer its on
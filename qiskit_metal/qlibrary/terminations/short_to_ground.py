@@ -47,8 +47,8 @@ class ShortToGround(QComponent):
         port_line = draw.LineString([(0, -p.width / 2), (0, p.width / 2)])
 
         # Rotates and translates the connector polygons (and temporary port_line)
-        port_line = draw.rotate(port_line, p.orientation, origin=(0, 0))
-        port_line = draw.translate(port_line, p.pos_x, p.pos_y)
+        port_line = draw.compose(port_line, draw.rotate_matrix(p.orientation),
+                                 draw.translate_matrix(p.pos_x, p.pos_y))
 
         port_points = list(draw.shapely.geometry.shape(port_line).coords)
 
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" For GDS export, the geometry operations which can run on either gdspy
+or gdstk.
+
+The cells and library of the GDS renderer are always gdspy objects.  With the
+gdstk backend, the booleans and the writing of the file are done by gdstk,
+and the results are converted back to gdspy.PolygonSet.  gdstk is optional.
+"""
+
+import logging
+from typing import Union
+
+import gdspy
+import numpy as np
+
+try:
+    import gdstk
+except ImportError:
+    gdstk = None
+
+BACKENDS = ('gdspy', 'gdstk')
+"""Names of the backends for options.backend"""
+
+
+def check_backend(backend: str, logger: logging.Logger) -> str:
+    """Check the name of a backend.
+
+    Args:
+        backend (str): Requested backend, from options.backend.
+        logger (logging.Logger): Used to give warnings.
+
+    Returns:
+        str: backend if it can be used, otherwise 'gdspy'.
+    """
+    if backend not in BACKENDS:
+        logger.warning(f'The backend={backend} is unknown, use one of '
+                       f'{BACKENDS}.  Using gdspy.')
+        return 'gdspy'
+    if backend == 'gdstk' and gdstk is None:
+        logger.warning('The backend=gdstk is not installed.  Using gdspy.')
+        return 'gdspy'
+    return backend
+
+
+def _to_points(operand) -> list:
+    """Get the points of every polygon of a gdspy operand, as accepted by
+    gdspy.boolean.
+
+    Args:
+        operand: gdspy polygon, path, cell, reference, array of points, or a
+            list of those.
+
+    Returns:
+        list: np.ndarray of the points of each polygon.
+    """
+    if operand is None:
+        return []
+    if isinstance(operand, gdspy.PolygonSet):
+        return list(operand.polygons)
+    if isinstance(operand, (gdspy.FlexPath, gdspy.RobustPath, gdspy.Cell,
+                            gdspy.CellReference, gdspy.CellArray)):
+        return list(operand.get_polygons())
+    if isinstance(operand, np.ndarray) and operand.ndim == 2:
+        return [operand]
+    if len(operand) > 0 and np.ndim(operand[0]) == 1:
+        # A single polygon given as a list of points.
+        return [np.asarray(operand, dtype=float)]
+    points = []
+    for item in operand:
+        points.extend(_to_points(item))
+    return points
+
+
+def boolean(operand_a,
+            operand_b,
+            operation: str,
+            precision: float = 0.001,
+            max_points: int = 199,
+            layer: int = 0,
+            datatype: int = 0,
+            backend: str = 'gdspy') -> Union[gdspy.PolygonSet, None]:
+    """gdspy.boolean, computed by the backend.
+
+    Args:
+        operand_a: First operand, anything accepted by gdspy.boolean.
+        operand_b: Second operand, anything accepted by gdspy.boolean.
+        operation (str): 'or', 'and', 'xor' or 'not'.
+        precision (float): Desired precision for rounding vertex coordinates.
+            Defaults to 0.001.
+        max_points (int): If greater than 4, fracture the result so that no
+            polygon has more than max_points vertices. Defaults to 199.
+        layer (int): GDSII layer of the result. Defaults to 0.
+        datatype (int): GDSII datatype of the result. Defaults to 0.
+        backend (str): 'gdspy' or 'gdstk'. Defaults to 'gdspy'.
+
+    Returns:
+        Union[gdspy.PolygonSet, None]: The result, None if empty.
+    """
+    if backend != 'gdstk':
+        return gdspy.boolean(operand_a,
+                             operand_b,
+                             operation,
+                             precision=precision,
+                             max_points=max_points,
+                             layer=layer,
+                             datatype=datatype)
+
+    result = gdstk.boolean(_to_points(operand_a),
+                           _to_points(operand_b),
+                           operation,
+                           precision=precision,
+                           layer=int(layer),
+                           datatype=int(datatype))
+    if max_points > 4:
+        result = [
+            piece for polygon in result
+            for piece in polygon.fracture(max_points, precision)
+        ]
+    if not result:
+        return None
+    return gdspy.PolygonSet([polygon.points for polygon in result],
+                            layer=layer,
+                            datatype=datatype)
+
+
+def write_gds(lib: gdspy.GdsLibrary, file_name: str, backend: str = 'gdspy'):
+    """Write a gdspy library to a GDS file with the backend.
+
+    Args:
+        lib (gdspy.GdsLibrary): Library to write.
+        file_name (str): File name which can also include directory path.
+        backend (str): 'gdspy' or 'gdstk'. Defaults to 'gdspy'.
+    """
+    if backend != 'gdstk':
+        lib.write_gds(file_name)
+        return
+
+    out = gdstk.Library(lib.name, unit=lib.unit, precision=lib.precision)
+    for cell in lib.cells.values():
+        out.add(_to_gdstk_cell(cell))
+    out.write_gds(file_name)
+
+
+def _to_gdstk_cell(cell: gdspy.Cell) -> 'gdstk.Cell':
+    """Convert a gdspy cell to gdstk.  References are kept by cell name.
+
+    Args:
+        cell (gdspy.Cell): Cell to convert.
+
+    Returns:
+        gdstk.Cell: The converted cell.
+    """
+    # gdspy keeps the layers and datatypes as numpy integers, which gdstk
+    # does not accept.
+    new_cell = gdstk.Cell(cell.name)
+    for polygon_set in cell.polygons:
+        new_cell.add(*[
+            gdstk.Polygon(points, int(layer), int(datatype))
+            for points, layer, datatype in zip(
+                polygon_set.polygons, polygon_set.layers, polygon_set.datatypes)
+        ])
+    for path in cell.paths:
+        for (layer, datatype), polygons in path.get_polygons(True).items():
+            new_cell.add(*[
+                gdstk.Polygon(points, int(layer), int(datatype))
+                for points in polygons
+            ])
+    for label in cell.labels:
+        new_cell.add(
+            gdstk.Label(label.text,
+                        label.position,
+                        rotation=np.radians(label.rotation or 0),
+                        magnification=label.magnification or 1,
+                        x_reflection=bool(label.x_reflection),
+                        layer=int(label.layer),
+                        texttype=int(label.texttype)))
+    for reference in cell.references:
+        ref_cell = reference.ref_cell
+        ref_name = ref_cell if isinstance(ref_cell, str) else ref_cell.name
+        columns, rows, spacing = 1, 1, None
+        if isinstance(reference, gdspy.CellArray):
+            columns, rows = int(reference.columns), int(reference.rows)
+            spacing = reference.spacing
+        new_cell.add(
+            gdstk.Reference(ref_name,
+                            reference.origin,
+                            rotation=np.radians(reference.rotation or 0),
+                            magnification=reference.magnification or 1,
+                            x_reflection=bool(reference.x_reflection),
+                            columns=columns,
+                            rows=rows,
+                            spacing=spacing))
+    return new_cell
@@ -14,12 +14,15 @@
 """ This module has a QRenderer to export QDesign to a GDS file."""
 # pylint: disable=too-many-lines
 
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from functools import partial
 from operator import itemgetter
 from typing import TYPE_CHECKING
 #from typing import Dict as Dict_
 from typing import Tuple, Union
 #from typing import List, Any, Iterable
+import hashlib
 import math
 import os
 from shapely.geometry import LineString
@@ -29,10 +32,13 @@ import gdspy
 import geopandas
 import shapely
 from scipy.spatial import distance
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 import pandas as pd
 import numpy as np
 
 from qiskit_metal.renderers.renderer_base import QRenderer
+from qiskit_metal.renderers.renderer_gds import gds_backend
 from qiskit_metal.renderers.renderer_gds.airbridge import Airbridge_forGDS
 from qiskit_metal.renderers.renderer_gds.make_airbridge import Airbridging
 from qiskit_metal.renderers.renderer_gds.make_cheese import Cheesing
@@ -45,6 +51,7 @@ from .. import config
 if not config.is_building_docs():
     from qiskit_metal.toolbox_python.utility_functions import can_write_to_path
     from qiskit_metal.toolbox_python.utility_functions import get_range_of_vertex_to_not_fillet
+    from qiskit_metal.toolbox_metal.fillet import bad_fillet_idxs_batch
 
 if TYPE_CHECKING:
     # For linting typechecking, import modules that can't be loaded here under normal conditions.
@@ -53,6 +60,114 @@ if TYPE_CHECKING:
     from qiskit_metal.designs import QDesign
 
 
+def _boolean_not(job: tuple,
+                 backend: str = 'gdspy') -> Union[gdspy.PolygonSet, None]:
+    """Run one ground plane boolean.  Module level, so that it can be
+    sent to a worker process.
+
+    Args:
+        job (tuple): operand_a, operand_b, layer, precision, max_points and
+                    clip_box.  Computes gdspy.boolean(operand_a, operand_b,
+                    'not', ...).  If clip_box (minx, miny, maxx, maxy) is not
+                    None, operand_a is first clipped to it.
+        backend (str): 'gdspy' or 'gdstk'. Defaults to 'gdspy'.
+
+    Returns:
+        Union[gdspy.PolygonSet, None]: The difference, None if empty.
+    """
+    operand_a, operand_b, layer, precision, max_points, clip_box = job
+    if clip_box is not None:
+        operand_a = gds_backend.boolean(operand_a,
+                                        gdspy.Rectangle(clip_box[:2],
+                                                        clip_box[2:]),
+                                        'and',
+                                        max_points=0,
+                                        precision=precision,
+                                        backend=backend)
+        if operand_a is None:
+            return None
+    return gds_backend.boolean(operand_a,
+                               operand_b,
+                               'not',
+                               max_points=max_points,
+                               precision=precision,
+                               layer=layer,
+                               backend=backend)
+
+
+# Cells of the junction files read by _read_junction_cells, by path.
+_junction_libraries = dict()
+
+
+def _read_junction_cells(path: str, unit: float, precision: float) -> list:
+    """Read the cells of a junction GDS file.  The cells are kept, and the
+    file is only read again if it was modified, or for other units.
+
+    Args:
+        path (str): Path of the GDS file.
+        unit (float): Unit of the library the cells are for.
+        precision (float): Precision of the library the cells are for.
+
+    Returns:
+        list: The gdspy.Cell of the file.
+    """
+    path = os.path.abspath(path)
+    key = (os.path.getmtime(path), unit, precision)
+    cached = _junction_libraries.get(path)
+    if cached is None or cached[0] != key:
+        junction_lib = gdspy.GdsLibrary(unit=unit, precision=precision)
+        junction_lib.read_gds(path, units='convert')
+        cached = (key, list(junction_lib.cells.values()))
+        _junction_libraries[path] = cached
+    return cached[1]
+
+
+class _ExportCache:
+    """Values computed by the last export and the current one.  Values not
+    used by an export are dropped when it ends."""
+
+    def __init__(self):
+        self._last = dict()
+        self._current = dict()
+
+    def get(self, key, default=None):
+        """Get a value from the current or the last export, and keep it for
+        the next export.
+
+        Args:
+            key (tuple): Cache key
+            default (object): Returned if key is not cached.  Defaults to None.
+
+        Returns:
+            object: The cached value, or default
+        """
+        if key in self._current:
+            return self._current[key]
+        if key in self._last:
+            self._current[key] = self._last[key]
+            return self._current[key]
+        return default
+
+    def set(self, key, value):
+        """Cache a value computed by the current export.
+
+        Args:
+            key (tuple): Cache key
+            value (object): Value to cache
+        """
+        self._current[key] = value
+
+    def end_export(self):
+        """Keep the values used by the export which ended, drop the rest."""
+        self._last = self._current
+        self._current = dict()
+
+    def clear(self):
+        """Remove all the cached values."""
+        self._last.clear()
+        self._current.clear()
+
+
 class QGDSRenderer(QRenderer):
     """Extends QRenderer to export GDS formatted files. The methods which a
     user will need for GDS export should be found within this class.
@@ -95,6 +210,12 @@ class QGDSRenderer(QRenderer):
         * path_filename: '../resources/Fake_Junctions.GDS'
         * junction_pad_overlap: '5um'
         * max_points: '199'
+        * workers: '1'
+        * ground_plane_tile_size: '0mm'
+        * stream: 'False'
+        * incremental: 'True'
+        * backend: 'gdspy'
+        * merge_polygons: 'False'
         * fabricate: 'False'
         * airbridge: Dict
             * geometry: Dict
@@ -221,6 +342,39 @@ class QGDSRenderer(QRenderer):
         # handle is 8191.
         max_points='199',
 
+        # Number of processes that compute the ground plane booleans,
+        # one job per chip and layer (and tile).  1 computes them in this
+        # process, 0 uses one process per CPU.
+        workers='1',
+
+        # For huge chips, cut the ground plane of each chip and layer into
+        # square tiles of this size.  Each tile only subtracts the shapes
+        # that intersect it, and is written as separate polygons.
+        # 0 does not tile.
+        ground_plane_tile_size='0mm',
+
+        # If true, build and write one chip at a time with gdspy.GdsWriter,
+        # and free the chip as soon as it is on disk.  Bounds the peak memory
+        # of export_to_gds for designs with many chips.
+        stream='False',
+
+        # If true, keep the gdspy elements of every component, the ground
+        # plane boolean of every chip, layer and tile, and the cheese of every
+        # chip and layer, from the last export_to_gds.  The next export only
+        # converts the components and recomputes the booleans whose inputs
+        # changed.
+        incremental='True',
+
+        # Library used for the booleans and to write the file: 'gdspy' or
+        # 'gdstk'.  gdstk is faster, but is optional and must be installed.
+        backend='gdspy',
+
+        # If true, before the conversion to gdspy, the polygons of each chip,
+        # layer and subtract which touch or overlap are merged into one,
+        # snapped to precision and without colinear vertices.  Fewer polygons
+        # go to the ground plane booleans and to the file.
+        merge_polygons='False',
+
         # Airbriding
         airbridge=Dict(
             # GDS datatype of airbridges.
@@ -353,6 +507,20 @@ class QGDSRenderer(QRenderer):
         # Updated each time export_to_gds() is called.
         self.chip_info = dict()
 
+        # Ground plane booleans, by (chip_name, chip_layer).
+        # Updated each time export_to_gds() is called.
+        self._ground_booleans = dict()
+
+        # gdspy elements of each component, ground plane booleans of each
+        # job and cheese of each chip and layer, from the last
+        # export_to_gds(), when options.incremental.
+        self._element_cache = _ExportCache()
+        self._boolean_cache = _ExportCache()
+        self._cheese_cache = _ExportCache()
+
+        # options.backend, checked each time export_to_gds() is called.
+        self._backend = 'gdspy'
+
         # check the scale
         self._check_bounding_box_scale()
 
@@ -752,12 +920,182 @@ class QGDSRenderer(QRenderer):
                                                       'all_subtract_false')
 
             self.chip_info[chip_name][chip_layer][
-                'q_subtract_true'] = self.chip_info[chip_name][chip_layer][
-                    'all_subtract_true'].apply(self._qgeometry_to_gds, axis=1)
+                'q_subtract_true'] = self._table_to_gds(
+                    self._merge_polygons(self.chip_info[chip_name][chip_layer]
+                                         ['all_subtract_true']))
 
             self.chip_info[chip_name][chip_layer][
-                'q_subtract_false'] = self.chip_info[chip_name][chip_layer][
-                    'all_subtract_false'].apply(self._qgeometry_to_gds, axis=1)
+                'q_subtract_false'] = self._table_to_gds(
+                    self._merge_polygons(self.chip_info[chip_name][chip_layer]
+                                         ['all_subtract_false']))
+
+    @staticmethod
+    def _remove_colinear_ring_pts(ring: shapely.LinearRing) -> np.ndarray:
+        """Remove the colinear points of a closed ring, including its first
+        point.
+
+        remove_colinear_pts keeps the ends of a path, so the ring is first
+        rotated to start at its sharpest corner.
+
+        Args:
+            ring (shapely.LinearRing): Exterior or interior of a polygon.
+
+        Returns:
+            np.ndarray: Points of the closed ring.
+        """
+        points = np.asarray(ring.coords)[:-1]
+        if len(points) < 3:
+            return np.asarray(ring.coords)
+        before = points - np.roll(points, 1, axis=0)
+        after = np.roll(points, -1, axis=0) - points
+        cross = before[:, 0] * after[:, 1] - before[:, 1] * after[:, 0]
+        points = np.roll(points, -np.argmax(np.abs(cross)), axis=0)
+        return draw.utility.remove_colinear_pts(
+            np.concatenate([points, points[:1]]))
+
+    def _merge_polygons(
+            self, table: geopandas.GeoDataFrame) -> geopandas.GeoDataFrame:
+        """With options.merge_polygons, merge the polygons of table which
+        touch or overlap.
+
+        The polygons are snapped to options.precision, and the groups that
+        touch are found with a shapely.STRtree.  Each group is merged with
+        shapely.union_all, then colinear vertices are removed.  Paths and
+        polygons that do not touch any other polygon are not changed.
+
+        Args:
+            table (geopandas.GeoDataFrame): Rows of QGeometry for one chip,
+                                            layer and subtract.
+
+        Returns:
+            geopandas.GeoDataFrame: table if nothing was merged.  Otherwise,
+            the rows which were not merged, then one row per merged polygon.
+            A merged row is a copy of the first row of its group, with the
+            new geometry.
+        """
+        # pylint: disable=too-many-locals
+        if not is_true(self.options.merge_polygons) or table.empty:
+            return table
+
+        geoms = np.asarray(table['geometry'], dtype=object)
+        poly_idx = np.flatnonzero(shapely.get_type_id(geoms) == 3)
+        precision = float(self.parse_value(self.options.precision))
+        polys = shapely.set_precision(geoms[poly_idx], precision)
+        valid = ~shapely.is_empty(polys)
+        poly_idx = poly_idx[valid]
+        polys = polys[valid]
+        if len(polys) < 2:
+            return table
+
+        # Groups of polygons which touch, directly or through others.
+        left, right = shapely.STRtree(polys).query(polys,
+                                                   predicate='intersects')
+        graph = coo_matrix((np.ones(len(left)), (left, right)),
+                           shape=(len(polys), len(polys)))
+        _, labels = connected_components(graph, directed=False)
+        sizes = np.bincount(labels)
+        merge = sizes[labels] > 1
+        if not merge.any():
+            return table
+
+        order = np.argsort(labels[merge], kind='stable')
+        positions = poly_idx[merge][order]
+        group_polys = polys[merge][order]
+        groups = np.split(np.arange(len(positions)),
+                          np.cumsum(sizes[sizes > 1])[:-1])
+
+        merged_rows = []
+        merged_geoms = []
+        for group in groups:
+            union = shapely.union_all(group_polys[group])
+            for part in shapely.get_parts(union):
+                if shapely.get_type_id(part) != 3:
+                    continue
+                merged_rows.append(positions[group[0]])
+                merged_geoms.append(
+                    draw.Polygon(self._remove_colinear_ring_pts(part.exterior),
+                                 [
+                                     self._remove_colinear_ring_pts(interior)
+                                     for interior in part.interiors
+                                 ]))
+
+        keep = np.ones(len(table), dtype=bool)
+        keep[positions] = False
+        merged = table.iloc[merged_rows].copy()
+        merged['geometry'] = merged_geoms
+        return geopandas.GeoDataFrame(pd.concat([table[keep], merged]))
+
+    def _table_to_gds(self, table: geopandas.GeoDataFrame) -> pd.Series:
+        """Convert every row of table with _qgeometry_table_to_gds().
+
+        With options.incremental, the rows are converted one component at a
+        time.  A component whose rows, and the options used to convert them,
+        are the same as in the last export reuses the gdspy elements of the
+        last export.
+
+        Args:
+            table (geopandas.GeoDataFrame): Rows of QGeometry for one chip
+                                            and layer.
+
+        Returns:
+            pd.Series: The gdspy element of each row of table.
+        """
+        if not is_true(self.options.incremental) or table.empty:
+            return pd.Series(self._qgeometry_table_to_gds(table),
+                             index=table.index,
+                             dtype=object)
+
+        options_key = tuple(
+            str(self.options[name])
+            for name in ('corners', 'tolerance', 'precision', 'max_points',
+                         'width_LineString'))
+        # The index of table can have duplicates, so use positions.
+        elements = [None] * len(table)
+        missing = dict()
+        groups = table.groupby('component', sort=False, dropna=False).indices
+        for component, positions in groups.items():
+            key = (component, options_key,
+                   self._rows_digest(table.iloc[positions]))
+            converted = self._element_cache.get(key)
+            if converted is None:
+                missing[key] = positions
+            else:
+                for position, element in zip(positions, converted):
+                    elements[position] = element
+
+        # Convert the rows of all the changed components at once.
+        if missing:
+            positions = np.concatenate(list(missing.values()))
+            converted = self._qgeometry_table_to_gds(table.iloc[positions])
+            start = 0
+            for key, key_positions in missing.items():
+                stop = start + len(key_positions)
+                self._element_cache.set(key, converted[start:stop])
+                for position, element in zip(key_positions,
+                                             converted[start:stop]):
+                    elements[position] = element
+                start = stop
+
+        return pd.Series(elements, index=table.index, dtype=object)
+
+    @staticmethod
+    def _rows_digest(rows: geopandas.GeoDataFrame) -> str:
+        """Digest of the columns of QGeometry rows used by
+        _qgeometry_to_gds().
+
+        Args:
+            rows (geopandas.GeoDataFrame): Rows of QGeometry.
+
+        Returns:
+            str: Hex digest of geometry, layer, width and fillet.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for wkb in shapely.to_wkb(rows.geometry.values):
+            digest.update(wkb)
+        for column in ('layer', 'width', 'fillet'):
+            if column in rows:
+                digest.update(np.asarray(rows[column], dtype=float).tobytes())
+        return digest.hexdigest()
 
     # Handling Fillet issues.
 
@@ -780,17 +1118,25 @@ class QGDSRenderer(QRenderer):
         data_frame = self.chip_info[chip_name][chip_layer][
             all_sub_true_or_false]
         df_fillet = data_frame[-data_frame['fillet'].isnull()]
+        df_fillet = df_fillet[df_fillet.geometry.geom_type == 'LineString']
 
         if not df_fillet.empty:
+            # Find the short segments of all the LineStrings in one pass,
+            # then only split the ones that have any.
+            all_bad_idxs = bad_fillet_idxs_batch(
+                df_fillet.geometry, df_fillet.fillet,
+                self.design.template_options.PRECISION)
+
             # Don't edit the table when iterating through the rows.
             # Save info in dict and then edit the table.
             edit_index = dict()
-            for index, row in df_fillet.iterrows():
-                # print(
-                #     f'With parse_value: {self.parse_value(row.fillet)}, '
-                #     f'row.fillet: {row.fillet}')
+            for index, row, bad_idxs in zip(df_fillet.index,
+                                            df_fillet.itertuples(),
+                                            all_bad_idxs):
+                if not bad_idxs:
+                    continue
                 status, all_shapelys = self._check_length(
-                    row.geometry, row.fillet)
+                    row.geometry, row.fillet, bad_idxs)
                 if status > 0:
                     edit_index[index] = all_shapelys
 
@@ -813,8 +1159,10 @@ class QGDSRenderer(QRenderer):
             self.chip_info[chip_name][chip_layer][
                 all_sub_true_or_false] = df_copy.copy(deep=True)
 
-    def _check_length(self, a_shapely: shapely.geometry.LineString,
-                      a_fillet: float) -> Tuple[int, Dict]:
+    def _check_length(self,
+                      a_shapely: shapely.geometry.LineString,
+                      a_fillet: float,
+                      bad_idxs: list = None) -> Tuple[int, Dict]:
         """Determine if a_shapely has short segments based on scaled fillet
         value.
 
@@ -840,6 +1188,8 @@ class QGDSRenderer(QRenderer):
             a_shapely (shapely.geometry.LineString): A shapely object that
                                                     needs to be evaluated.
             a_fillet (float): From component developer.
+            bad_idxs (list): Vertices of a_shapely that cannot be fillet'd,
+                if already known. Defaults to None.
 
         Returns:
             Tuple[int, Dict]:
@@ -861,7 +1211,7 @@ class QGDSRenderer(QRenderer):
         all_idx_bad_fillet = dict()
 
         self._identify_vertex_not_to_fillet(coords, a_fillet,
-                                            all_idx_bad_fillet)
+                                            all_idx_bad_fillet, bad_idxs)
 
         shorter_lines = dict()
 
@@ -979,8 +1329,11 @@ class QGDSRenderer(QRenderer):
             shorter_lines[len_coords - 1] = a_shapely
         return status, shorter_lines
 
-    def _identify_vertex_not_to_fillet(self, coords: list, a_fillet: float,
-                                       all_idx_bad_fillet: dict):
+    def _identify_vertex_not_to_fillet(self,
+                                       coords: list,
+                                       a_fillet: float,
+                                       all_idx_bad_fillet: dict,
+                                       bad_idxs: list = None):
         """Use coords to denote segments that are too short.  In particular,
         when fillet'd, they will cause the appearance of incorrect fillet when
         graphed.
@@ -992,6 +1345,8 @@ class QGDSRenderer(QRenderer):
             a_fillet (float): The value provided by component developer.
             all_idx_bad_fillet (dict): An empty dict which will be
                                         populated by this method.
+            bad_idxs (list): Result of bad_fillet_idxs for coords, if
+                                        already computed. Defaults to None.
 
         Dictionary:
             Key 'reduced_idx' will hold list of tuples.
@@ -1015,7 +1370,11 @@ class QGDSRenderer(QRenderer):
         qdesign_precision = self.design.template_options.PRECISION
 
         all_idx_bad_fillet['reduced_idx'] = get_range_of_vertex_to_not_fillet(
-            coords, a_fillet, qdesign_precision, add_endpoints=True)
+            coords,
+            a_fillet,
+            qdesign_precision,
+            add_endpoints=True,
+            bad_idxs=bad_idxs)
 
         midpoints = list()
         midpoints = [
@@ -1152,8 +1511,9 @@ class QGDSRenderer(QRenderer):
                                      maxx: float, maxy: float, chip_name: str):
         """
         Apply airbridges to all `path` elements which have 
-        options.gds_make_airbridge = True. This is a 
-        wrapper for Airbridging.make_uniform_airbridging_df(...).
+        options.gds_make_airbridge = True. The placement is from
+        Airbridging.find_all_uniform_ab_placements(...), and each airbridge
+        is a gdspy.CellReference to one cell, TOP_{chip_name}_ab_bridge.
 
         Args:
             minx (float): Chip minimum x location.
@@ -1171,13 +1531,11 @@ class QGDSRenderer(QRenderer):
         # gdspy objects
         top_cell = self.lib.cells[f'TOP_{chip_name}']
         lib_cell = self.lib.new_cell(f'TOP_{chip_name}_ab')
+        top_cell.add(gdspy.CellReference(lib_cell))
         datatype = int(self.parse_value(self.options.airbridge.datatype))
         no_cheese_buffer = float(self.parse_value(
             self.options.no_cheese.buffer))
 
-        # Airbridge Options
-        self.options.airbridge.qcomponent_base
-        self.options.airbridge.options
         airbridging = Airbridging(design=self.design,
                                   lib=self.lib,
                                   minx=minx,
@@ -1186,27 +1544,34 @@ class QGDSRenderer(QRenderer):
                                   maxy=maxy,
                                   chip_name=chip_name,
                                   precision=self.options.precision)
-        airbridges_df = airbridging.make_uniform_airbridging_df(
+        ab_qgeom = airbridging.extract_qgeom_from_unrendered_qcomp(
             custom_qcomponent=self.options.airbridge.geometry.qcomponent_base,
-            qcomponent_options=self.options.airbridge.geometry.options,
-            bridge_pitch=self.options.airbridge.bridge_pitch,
-            bridge_minimum_spacing=self.options.airbridge.bridge_minimum_spacing
-        )
-
-        # Get all MultiPolygons and render to gds file
-        ladf = len(airbridges_df)
-        print(f'Num AB = {len(airbridges_df)}')
-        for _, row in airbridges_df.iterrows():
-            ab_component_multi_poly = row['MultiPoly'] 
-            ab_component_layer = row['layer']
-            airbridge_gds = self._multipolygon_to_gds(
-                multi_poly=ab_component_multi_poly,
-                layer=ab_component_layer,
-                data_type=datatype,
-                no_cheese_buffer=no_cheese_buffer)
-
-            lib_cell.add(airbridge_gds)
-        top_cell.add(gdspy.CellReference(lib_cell))
+            qcomponent_options=self.options.airbridge.geometry.options)
+        ab_placement = airbridging.find_all_uniform_ab_placements(
+            bridge_pitch=self.design.parse_value(
+                self.options.airbridge.bridge_pitch),
+            bridge_minimum_spacing=self.design.parse_value(
+                self.options.airbridge.bridge_minimum_spacing))
+        self.logger.debug(
+            f'Num AB = {len(ab_placement) * len(ab_qgeom)} on {chip_name}')
+        if len(ab_placement) == 0:
+            return
+
+        # One airbridge is rendered at the origin, unrotated.  Each airbridge
+        # is a reference to it, rotated as in Airbridging.ab_placement_to_df.
+        bridge_cell = self.lib.new_cell(f'TOP_{chip_name}_ab_bridge')
+        for _, row in ab_qgeom.iterrows():
+            bridge_cell.add(
+                self._multipolygon_to_gds(
+                    multi_poly=shapely.geometry.MultiPolygon([row['geometry']]),
+                    layer=row['layer'],
+                    data_type=datatype,
+                    no_cheese_buffer=no_cheese_buffer))
+
+        lib_cell.add([
+            gdspy.CellReference(bridge_cell, (x, y), rotation=theta + 90)
+            for x, y, theta in ab_placement.tolist()
+        ])
 
     ### End of Airbridging
 
@@ -1394,6 +1759,27 @@ class QGDSRenderer(QRenderer):
         is_neg_mask = self._is_negative_mask(chip_name, chip_layer)
         fab = is_true(self.options.fabricate)
 
+        # With options.incremental, the masks and booleans of the cheese are
+        # reused if the ground, the keepout and the options are unchanged.
+        incremental = is_true(self.options.incremental)
+        cached = None
+        if incremental:
+            ground_cell = self.lib.cells.get(f'ground_{chip_name}_{chip_layer}')
+            ground = [] if ground_cell is None else ground_cell.get_polygons(
+                depth=0)
+            keepout = [
+                points for gds in all_nocheese_gds for points in gds.polygons
+            ]
+            hole_size = tuple(
+                float(self.parse_value(self.options.cheese[name]))
+                for name in ('cheese_0_x', 'cheese_0_y', 'cheese_1_radius'))
+            cheese_key = self._job_digest(
+                (ground, keepout, chip_name, chip_layer, minx, miny, maxx, maxy,
+                 edge_nocheese, is_neg_mask, cheese_sub_layer,
+                 nocheese_sub_layer, max_points, precision, self._backend,
+                 cheese_shape, hole_size, delta_x, delta_y))
+            cached = self._cheese_cache.get(cheese_key)
+
         if cheese_shape == 0:
             cheese_x = float(self.parse_value(self.options.cheese.cheese_0_x))
             cheese_y = float(self.parse_value(self.options.cheese.cheese_0_y))
@@ -1414,11 +1800,13 @@ class QGDSRenderer(QRenderer):
                                 self.logger,
                                 max_points,
                                 precision,
+                                backend=self._backend,
                                 cheese_shape=cheese_shape,
                                 shape_0_x=cheese_x,
                                 shape_0_y=cheese_y,
                                 delta_x=delta_x,
-                                delta_y=delta_y)
+                                delta_y=delta_y,
+                                cached=cached)
         elif cheese_shape == 1:
             cheese_radius = float(
                 self.parse_value(self.options.cheese.cheese_1_radius))
@@ -1439,10 +1827,12 @@ class QGDSRenderer(QRenderer):
                                 self.logger,
                                 max_points,
                                 precision,
+                                backend=self._backend,
                                 cheese_shape=cheese_shape,
                                 shape_1_radius=cheese_radius,
                                 delta_x=delta_x,
-                                delta_y=delta_y)
+                                delta_y=delta_y,
+                                cached=cached)
         else:
             self.logger.warning(
                 f'The cheese_shape={cheese_shape} is unknown in QGDSRenderer.')
@@ -1450,6 +1840,8 @@ class QGDSRenderer(QRenderer):
 
         if a_cheese is not None:
             dummy_a_lib = a_cheese.apply_cheesing()
+            if incremental:
+                self._cheese_cache.set(cheese_key, a_cheese.computed)
 
     def _populate_no_cheese(self):
         """Iterate through every chip and layer.  If options choose to have
@@ -1559,7 +1951,7 @@ class QGDSRenderer(QRenderer):
         # print(f'{path_sub_df.keys()=}')
 
         path_sub_fillet = path_sub_df['fillet'].tolist()
-        
+
         #for n in range(len(path_sub_geo)):
         for index, _ in enumerate(path_sub_geo):
             # print(f'{index}, {path_sub_fillet[index]=}')
@@ -1609,7 +2001,7 @@ class QGDSRenderer(QRenderer):
                 path_sub_width[index] / 2,
                 cap_style=style_cap,
                 join_style=style_join)
-            
+
 
         #  Need to add buffer_size, cap style, and join style to default options
         combo_list = path_sub_geo + poly_sub_geo
@@ -1686,6 +2078,9 @@ class QGDSRenderer(QRenderer):
         lib = self.new_gds_library()
 
         if is_true(self.options.ground_plane):
+            self._ground_booleans = self._run_ground_plane_booleans(
+                precision, max_points)
+
             all_chips_top_name = 'TOP'
             all_chips_top = lib.new_cell(all_chips_top_name,
                                          overwrite_duplicate=True)
@@ -1714,6 +2109,231 @@ class QGDSRenderer(QRenderer):
                 else:
                     lib.remove(chip_only_top)
 
+            self._ground_booleans.clear()
+
+    @staticmethod
+    def _get_polygons(elements: list) -> list:
+        """Convert gdspy elements, both polygons and FlexPaths, to the
+        list of polygon points, as Cell.get_polygons() does.
+
+        Args:
+            elements (list): gdspy elements.
+
+        Returns:
+            list: Points of every polygon.
+        """
+        # The cell is not added to the library.
+        a_cell = gdspy.Cell('_get_polygons', exclude_from_current=True)
+        a_cell.add(elements)
+        return a_cell.get_polygons()
+
+    @staticmethod
+    def _make_tiles(bounds: tuple, tile_size: float) -> np.ndarray:
+        """Cut bounds into a grid of tiles of tile_size. The tiles on the
+        right and top edges are smaller if bounds is not a multiple of
+        tile_size.
+
+        Args:
+            bounds (tuple): minx, miny, maxx, maxy to cover.
+            tile_size (float): Length of the side of a tile.
+
+        Returns:
+            np.ndarray: (N, 4) minx, miny, maxx, maxy of every tile.
+        """
+        minx, miny, maxx, maxy = bounds
+        edges = []
+        for low, high in ((minx, maxx), (miny, maxy)):
+            num = max(int(np.ceil((high - low) / tile_size)), 1)
+            edges.append(np.append(low + tile_size * np.arange(num), high))
+        x_0, y_0 = np.meshgrid(edges[0][:-1], edges[1][:-1], indexing='ij')
+        x_1, y_1 = np.meshgrid(edges[0][1:], edges[1][1:], indexing='ij')
+        return np.column_stack(
+            (x_0.ravel(), y_0.ravel(), x_1.ravel(), y_1.ravel()))
+
+    @staticmethod
+    def _polygons_by_tile(polygons: list, tiles: np.ndarray) -> list:
+        """Find, with a spatial index, the polygons that intersect each tile.
+
+        Args:
+            polygons (list): Points of every polygon.
+            tiles (np.ndarray): (N, 4) bounds of every tile.
+
+        Returns:
+            list: For every tile, the list of polygons that intersect it.
+        """
+        by_tile = [[] for _ in range(len(tiles))]
+        if not polygons:
+            return by_tile
+        poly_bounds = np.array([
+            np.concatenate((points.min(axis=0), points.max(axis=0)))
+            for points in polygons
+        ])
+        tree = shapely.STRtree(shapely.box(*poly_bounds.T))
+        tile_idx, poly_idx = tree.query(shapely.box(*tiles.T),
+                                        predicate='intersects')
+        for i_tile, i_poly in zip(tile_idx, poly_idx):
+            by_tile[i_tile].append(polygons[i_poly])
+        return by_tile
+
+    def _ground_plane_jobs(self, precision: float, max_points: int) -> list:
+        """Gather the operands of the ground plane boolean for every chip
+        and layer that has subtract geometry.
+
+        For a negative mask, the difference is subtract=True minus
+        subtract=False geometry.  For a positive mask, the difference is the
+        chip rectangle minus the subtract=True geometry.
+
+        If options.ground_plane_tile_size is not 0, there is one job for
+        each tile of the chip and layer, which only has the shapes that
+        intersect the tile.
+
+        Args:
+            precision (float): Used for gdspy.
+            max_points (int): Used for gdspy. GDSpy uses 199 as the default.
+
+        Returns:
+            list: Tuples of (chip_name, chip_layer) and the job
+            for _boolean_not.
+        """
+        tile_size = float(self.parse_value(self.options.ground_plane_tile_size))
+
+        jobs = []
+        for chip_name in self.chip_info:
+            layers_in_chip, rectangle_points = self._get_rectangle_points(
+                chip_name)
+            for chip_layer in layers_in_chip:
+                layer_info = self.chip_info[chip_name][chip_layer]
+                if len(layer_info['q_subtract_true']) == 0:
+                    continue
+                key = (chip_name, chip_layer)
+                subtract_true = self._get_polygons(
+                    layer_info['q_subtract_true'])
+                negative = self._is_negative_mask(chip_name, chip_layer)
+                if negative:
+                    operand_b = self._get_polygons(
+                        layer_info['q_subtract_false'])
+                else:
+                    operand_b = subtract_true
+
+                if tile_size <= 0:
+                    if negative:
+                        operand_a = subtract_true
+                    else:
+                        operand_a = gdspy.Polygon(rectangle_points, chip_layer)
+                    jobs.append((key, (operand_a, operand_b, chip_layer,
+                                       precision, max_points, None)))
+                    continue
+
+                if negative:
+                    all_points = np.concatenate(subtract_true)
+                    bounds = (*all_points.min(axis=0), *all_points.max(axis=0))
+                else:
+                    bounds = (*rectangle_points[0], *rectangle_points[2])
+                tiles = self._make_tiles(bounds, tile_size)
+                operand_b_by_tile = self._polygons_by_tile(operand_b, tiles)
+
+                if negative:
+                    operand_a_by_tile = self._polygons_by_tile(
+                        subtract_true, tiles)
+                    for tile, operand_a, tile_b in zip(tiles, operand_a_by_tile,
+                                                       operand_b_by_tile):
+                        if operand_a:
+                            jobs.append(
+                                (key, (operand_a, tile_b, chip_layer, precision,
+                                       max_points, tuple(tile))))
+                else:
+                    for tile, tile_b in zip(tiles, operand_b_by_tile):
+                        operand_a = gdspy.Rectangle(tile[:2],
+                                                    tile[2:],
+                                                    layer=chip_layer)
+                        jobs.append((key, (operand_a, tile_b, chip_layer,
+                                           precision, max_points, None)))
+        return jobs
+
+    def _run_ground_plane_booleans(self, precision: float,
+                                   max_points: int) -> dict:
+        """Compute the ground plane boolean of every chip and layer.  The
+        chips, layers and tiles are independent, so with options.workers
+        other than 1, they are computed in separate processes.
+
+        Args:
+            precision (float): Used for gdspy.
+            max_points (int): Used for gdspy. GDSpy uses 199 as the default.
+
+        Returns:
+            dict: Key is (chip_name, chip_layer), value is the result of
+            gdspy.boolean.  The polygons of all the tiles of a chip and layer
+            are gathered in one PolygonSet.
+        """
+        jobs = self._ground_plane_jobs(precision, max_points)
+        workers = int(self.parse_value(self.options.workers))
+
+        # With options.incremental, only the jobs whose operands changed
+        # since the last export are computed.
+        incremental = is_true(self.options.incremental)
+        if incremental:
+            job_keys = [self._job_digest(job) for _, job in jobs]
+            diffs = [self._boolean_cache.get(key, False) for key in job_keys]
+        else:
+            diffs = [False] * len(jobs)
+        todo = [index for index, diff in enumerate(diffs) if diff is False]
+        todo_jobs = [jobs[index][1] for index in todo]
+
+        boolean_not = partial(_boolean_not, backend=self._backend)
+        if workers == 1 or len(todo_jobs) < 2:
+            todo_diffs = [boolean_not(job) for job in todo_jobs]
+        else:
+            workers = min(workers or os.cpu_count() or 1, len(todo_jobs))
+            chunksize = max(len(todo_jobs) // (4 * workers), 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                todo_diffs = list(
+                    executor.map(boolean_not, todo_jobs, chunksize=chunksize))
+
+        for index, diff in zip(todo, todo_diffs):
+            diffs[index] = diff
+            if incremental:
+                self._boolean_cache.set(job_keys[index], diff)
+
+        by_key = dict()
+        for (key, _), diff in zip(jobs, diffs):
+            by_key.setdefault(key, []).append(diff)
+
+        results = dict()
+        for key, key_diffs in by_key.items():
+            key_diffs = [diff for diff in key_diffs if diff is not None]
+            if len(key_diffs) <= 1:
+                results[key] = key_diffs[0] if key_diffs else None
+            else:
+                results[key] = gdspy.PolygonSet(
+                    [poly for diff in key_diffs for poly in diff.polygons],
+                    layer=key[1])
+        return results
+
+    @staticmethod
+    def _job_digest(job: tuple) -> tuple:
+        """Key of a job of _boolean_not() in the cache of booleans.  Also the
+        key of the cheese of a chip and layer, from its ground and keepout.
+
+        Args:
+            job (tuple): operand_a, operand_b, layer, precision, max_points and
+                        clip_box.  Any hashable values can follow the two
+                        operands.
+
+        Returns:
+            tuple: Hex digest of the polygons of the operands, and the rest of
+            the job.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for operand in job[:2]:
+            if isinstance(operand, gdspy.PolygonSet):
+                operand = operand.polygons
+            digest.update(len(operand).to_bytes(8, 'little'))
+            for points in operand:
+                points = np.ascontiguousarray(points, dtype=float)
+                digest.update(len(points).to_bytes(8, 'little'))
+                digest.update(points.tobytes())
+        return (digest.hexdigest(), *job[2:])
+
     def _handle_photo_resist(self, lib: gdspy.GdsLibrary,
                              chip_only_top: gdspy.library.Cell, chip_name: str,
                              chip_layer: int, rectangle_points: list,
@@ -1779,30 +2399,8 @@ class QGDSRenderer(QRenderer):
         """
         if len(self.chip_info[chip_name][chip_layer]['q_subtract_true']) != 0:
 
-            # When subtract==True for chip and layer.
-            subtract_true_cell_name = f'SUBTRACT_true_{chip_name}_{chip_layer}'
-            subtract_true_cell = lib.new_cell(subtract_true_cell_name,
-                                              overwrite_duplicate=True)
-            subtract_true_cell.add(
-                self.chip_info[chip_name][chip_layer]['q_subtract_true'])
-
-            #When subtract==False for chip and layer.
-            subtract_false_cell_name = f'SUBTRACT_false_{chip_name}_{chip_layer}'
-            subtract_false_cell = lib.new_cell(subtract_false_cell_name,
-                                               overwrite_duplicate=True)
-            subtract_false_cell.add(
-                self.chip_info[chip_name][chip_layer]['q_subtract_false'])
-
-            # Difference for True-False.
-            diff_geometry = gdspy.boolean(subtract_true_cell.get_polygons(),
-                                          subtract_false_cell.get_polygons(),
-                                          'not',
-                                          max_points=max_points,
-                                          precision=precision,
-                                          layer=chip_layer)
-
-            lib.remove(subtract_true_cell)
-            lib.remove(subtract_false_cell)
+            # Difference for True-False, from _run_ground_plane_booleans.
+            diff_geometry = self._ground_booleans[(chip_name, chip_layer)]
 
             if diff_geometry is None:
                 self.design.logger.warning(
@@ -1829,27 +2427,9 @@ class QGDSRenderer(QRenderer):
             max_points (int): Used for gdspy. GDSpy uses 199 as the default.
         """
         if len(self.chip_info[chip_name][chip_layer]['q_subtract_true']) != 0:
-            subtract_cell_name = f'SUBTRACT_{chip_name}_{chip_layer}'
-            subtract_cell = lib.new_cell(subtract_cell_name,
-                                         overwrite_duplicate=True)
-            subtract_cell.add(
-                self.chip_info[chip_name][chip_layer]['q_subtract_true'])
-
-            # gdspy.boolean() is not documented clearly.  If there are multiple
-            # elements to subtract (both poly & path), the way I could
-            # make it work is to put them into a cell, within lib. I used
-            # the method cell_name.get_polygons(), which appears to convert
-            # all elements within the cell to poly. After the boolean(),
-            # I deleted the cell from lib. The memory is freed up then.
-            diff_geometry = gdspy.boolean(
-                self.chip_info[chip_name]['subtract_poly'],
-                subtract_cell.get_polygons(),
-                'not',
-                max_points=max_points,
-                precision=precision,
-                layer=chip_layer)
-
-            lib.remove(subtract_cell)
+            # The subtract_poly minus the subtract geometry,
+            # from _run_ground_plane_booleans.
+            diff_geometry = self._ground_booleans[(chip_name, chip_layer)]
 
             if diff_geometry is None:
                 self.design.logger.warning(
@@ -2002,6 +2582,84 @@ class QGDSRenderer(QRenderer):
 
         return rotation, center, pad_left, pad_right
 
+    def _junction_placements(self, table: pd.DataFrame,
+                             lib: gdspy.GdsLibrary) -> dict:
+        """Vectorized _give_rotation_center_twopads() for all the rows of the
+        junction table whose gds_cell_name is in lib.  Each cell is extracted
+        from lib once.
+
+        Args:
+            table (pd.DataFrame): Junction table of QGeometry for a chip.
+            lib (gdspy.GdsLibrary): The library with the imported junctions.
+
+        Returns:
+            dict: Key is (component, name) of the row.  Value is a tuple of the
+            extracted cell, then the rotation, center, pad_left and
+            pad_right, as returned by _give_rotation_center_twopads().
+        """
+        # pylint: disable=too-many-locals
+        rows = table[table['gds_cell_name'].isin(lib.cells.keys())]
+        if rows.empty:
+            return dict()
+
+        junction_pad_overlap = float(
+            self.parse_value(self.options.junction_pad_overlap))
+        precision = float(self.parse_value(self.options.precision))
+        for_rounding = int(np.abs(np.log10(precision)))
+
+        cells = {
+            name: lib.extract(name) for name in rows['gds_cell_name'].unique()
+        }
+        bounds = {name: cell.get_bounding_box() for name, cell in cells.items()}
+        names = rows['gds_cell_name'].tolist()
+        (jj_minx, jj_miny), (jj_maxx, jj_maxy) = np.array(
+            [bounds[name] for name in names]).transpose(1, 2, 0)
+
+        ends = shapely.get_coordinates(rows.geometry.values).reshape(-1, 2, 2)
+        delta = ends[:, 1] - ends[:, 0]
+        centers = (ends[:, 0] + ends[:, 1]) / 2
+        rotations = np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+        magnitudes = np.round(np.sqrt((delta**2).sum(axis=1)), for_rounding)
+
+        jj_x_width = np.abs(jj_maxx - jj_minx)
+        jj_y_height = np.abs(jj_maxy - jj_miny)
+        jj_center_y = (jj_y_height / 2) + jj_miny
+        pad_height = rows['width'].to_numpy(dtype=float)
+        pad_miny = jj_center_y - (pad_height / 2)
+        pad_x_size_minus_overlap = (magnitudes - jj_x_width) / 2
+        has_pads = jj_x_width < magnitudes
+        layers = rows['layer'].to_numpy(dtype=int)
+
+        placements = dict()
+        for idx, row in enumerate(rows.itertuples()):
+            if pad_height[idx] < jj_y_height[idx]:
+                # pylint: disable=protected-access
+                text_id = self.design._components[row.component]._name
+                self.logger.warning(
+                    f'In junction table, component={text_id} with name={row.name} '
+                    f'has width={row.width} smaller than cell dimension='
+                    f'{jj_y_height[idx]}.')
+
+            pad_left = None
+            pad_right = None
+            if has_pads[idx]:
+                pad_left = gdspy.Rectangle(
+                    (jj_minx[idx] - pad_x_size_minus_overlap[idx],
+                     pad_miny[idx]), (jj_minx[idx] + junction_pad_overlap,
+                                      pad_miny[idx] + pad_height[idx]),
+                    layer=int(layers[idx]),
+                    datatype=10)
+                pad_right = gdspy.Rectangle(
+                    (jj_maxx[idx] - junction_pad_overlap, pad_miny[idx]),
+                    (jj_maxx[idx] + pad_x_size_minus_overlap[idx],
+                     pad_miny[idx] + pad_height[idx]),
+                    layer=int(layers[idx]),
+                    datatype=10)
+            placements[(row.component,
+                        row.name)] = (cells[names[idx]], rotations[idx],
+                                      tuple(centers[idx]), pad_left, pad_right)
+        return placements
+
 
 ############
 
@@ -2026,7 +2684,9 @@ class QGDSRenderer(QRenderer):
             return True
 
         if os.path.isfile(self.options.path_filename):
-            lib.read_gds(self.options.path_filename, units='convert')
+            lib.add(_read_junction_cells(self.options.path_filename, lib.unit,
+                                         lib.precision),
+                    overwrite_duplicate=True)
             self.imported_junction_gds = self.options.path_filename
             return True
         else:
@@ -2069,6 +2729,9 @@ class QGDSRenderer(QRenderer):
         if self._import_junction_gds_file(lib=lib,
                                           directory_name=directory_name):
 
+            placements = self._junction_placements(
+                self.chip_info[chip_name]['junction'], lib)
+
             for iter_layer in layers_in_chip:
                 if self._is_negative_mask(chip_name, iter_layer):
                     # Want to export negative mask
@@ -2092,7 +2755,7 @@ class QGDSRenderer(QRenderer):
                             self._add_negative_extension_to_jj(
                                 chip_name, iter_layer, lib, chip_only_top,
                                 chip_only_top_layer, hold_all_pads_cell,
-                                hold_all_jj_cell)
+                                hold_all_jj_cell, placements)
                 else:
                     # By default, make a positive mask.
                     for row in self.chip_info[chip_name]['junction'].itertuples(
@@ -2107,7 +2770,8 @@ class QGDSRenderer(QRenderer):
                             if row.gds_cell_name in lib.cells.keys():
                                 # When positive mask, just add the pads to chip_only_top
                                 self._add_positive_extension_to_jj(
-                                    lib, row, chip_layer_cell)
+                                    lib, row, chip_layer_cell,
+                                    placements.get((row.component, row.name)))
                             else:
                                 self.logger.warning(
                                     f'From the "junction" table, the cell named'
@@ -2115,12 +2779,15 @@ class QGDSRenderer(QRenderer):
                                     f'file: {self.options.path_filename}.'
                                     f' The cell was not used.')
 
-    def _add_negative_extension_to_jj(self, chip_name: str, jj_layer: int,
+    def _add_negative_extension_to_jj(self,
+                                      chip_name: str,
+                                      jj_layer: int,
                                       lib: gdspy.library,
                                       chip_only_top: gdspy.library.Cell,
                                       chip_only_top_layer: gdspy.library.Cell,
                                       hold_all_pads_cell: gdspy.library.Cell,
-                                      hold_all_jj_cell: gdspy.library.Cell):
+                                      hold_all_jj_cell: gdspy.library.Cell,
+                                      placements: dict = None):
         """Manipulate existing geometries for the layer that the junctions need
          to be added.  Since boolean subtraction is computationally intensive,
          the method will gather the pads for a layer, and do the boolean just
@@ -2136,7 +2803,11 @@ class QGDSRenderer(QRenderer):
                                                     with specific layer.
             hold_all_pads_cell (gdspy.library.Cell): Collect all the pads with movement.
             hold_all_jj_cell (gdspy.library.Cell): Collect all the jj's with movement.
+            placements (dict): From _junction_placements(), by (component,
+                            name) of the junction table.  Defaults to None.
         """
+        if placements is None:
+            placements = dict()
 
         boolean_by_layer = self.chip_info[chip_name]['junction'][
             'layer'] == jj_layer
@@ -2146,9 +2817,9 @@ class QGDSRenderer(QRenderer):
             if row.gds_cell_name in lib.cells.keys():
                 # For negative mask, collect the pads to subtract per layer,
                 # and subtract from chip_only_top_layer
-                self._gather_negative_extension_for_jj(lib, row,
-                                                       hold_all_pads_cell,
-                                                       hold_all_jj_cell)
+                self._gather_negative_extension_for_jj(
+                    lib, row, hold_all_pads_cell, hold_all_jj_cell,
+                    placements.get((row.component, row.name)))
             else:
                 self.logger.warning(
                     f'From the "junction" table, the cell named'
@@ -2167,11 +2838,13 @@ class QGDSRenderer(QRenderer):
         # Make sure  the pads to hold_all_pads_cell is not empty
 
         if chip_only_top_layer.get_bounding_box() is not None:
-            jj_minus_pads = gdspy.boolean(chip_only_top_layer.get_polygons(),
-                                          hold_all_pads_cell.get_polygons(),
-                                          'not',
-                                          max_points=max_points,
-                                          precision=precision)
+            jj_minus_pads = gds_backend.boolean(
+                chip_only_top_layer.get_polygons(),
+                hold_all_pads_cell.get_polygons(),
+                'not',
+                max_points=max_points,
+                precision=precision,
+                backend=self._backend)
             diff_pad_cell_layer.add(jj_minus_pads)
         if hold_all_jj_cell.get_bounding_box() is not None:
             diff_pad_cell_layer.add(gdspy.CellReference(hold_all_jj_cell))
@@ -2209,9 +2882,12 @@ class QGDSRenderer(QRenderer):
         lib.remove(hold_all_pads_cell)
 
     def _gather_negative_extension_for_jj(
-            self, lib: gdspy.library, row: 'pd.core.frame.Pandas',
+            self,
+            lib: gdspy.library,
+            row: 'pd.core.frame.Pandas',
             hold_all_pads_cell: gdspy.library.Cell,
-            hold_all_jj_cell: gdspy.library.Cell):
+            hold_all_jj_cell: gdspy.library.Cell,
+            placement: tuple = None):
         """Gather the pads and jjs and put them in separate cells.  The
         the pads can be boolean'd 'not' just once. After boolean for pads, then
         the jjs will be added to result.  The boolean is very
@@ -2222,13 +2898,15 @@ class QGDSRenderer(QRenderer):
             row (pd.core.frame.Pandas): Each row is from the qgeometry junction table.
             hold_all_pads_cell (gdspy.library.Cell): Collect all the pads with movement.
             hold_all_jj_cell (gdspy.library.Cell): Collect all the jj's with movement.
+            placement (tuple): The row from _junction_placements().  If None,
+                            it is calculated.  Defaults to None.
         """
-
-        a_cell = lib.extract(row.gds_cell_name)
-        a_cell_bounding_box = a_cell.get_bounding_box()
-
-        rotation, center, pad_left, pad_right = self._give_rotation_center_twopads(
-            row, a_cell_bounding_box)
+        if placement is None:
+            a_cell = lib.extract(row.gds_cell_name)
+            rotation, center, pad_left, pad_right = self._give_rotation_center_twopads(
+                row, a_cell.get_bounding_box())
+        else:
+            a_cell, rotation, center, pad_left, pad_right = placement
 
         # String for JJ combined with pad Right and pad Left
         jj_pad_r_l_name = f'{row.gds_cell_name}_QComponent_is_{row.component}_Name_is_{row.name}_name_is_{row.name}'
@@ -2244,9 +2922,11 @@ class QGDSRenderer(QRenderer):
         hold_all_pads_cell.add(
             gdspy.CellReference(temp_cell, origin=center, rotation=rotation))
 
-    def _add_positive_extension_to_jj(self, lib: gdspy.library,
+    def _add_positive_extension_to_jj(self,
+                                      lib: gdspy.library,
                                       row: 'pd.core.frame.Pandas',
-                                      chip_only_top_layer: gdspy.library.Cell):
+                                      chip_only_top_layer: gdspy.library.Cell,
+                                      placement: tuple = None):
         """Get the extension pads, then add or subtract to extracted cell based on
         positive or negative mask.
 
@@ -2256,12 +2936,15 @@ class QGDSRenderer(QRenderer):
                                             junction table.
             chip_only_top_layer (gdspy.library.Cell): The cell used for
                                             chip_name and layer_num.
+            placement (tuple): The row from _junction_placements().  If None,
+                            it is calculated.  Defaults to None.
         """
-        a_cell = lib.extract(row.gds_cell_name)
-        a_cell_bounding_box = a_cell.get_bounding_box()
-
-        rotation, center, pad_left, pad_right = self._give_rotation_center_twopads(
-            row, a_cell_bounding_box)
+        if placement is None:
+            a_cell = lib.extract(row.gds_cell_name)
+            rotation, center, pad_left, pad_right = self._give_rotation_center_twopads(
+                row, a_cell.get_bounding_box())
+        else:
+            a_cell, rotation, center, pad_left, pad_right = placement
 
         # String for JJ combined with pad Right and pad Left
         jj_pad_r_l_name = f'pads_{row.gds_cell_name}_QComponent_is_{row.component}_name_is_{row.name}'
@@ -2325,32 +3008,105 @@ class QGDSRenderer(QRenderer):
         # if imported, hold the path to file name, otherwise None.
         self.imported_junction_gds = None
 
-        if self._create_qgeometry_for_gds(highlight_qcomponents) == 0:
-            # Create self.lib and populate path and poly.
-            self._populate_poly_path_for_export()
-
-            # Adds airbridges to CPWs w/ options.gds_make_airbridge = True
-            # Options for these airbridges are in self.options.airbridge
-            if self.options.make_airbridges:
-                self._populate_airbridge()
+        self._backend = gds_backend.check_backend(self.options.backend,
+                                                  self.logger)
 
-            # Add no-cheese MultiPolygon to
-            # self.chip_info[chip_name][chip_layer]['no_cheese'],
-            # if self.options requests the layer.
-            self._populate_no_cheese()
+        if not is_true(self.options.incremental):
+            self._element_cache.clear()
+            self._boolean_cache.clear()
+            self._cheese_cache.clear()
 
-            # Use self.options  to decide what to put for export
-            # into self.chip_info[chip_name][chip_layer]['cheese'].
-            # Not finished.
-            self._populate_cheese()
+        if self._create_qgeometry_for_gds(highlight_qcomponents) == 0:
+            if is_true(self.options.stream):
+                self._stream_to_gds(file_name)
+            else:
+                self._populate_lib()
 
-            # Export the file to disk from self.lib
-            self.lib.write_gds(file_name)
+                # Export the file to disk from self.lib
+                gds_backend.write_gds(self.lib, file_name, self._backend)
 
+            self._element_cache.end_export()
+            self._boolean_cache.end_export()
+            self._cheese_cache.end_export()
             return 1
 
         return 0
 
+    def _populate_lib(self):
+        """Create self.lib and populate it with every chip in
+        self.chip_info."""
+        # Create self.lib and populate path and poly.
+        self._populate_poly_path_for_export()
+
+        # Adds airbridges to CPWs w/ options.gds_make_airbridge = True
+        # Options for these airbridges are in self.options.airbridge
+        if self.options.make_airbridges:
+            self._populate_airbridge()
+
+        # Add no-cheese MultiPolygon to
+        # self.chip_info[chip_name][chip_layer]['no_cheese'],
+        # if self.options requests the layer.
+        self._populate_no_cheese()
+
+        # Use self.options  to decide what to put for export
+        # into self.chip_info[chip_name][chip_layer]['cheese'].
+        # Not finished.
+        self._populate_cheese()
+
+    def _stream_to_gds(self, file_name: str):
+        """Write the chips to file_name one at a time.
+
+        Each chip is populated into its own library, its cells are written
+        with gdspy.GdsWriter, then the library and the chip's entry in
+        self.chip_info are freed before the next chip.  Cells with the same
+        name in more than one chip, such as the imported junctions, are
+        written once.  The TOP cell is written last, and references the
+        chips by name.
+
+        Args:
+            file_name (str): File name which can also include directory path.
+                             If the file exists, it will be overwritten.
+        """
+        self._update_units()
+        writer = gdspy.GdsWriter(
+            file_name,
+            unit=float(self.parse_value(self.options.gds_unit)),
+            precision=float(self.parse_value(self.options.precision)))
+
+        all_chip_info = dict(self.chip_info)
+        written = set()
+        chip_top_names = []
+        try:
+            for chip_name in list(all_chip_info):
+                self.chip_info.clear()
+                self.chip_info[chip_name] = all_chip_info.pop(chip_name)
+                # The junction file is imported again into the new library.
+                self.imported_junction_gds = None
+
+                self._populate_lib()
+
+                top_cell = self.lib.cells.pop('TOP', None)
+                if top_cell is not None:
+                    chip_top_names.extend(
+                        ref.ref_cell.name for ref in top_cell.references)
+
+                for cell_name, cell in self.lib.cells.items():
+                    if cell_name not in written:
+                        writer.write_cell(cell)
+                        written.add(cell_name)
+
+            # Frees the library of the last chip.  The chips are on disk, so
+            # TOP references empty cells which only carry their names.
+            self.chip_info.clear()
+            top_cell = self.new_gds_library().new_cell('TOP')
+            top_cell.add([
+                gdspy.CellReference(gdspy.Cell(name, exclude_from_current=True))
+                for name in chip_top_names
+            ])
+            writer.write_cell(top_cell)
+        finally:
+            writer.close()
+
     def _multipolygon_to_gds(
             self, multi_poly: shapely.geometry.multipolygon.MultiPolygon,
             layer: int, data_type: int, no_cheese_buffer: float) -> list:
@@ -2390,13 +3146,14 @@ class QGDSRenderer(QRenderer):
                 a_poly_set = gdspy.PolygonSet(all_interiors,
                                               layer=layer,
                                               datatype=data_type)
-                a_poly = gdspy.boolean(exterior_poly,
-                                       a_poly_set,
-                                       'not',
-                                       max_points=max_points,
-                                       layer=layer,
-                                       datatype=data_type,
-                                       precision=precision)
+                a_poly = gds_backend.boolean(exterior_poly,
+                                             a_poly_set,
+                                             'not',
+                                             max_points=max_points,
+                                             layer=layer,
+                                             datatype=data_type,
+                                             precision=precision,
+                                             backend=self._backend)
                 # Poly fracturing leading to a funny shape. Leave this out of gds output for now.
                 # a_poly.fillet(no_cheese_buffer,
                 #               points_per_2pi=128,
@@ -2442,106 +3199,131 @@ class QGDSRenderer(QRenderer):
             https://gdspy.readthedocs.io/en/stable/reference.html#polygon
         """
 
+        return self._qgeometry_table_to_gds(qgeometry_element.to_frame().T)[0]
+
+    def _qgeometry_table_to_gds(self, table: pd.DataFrame) -> list:
+        """Table level version of _qgeometry_to_gds().  The options are
+        parsed once, and the coordinates of every row are taken from shapely
+        in one call.  Polygons without holes only need fracture when they
+        have more than max_points vertices.
+
+        Args:
+            table (pd.DataFrame): Rows of the design.qgeometry tables.
+
+        Returns:
+            list: For each row, the gdspy.Polygon, gdspy.PolygonSet or
+            gdspy.FlexPath.  None if the row was not converted.
+        """
         # pylint: disable=too-many-locals
 
         corners = self.options.corners
         tolerance = self.parse_value(self.options.tolerance)
         precision = self.parse_value(self.options.precision)
         max_points = int(self.parse_value(self.options.max_points))
+        width_linestring = self.parse_value(self.options.width_LineString)
+
+        geoms = np.asarray(table['geometry'], dtype=object)
+        type_ids = shapely.get_type_id(geoms)
+        layers = table['layer'].to_numpy()
+        elements = [None] * len(table)
+
+        poly_idx = np.flatnonzero(type_ids == 3)
+        exteriors = self._split_coordinates(
+            shapely.get_exterior_ring(geoms[poly_idx]))
+        num_interiors = shapely.get_num_interior_rings(geoms[poly_idx])
+        for idx, points, num_holes in zip(poly_idx, exteriors, num_interiors):
+            exterior_poly = gdspy.Polygon(points,
+                                          layer=int(layers[idx]),
+                                          datatype=10)
+            if num_holes:
+                # If polygons have a holes, need to remove it for gdspy.
+                a_poly_set = gdspy.PolygonSet(
+                    [list(hole.coords) for hole in geoms[idx].interiors],
+                    layer=int(layers[idx]),
+                    datatype=10)
+                elements[idx] = gds_backend.boolean(exterior_poly,
+                                                    a_poly_set,
+                                                    'not',
+                                                    max_points=max_points,
+                                                    precision=precision,
+                                                    layer=int(layers[idx]),
+                                                    datatype=10,
+                                                    backend=self._backend)
+            else:
+                if len(points) > max_points:
+                    exterior_poly = exterior_poly.fracture(
+                        max_points=max_points, precision=precision)
+                elements[idx] = exterior_poly
 
-        geom = qgeometry_element.geometry  # type: shapely.geometry.base.BaseGeometry
-
-        if isinstance(geom, shapely.geometry.Polygon):
-            exterior_poly = gdspy.Polygon(
-                list(geom.exterior.coords),
-                layer=qgeometry_element.layer,
-                datatype=10,
-            )
-
-            # If polygons have a holes, need to remove it for gdspy.
-            all_interiors = list()
-            if geom.interiors:
-                for hole in geom.interiors:
-                    interior_coords = list(hole.coords)
-                    all_interiors.append(interior_coords)
-                a_poly_set = gdspy.PolygonSet(all_interiors,
-                                              layer=qgeometry_element.layer,
-                                              datatype=10)
-                # Since there is max_points in boolean, don't need to do this twice.
-                # a_poly_set = a_poly_set.fracture(max_points=max_points)
-                # exterior_poly = exterior_poly.fracture(max_points=max_points)
-                a_poly = gdspy.boolean(exterior_poly,
-                                       a_poly_set,
-                                       'not',
-                                       max_points=max_points,
-                                       precision=precision,
-                                       layer=qgeometry_element.layer,
-                                       datatype=10)
-                return a_poly
-
-            exterior_poly = exterior_poly.fracture(max_points=max_points,
-                                                   precision=precision)
-            return exterior_poly
-        if isinstance(geom, shapely.geometry.LineString):
-            #class gdspy.FlexPath(points, width, offset=0, corners='natural',
-            #ends='flush', bend_radius=None, tolerance=0.01, precision=0.001,
-            #max_points=199, gdsii_path=False, width_transform=True, layer=0,
-            #datatype=0)
-
-            #Only fillet, if number is greater than zero.
-
-            use_width = self.parse_value(self.options.width_LineString)
-
-            if math.isnan(qgeometry_element.width):
-                qcomponent_id = self.parse_value(qgeometry_element.component)
-                name = self.parse_value(qgeometry_element['name'])
-                layer_num = self.parse_value(qgeometry_element.layer)
-                width = self.parse_value(qgeometry_element.width)
+        line_idx = np.flatnonzero(type_ids == 1)
+        if len(line_idx) and 'fillet' not in table:
+            # Could be junction table with a linestring.
+            # Look for gds_path_filename in column.
+            for idx in line_idx:
+                self.logger.warning(
+                    f'Linestring did not have fillet in column. '
+                    f'The qgeometry_element was not drawn.\n'
+                    f'The qgeometry_element within table is:\n'
+                    f'{table.iloc[idx]}')
+            line_idx = line_idx[:0]
+
+        paths = self._split_coordinates(geoms[line_idx])
+        widths = table['width'].to_numpy(
+            dtype=float)[line_idx] if len(line_idx) else []
+        fillets = table['fillet'].to_numpy(
+            dtype=float)[line_idx] if len(line_idx) else []
+        for idx, points, width, fillet in zip(line_idx, paths, widths, fillets):
+            if math.isnan(width):
+                row = table.iloc[idx]
                 self.logger.warning(
                     f'Since width:{width} for a Path is not a number, '
                     f'it will be exported using width_LineString:'
-                    f' {use_width}.  The component_id is:{qcomponent_id},'
-                    f' name is:{name}, layer is: {layer_num}')
+                    f' {width_linestring}.  The component_id is:'
+                    f'{row.component}, name is:{row["name"]}, layer is: '
+                    f'{layers[idx]}')
+                use_width = width_linestring
             else:
-                use_width = qgeometry_element.width
+                use_width = width
 
-            if 'fillet' in qgeometry_element:
-
-                if (math.isnan(qgeometry_element.fillet) or
-                        qgeometry_element.fillet <= 0 or
-                        qgeometry_element.fillet < qgeometry_element.width):
-
-                    to_return = gdspy.FlexPath(list(geom.coords),
+            #Only fillet, if number is greater than zero.
+            if math.isnan(fillet) or fillet <= 0 or fillet < width:
+                elements[idx] = gdspy.FlexPath(points,
                                                use_width,
-                                               layer=qgeometry_element.layer,
+                                               layer=int(layers[idx]),
                                                max_points=max_points,
                                                datatype=11)
-                else:
-                    to_return = gdspy.FlexPath(
-                        list(geom.coords),
-                        use_width,
-                        layer=qgeometry_element.layer,
-                        datatype=11,
-                        max_points=max_points,
-                        corners=corners,
-                        bend_radius=qgeometry_element.fillet,
-                        tolerance=tolerance,
-                        precision=precision)
-                return to_return
+            else:
+                elements[idx] = gdspy.FlexPath(points,
+                                               use_width,
+                                               layer=int(layers[idx]),
+                                               datatype=11,
+                                               max_points=max_points,
+                                               corners=corners,
+                                               bend_radius=fillet,
+                                               tolerance=tolerance,
+                                               precision=precision)
 
-            # Could be junction table with a linestring.
-            # Look for gds_path_filename in column.
-            self.logger.warning(f'Linestring did not have fillet in column. '
-                                f'The qgeometry_element was not drawn.\n'
-                                f'The qgeometry_element within table is:\n'
-                                f'{qgeometry_element}')
-            return None  # Need explicitly to avoid lint warnings.
-
-        self.logger.warning(
-            f'Unexpected shapely object geometry.'
-            f'The variable qgeometry_element is {type(geom)}, '
-            f'method can currently handle Polygon and FlexPath.')
-        return None
+        for idx in np.flatnonzero((type_ids != 1) & (type_ids != 3)):
+            self.logger.warning(
+                f'Unexpected shapely object geometry.'
+                f'The variable qgeometry_element is {type(geoms[idx])}, '
+                f'method can currently handle Polygon and FlexPath.')
+
+        return elements
+
+    @staticmethod
+    def _split_coordinates(geometries: np.ndarray) -> list:
+        """Get the 2D coordinates of every geometry with one call to shapely.
+
+        Args:
+            geometries (np.ndarray): Shapely geometries.
+
+        Returns:
+            list: (N, 2) np.ndarray of the coordinates of each geometry.
+        """
+        coords, index = shapely.get_coordinates(geometries, return_index=True)
+        counts = np.bincount(index, minlength=len(geometries))
+        return np.split(coords, np.cumsum(counts)[:-1])
 
     def _get_chip_names(self) -> Dict:
         """Returns a dict of unique chip names for ALL tables within QGeometry.
@@ -100,20 +100,41 @@ class Airbridging:
             qcomponent_options=qcomponent_options)
 
         # Place the airbridges
-        ab_df_list = []
-        for cpw_name in self.cpws_with_ab:
-            ab_placement = self.find_uniform_ab_placement(
-                cpw_name=cpw_name,
-                bridge_pitch=bridge_pitch,
-                bridge_minimum_spacing=bridge_minimum_spacing)
-            airbridge_df_for_cpw = self.ab_placement_to_df(
-                ab_placement=ab_placement, ab_qgeom=ab_qgeom)
-            ab_df_list.append(airbridge_df_for_cpw)
-
-        airbridge_df = pd.concat(ab_df_list)
+        ab_placement = self.find_all_uniform_ab_placements(
+            bridge_pitch=bridge_pitch,
+            bridge_minimum_spacing=bridge_minimum_spacing)
+        airbridge_df = self.ab_placement_to_df(ab_placement=ab_placement,
+                                               ab_qgeom=ab_qgeom)
 
         return airbridge_df
 
+    def find_all_uniform_ab_placements(
+            self, bridge_pitch: float,
+            bridge_minimum_spacing: float) -> np.ndarray:
+        '''
+        Determines where to place the airbridges on all the CPWs in
+        self.cpws_with_ab, in one pass.
+
+        Inputs:
+            bridge_pitch: (float) -- Spacing between the centers of each bridge. Units in mm.
+            bridge_minimum_spacing: (float) -- Minimum spacing from corners. Units in mm.
+
+        Returns:
+            ab_placements (np.ndarray): Shape (n, 3).  Each row is
+            (x, y, theta) as in find_uniform_ab_placement, for the CPWs in
+            the order of self.cpws_with_ab.
+        '''
+        cpws = [self.design.components[name] for name in self.cpws_with_ab]
+        placements, _ = self._uniform_ab_placement(
+            points=[cpw.get_points() for cpw in cpws],
+            fillets=[
+                self.design.parse_value(cpw.options.fillet) for cpw in cpws
+            ],
+            bridge_pitch=bridge_pitch,
+            bridge_minimum_spacing=bridge_minimum_spacing,
+            precision=self.design.parse_value(self.precision))
+        return placements
+
     def find_uniform_ab_placement(
             self, cpw_name: str, bridge_pitch: float,
             bridge_minimum_spacing: float) -> list[tuple[float, float, float]]:
@@ -138,106 +159,115 @@ class Airbridging:
             - y (float): y position of airbridge. Units mm.
             - theta (float): Rotation of airbridge. Units degrees.
         '''
-        precision = self.design.parse_value(self.precision)
-
         target_cpw = self.design.components[cpw_name]
 
-        points = target_cpw.get_points()
-        ab_placements = []
-        points_theta = []
-
-        fillet = self.design.parse_value(target_cpw.options.fillet)
-
-        ### Handles all the straight sections ###
-        for i in range(len(points) - 1):
-            # Set up parameters for this calculation
-            pos_i = points[i]
-            pos_f = points[i + 1]
-
-            x0 = round(float(pos_i[0]) / precision) * precision
-            y0 = round(float(pos_i[1]) / precision) * precision
-            xf = round(float(pos_f[0]) / precision) * precision
-            yf = round(float(pos_f[1]) / precision) * precision
-
-            dl = (xf - x0, yf - y0)
-            dx = dl[0]
-            dy = dl[1]
-
-            theta = np.arctan2(dy, dx)
-            mag_dl = np.sqrt(dx**2 + dy**2)
-            lprime = mag_dl - 2 * bridge_minimum_spacing
-
-            if fillet > bridge_minimum_spacing:
-                lprime = mag_dl - 2 * fillet
-            else:
-                lprime = mag_dl - 2 * bridge_minimum_spacing
-            n = 1  #refers to the number of bridges you've already placed
-            #Asking should I place another? If true place another one.
-            while (lprime) >= (n * bridge_pitch):
-                n += 1
-
-            mu_x = (xf + x0) / 2
-            mu_y = (yf + y0) / 2
-
-            x = np.array([i * bridge_pitch * np.cos(theta) for i in range(n)])
-            y = np.array([i * bridge_pitch * np.sin(theta) for i in range(n)])
+        placements, _ = self._uniform_ab_placement(
+            points=[target_cpw.get_points()],
+            fillets=[self.design.parse_value(target_cpw.options.fillet)],
+            bridge_pitch=bridge_pitch,
+            bridge_minimum_spacing=bridge_minimum_spacing,
+            precision=self.design.parse_value(self.precision))
 
-            x = (x - np.average(x)) + mu_x
-            y = (y - np.average(y)) + mu_y
+        return [tuple(placement) for placement in placements.tolist()]
 
-            for i in range(n):
-                ab_placements.append((x[i], y[i], np.degrees(theta)))
-
-            #This is for the corner points
-            points_theta.append(theta)
-
-        ### This handles all the corner / turning sections ###
-        # First check to see if any turns exists
-        if (len(points) > 2):
-            corner_points = points_theta[1:-1]
-            for i in range(len(corner_points) + 1):
-
-                # First check to see if we should
-                # even make an airbridge at this corner
-                pos_i = points[i]
-                pos_f = points[i + 1]
-
-                x0 = round(float(pos_i[0]) / precision) * precision
-                y0 = round(float(pos_i[1]) / precision) * precision
-                xf = round(float(pos_f[0]) / precision) * precision
-                yf = round(float(pos_f[1]) / precision) * precision
-
-                mag_dl = np.sqrt((xf - x0)**2 + (yf - y0)**2)
-
-                if mag_dl < fillet or mag_dl < bridge_minimum_spacing:
-                    continue
-
-                # Now that we only have real turns
-                # let's find the center trace of to align the wirebonds
-                theta_f = points_theta[i + 1]
-                theta_i = points_theta[i]
-
-                dx = np.cos(theta_i) - np.cos(theta_f)
-                dy = np.sin(theta_i) - np.sin(theta_f)
-
-                theta = np.arctan2(dy, dx)
-
-                distance_circle_box_x = fillet * (1 - np.abs(np.cos(theta)))
-                distance_circle_box_y = fillet * (1 - np.abs(np.sin(theta)))
+    @staticmethod
+    def _uniform_ab_placement(
+            points: list, fillets: list, bridge_pitch: float,
+            bridge_minimum_spacing: float,
+            precision: float) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Vectorized placement of the airbridges for any number of CPWs.
 
-                theta_avg = (theta_f + theta_i) / 2
+        Along each straight section, the bridges are spaced by bridge_pitch
+        and centered on the section, away from the fillets.  One more bridge
+        is placed in each turn which is long enough.  The first bridge of
+        each CPW, at its start pin, is removed.
 
-                x = points[i + 1][0] - distance_circle_box_x * np.sign(
-                    np.cos(theta))
-                y = points[i + 1][1] - distance_circle_box_y * np.sign(
-                    np.sin(theta))
+        Inputs:
+            points (list): np.ndarray of the points of each CPW.
+            fillets (list): Fillet of each CPW. Units in mm.
+            bridge_pitch: (float) -- Spacing between the centers of each bridge. Units in mm.
+            bridge_minimum_spacing: (float) -- Minimum spacing from corners. Units in mm.
+            precision (float): Round position values to the closest integer multiple of this value.
 
-                ab_placements.append((x, y, np.degrees(theta_avg)))
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The placements, shape (n, 3), with
+            rows of (x, y, theta), theta in degrees.  Then the index in
+            `points` of the CPW of each placement.
+        '''
+        # pylint: disable=too-many-locals
+        if not points:
+            return np.empty((0, 3)), np.empty(0, dtype=int)
+
+        all_points = np.concatenate(
+            [np.asarray(cpw_points, dtype=float) for cpw_points in points])
+        point_owner = np.repeat(np.arange(len(points)),
+                                [len(cpw_points) for cpw_points in points])
+        fillets = np.asarray(fillets, dtype=float)
+        rounded = np.round(all_points / precision) * precision
+
+        ### All the straight sections ###
+        # A section starts at each point which is followed by a point of the
+        # same CPW.
+        starts = np.flatnonzero(point_owner[:-1] == point_owner[1:])
+        owner = point_owner[starts]
+        start_xy = rounded[starts]
+        end_xy = rounded[starts + 1]
+        dx, dy = (end_xy - start_xy).T
+        theta = np.arctan2(dy, dx)
+        mag_dl = np.sqrt(dx**2 + dy**2)
+
+        fillet = fillets[owner]
+        clearance = np.where(fillet > bridge_minimum_spacing, fillet,
+                             bridge_minimum_spacing)
+        lprime = mag_dl - 2 * clearance
+        # Number of bridges, the smallest n >= 1 with lprime < n * bridge_pitch
+        num = np.floor(np.maximum(lprime, 0) / bridge_pitch).astype(int) + 1
+        num = np.where(lprime >= num * bridge_pitch, num + 1, num)
+        num = np.where((num > 1) & (lprime < (num - 1) * bridge_pitch), num - 1,
+                       num)
+
+        section = np.repeat(np.arange(len(starts)), num)
+        step = np.arange(len(section)) - np.repeat(np.cumsum(num) - num, num)
+        offset = (step - (num[section] - 1) / 2) * bridge_pitch
+        mu_xy = (end_xy + start_xy) / 2
+        straight = np.column_stack(
+            (offset * np.cos(theta[section]) + mu_xy[section, 0],
+             offset * np.sin(theta[section]) + mu_xy[section, 1],
+             np.degrees(theta[section])))
+
+        ### All the corner / turning sections ###
+        # A turn is between two consecutive sections of the same CPW, and
+        # needs the first of them to be long enough.
+        turns = np.flatnonzero((owner[:-1] == owner[1:]) &
+                               ~(mag_dl[:-1] < fillet[:-1]) &
+                               ~(mag_dl[:-1] < bridge_minimum_spacing))
+        theta_i = theta[turns]
+        theta_f = theta[turns + 1]
+        theta_turn = np.arctan2(
+            np.sin(theta_i) - np.sin(theta_f),
+            np.cos(theta_i) - np.cos(theta_f))
+        corner_xy = all_points[starts[turns] + 1]
+        corner = np.column_stack(
+            (corner_xy[:, 0] - fillet[turns] *
+             (1 - np.abs(np.cos(theta_turn))) * np.sign(np.cos(theta_turn)),
+             corner_xy[:, 1] - fillet[turns] *
+             (1 - np.abs(np.sin(theta_turn))) * np.sign(np.sin(theta_turn)),
+             np.degrees((theta_f + theta_i) / 2)))
+
+        # For each CPW, the straight sections then the turns.
+        placements = np.concatenate((straight, corner))
+        placement_owner = np.concatenate((owner[section], owner[turns]))
+        order = np.argsort(placement_owner, kind='stable')
+        placements = placements[order]
+        placement_owner = placement_owner[order]
 
         # Removes airbridge at the start pin
-        ab_placements = ab_placements[1:]
+        _, first = np.unique(placement_owner, return_index=True)
+        keep = np.ones(len(placements), dtype=bool)
+        keep[first] = False
 
-        return ab_placements
+        return placements[keep], placement_owner[keep]
 
     def ab_placement_to_df(self, ab_placement: list[tuple[float, float, float]],
                            ab_qgeom: pd.DataFrame) -> pd.DataFrame:
@@ -246,6 +276,7 @@ class Airbridging:
 
         Args:
             ab_placement (list[tuple[float, float, float]]): Output from self.find_uniform_ab_placement
+                or self.find_all_uniform_ab_placements
             ab_qgeom (pd.DataFrame): QGeometry table of single airbridge.
 
         Return:
@@ -19,6 +19,8 @@ import gdspy
 import shapely
 import numpy as np
 
+from qiskit_metal.renderers.renderer_gds import gds_backend
+
 
 class Cheesing():
     """Create a cheese cell based on input of no-cheese locations."""
@@ -50,6 +52,7 @@ class Cheesing():
         logger: logging.Logger,
         max_points: int,
         precision: float,
+        backend: str = 'gdspy',
         cheese_shape: int = 0,
 
         #  For rectangle
@@ -62,6 +65,7 @@ class Cheesing():
         # delta spacing for holes
         delta_x: float = 0.00010,
         delta_y: float = 0.00010,
+        cached: dict = None,
     ):
         """Create the cheesing based on the no-cheese multi_poly.
 
@@ -99,6 +103,8 @@ class Cheesing():
                                 for a Polygon.
             precision (float): Used in gdspy to identify precision.
             logger (logging.Logger):  Used to give warnings and errors.
+            backend (str, optional): Library for the booleans, 'gdspy' or
+                                    'gdstk'.  Defaults to 'gdspy'.
             cheese_shape (int, optional): 0 is rectangle. 1 is circle.
                                         Defaults to 0.
             shape_0_x (float, optional): The width will be centered at
@@ -109,6 +115,10 @@ class Cheesing():
                                     Defaults to 0.000025.
             delta_x (float, optional): The spacing between holes in x.
             delta_y (float, optional): The spacing between holes in y.
+            cached (dict, optional): The computed attribute of a Cheesing
+                                with the same arguments, except lib, fab
+                                and logger, and the same ground.  Its
+                                booleans are reused.  Defaults to None.
         """
 
         # All the no-cheese locations.
@@ -131,6 +141,7 @@ class Cheesing():
         self.datatype_keepout = datatype_keepout
         self.max_points = max_points
         self.precision = precision
+        self.backend = backend
 
         self.fab = fab
 
@@ -166,6 +177,14 @@ class Cheesing():
 
         self.hole = None
 
+        # x and y of the columns and rows of holes, and the keepout mask
+        # from _get_holes_and_subtract_from_keepout.
+        self.hole_grid = None
+
+        # Results of the masks and booleans, which do not depend on lib.
+        # Can be given to the next Cheesing as cached.
+        self.computed = dict() if cached is None else cached
+
     def apply_cheesing(self) -> gdspy.GdsLibrary:
         """Prototype, not complete.
 
@@ -252,13 +271,14 @@ class Cheesing():
                 a_poly_set = gdspy.PolygonSet(all_interiors,
                                               layer=self.layer,
                                               datatype=self.datatype_cheese + 2)
-                a_poly = gdspy.boolean(exterior_poly,
-                                       a_poly_set,
-                                       'not',
-                                       max_points=self.max_points,
-                                       precision=self.precision,
-                                       layer=self.layer,
-                                       datatype=self.datatype_cheese + 2)
+                a_poly = gds_backend.boolean(exterior_poly,
+                                             a_poly_set,
+                                             'not',
+                                             max_points=self.max_points,
+                                             precision=self.precision,
+                                             layer=self.layer,
+                                             datatype=self.datatype_cheese + 2,
+                                             backend=self.backend)
             else:
                 a_poly = exterior_poly.fracture(max_points=self.max_points,
                                                 precision=self.precision)
@@ -347,11 +367,10 @@ class Cheesing():
         chip_only_top_layer_name = f'TOP_{self.chip_name}_{self.layer}'
         #if chip_only_top_name in self.lib.cells:
         if chip_only_top_layer_name in self.lib.cells:
-            if diff_holes_cell.get_bounding_box() is not None:
+            if not self._is_empty(diff_holes_cell):
                 self.lib.cells[chip_only_top_layer_name].add(
                     gdspy.CellReference(diff_holes_cell))
-                ground_cheese_cell = self._subtract_holes_from_ground(
-                    diff_holes_cell)
+                ground_cheese_cell = self._subtract_holes_from_ground()
 
                 #Move to under Top_main_layer (Top_chipname_#)
                 self._move_to_under_top_chip_layer_name(ground_cheese_cell)
@@ -378,13 +397,14 @@ class Cheesing():
         temp_keepout_cell = self.lib.new_cell(temp_keepout_chip_layer_cell,
                                               overwrite_duplicate=True)
         temp_keepout_cell.add(self.nocheese_gds)
-        diff_holes = gdspy.boolean(gather_holes_cell.get_polygonsets(),
-                                   temp_keepout_cell.get_polygonsets(),
-                                   'not',
-                                   max_points=self.max_points,
-                                   precision=self.precision,
-                                   layer=self.layer,
-                                   datatype=self.datatype_cheese + 1)
+        diff_holes = gds_backend.boolean(gather_holes_cell.get_polygonsets(),
+                                         temp_keepout_cell.get_polygonsets(),
+                                         'not',
+                                         max_points=self.max_points,
+                                         precision=self.precision,
+                                         layer=self.layer,
+                                         datatype=self.datatype_cheese + 1,
+                                         backend=self.backend)
         diff_holes_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_diff'
         diff_holes_cell = self.lib.new_cell(diff_holes_cell_name,
                                             overwrite_duplicate=True)
@@ -432,69 +452,182 @@ class Cheesing():
         return gather_holes_cell
 
     def _get_holes_and_subtract_from_keepout(self) -> gdspy.library.Cell:
-        gather_holes_cell_name = f'Gather_holes_{self.chip_name}_{self.layer}'
-        gather_holes_cell = self.lib.new_cell(gather_holes_cell_name,
-                                              overwrite_duplicate=True)
+        """Make a cell with the grid of holes, minus the keepout region.
+
+        The keepout is rasterized to a mask at the pitch of the holes.  The
+        holes which are clear of the keepout are placed as one
+        gdspy.CellArray per run of consecutive holes in a row.  Holes with a
+        corner in the keepout are dropped.  The few holes which overlap the
+        keepout without a corner in it are cut by the keepout.  The grid and
+        the mask are kept in self.hole_grid.
+
+        Returns:
+            gdspy.library.Cell: Newly created cell that holds the difference
+                                        of holes minus the keep-out region.
+        """
+        diff_holes_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_diff'
+        diff_holes_cell = self.lib.new_cell(diff_holes_cell_name,
+                                            overwrite_duplicate=True)
+
+        if self.one_hole_cell is None or not self.one_hole_cell.polygons:
+            return diff_holes_cell
+
+        if 'hole_grid' not in self.computed:
+            hole_grid, diff_holes = self._holes_minus_keepout()
+            self.computed.update(hole_grid=hole_grid, diff_holes=diff_holes)
+        self.hole_grid = self.computed['hole_grid']
+        x_holes, y_holes, blocked = self.hole_grid
+
+        hole_cell = self._diff_hole_cell()
+        for row, col, columns in self._clear_runs(blocked):
+            diff_holes_cell.add(
+                gdspy.CellArray(hole_cell,
+                                columns,
+                                1, (self.delta_x, self.delta_y),
+                                origin=(x_holes[col], y_holes[row])))
+        if self.computed['diff_holes'] is not None:
+            diff_holes_cell.add(self.computed['diff_holes'])
+
+        return diff_holes_cell
+
+    def _holes_minus_keepout(self) -> tuple:
+        """Compute the grid of holes, the keepout mask and the holes cut by
+        the keepout.
 
+        Returns:
+            tuple: x and y of the columns and rows of holes and the keepout
+            mask, for self.hole_grid, and the holes cut by the keepout.  None
+            if no hole is cut.
+        """
         x_holes = np.arange(self.grid_minx,
                             self.grid_maxx,
                             self.delta_x,
-                            dtype=float).tolist()
+                            dtype=float)
         y_holes = np.arange(self.grid_miny,
                             self.grid_maxy,
                             self.delta_y,
-                            dtype=float).tolist()
+                            dtype=float)
 
-        temp_keepout_chip_layer_cell = f'temp_keepout_{self.chip_name}_{self.layer}'
-        temp_keepout_cell = self.lib.new_cell(temp_keepout_chip_layer_cell,
-                                              overwrite_duplicate=True)
-        temp_keepout_cell.add(self.nocheese_gds)
-        diff_holes_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_diff'
-        diff_holes_cell = self.lib.new_cell(diff_holes_cell_name,
-                                            overwrite_duplicate=True)
-        
         if self.cheese_shape == 0:
-            sx, sy = self.shape_0_x/2, self.shape_0_y/2
+            half_x, half_y = self.shape_0_x / 2, self.shape_0_y / 2
         else:
-            sx, sy = self.shape_1_radius, self.shape_1_radius
+            half_x, half_y = self.shape_1_radius, self.shape_1_radius
+
+        blocked = self._keepout_mask(x_holes, y_holes, half_x, half_y)
+        hole_grid = (x_holes, y_holes, blocked)
+
+        # Holes that touch the keepout.  Drop those with a corner in it,
+        # cut the rest by the keepout.
+        rows, cols = np.nonzero(blocked)
+        if rows.size == 0:
+            return hole_grid, None
+        x_ctr, y_ctr = x_holes[cols], y_holes[rows]
+        shapely.prepare(self.multi_poly)
+        corner_in = np.zeros(rows.size, dtype=bool)
+        for sign_x, sign_y in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+            corner_in |= shapely.intersects_xy(self.multi_poly,
+                                               x_ctr + sign_x * half_x,
+                                               y_ctr + sign_y * half_y)
+        if corner_in.all():
+            return hole_grid, None
+
+        hole_polys = self.one_hole_cell.get_polygons()
+        edge_holes = [
+            points + (x_loc, y_loc)
+            for x_loc, y_loc in zip(x_ctr[~corner_in], y_ctr[~corner_in])
+            for points in hole_polys
+        ]
+        diff_holes = gds_backend.boolean(edge_holes,
+                                         self.nocheese_gds,
+                                         'not',
+                                         max_points=self.max_points,
+                                         precision=self.precision,
+                                         layer=self.layer,
+                                         datatype=self.datatype_cheese + 1,
+                                         backend=self.backend)
+        return hole_grid, diff_holes
+
+    def _keepout_mask(self, x_holes: np.ndarray, y_holes: np.ndarray,
+                      half_x: float, half_y: float) -> np.ndarray:
+        """Rasterize the keepout at the pitch of the holes.
+
+        Only the holes within the bounds of each keepout polygon are tested
+        against it.
 
-        if self.one_hole_cell is not None:
-            intersect_pts_list = [[(xloc-sx, yloc-sy), (xloc+sx, yloc-sy), (xloc+sx, yloc+sy), (xloc-sx, yloc+sy)] for xloc in x_holes for yloc in y_holes]
-            center_list = [(xloc, yloc) for xloc in x_holes for yloc in y_holes]
-            does_intersect_list = gdspy.inside(
-                                    intersect_pts_list,
-                                    temp_keepout_cell, 
-                                    precision=self.precision
-                                    )
-            for idx, ctr in enumerate(center_list):
-                if does_intersect_list[idx] == False:
-                    gather_holes_cell.add(
-                        gdspy.CellReference(self.one_hole_cell,
-                                            origin=ctr))
-                # print(ctr, does_intersect_list[idx])
-
-        diff_holes = gdspy.boolean(gather_holes_cell.get_polygonsets(),
-                                   temp_keepout_cell.get_polygonsets(),
-                                   'not',
-                                   max_points=self.max_points,
-                                   precision=self.precision,
-                                   layer=self.layer,
-                                   datatype=self.datatype_cheese + 1)
-        diff_holes_cell.add(diff_holes)
+        Args:
+            x_holes (np.ndarray): x of the center of each column of holes.
+            y_holes (np.ndarray): y of the center of each row of holes.
+            half_x (float): Half of the width of the box around a hole.
+            half_y (float): Half of the height of the box around a hole.
 
-        self.lib.remove(temp_keepout_chip_layer_cell)
-        self.lib.remove(gather_holes_cell)
-        return diff_holes_cell
+        Returns:
+            np.ndarray: Boolean array of shape (rows, columns).  True if the
+            box around the hole intersects the keepout.
+        """
+        blocked = np.zeros((y_holes.size, x_holes.size), dtype=bool)
+        if self.multi_poly is None or self.multi_poly.is_empty:
+            return blocked
+
+        for poly in shapely.get_parts(self.multi_poly):
+            minx, miny, maxx, maxy = poly.bounds
+            col_0 = np.searchsorted(x_holes, minx - half_x)
+            col_1 = np.searchsorted(x_holes, maxx + half_x, side='right')
+            row_0 = np.searchsorted(y_holes, miny - half_y)
+            row_1 = np.searchsorted(y_holes, maxy + half_y, side='right')
+            if col_0 == col_1 or row_0 == row_1:
+                continue
+            x_ctr, y_ctr = np.meshgrid(x_holes[col_0:col_1],
+                                       y_holes[row_0:row_1])
+            boxes = shapely.box(x_ctr - half_x, y_ctr - half_y, x_ctr + half_x,
+                                y_ctr + half_y)
+            shapely.prepare(poly)
+            blocked[row_0:row_1, col_0:col_1] |= shapely.intersects(poly, boxes)
+        return blocked
+
+    @staticmethod
+    def _clear_runs(blocked: np.ndarray) -> zip:
+        """Find the runs of consecutive holes, in each row, which are clear of
+        the keepout.
 
+        Args:
+            blocked (np.ndarray): Boolean array of shape (rows, columns) from
+                                _keepout_mask.
 
-    def _subtract_holes_from_ground(
-            self, diff_holes_cell) -> Union[gdspy.library.Cell, None]:
+        Returns:
+            zip: Row, first column and number of columns of each run.
+        """
+        clear = np.zeros((blocked.shape[0], blocked.shape[1] + 2), dtype=bool)
+        clear[:, 1:-1] = ~blocked
+        edges = np.diff(clear.astype(np.int8), axis=1)
+        rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        return zip(rows.tolist(), starts.tolist(), (ends - starts).tolist())
+
+    def _diff_hole_cell(self) -> gdspy.library.Cell:
+        """Make the cell with one hole, on datatype_cheese +1, which is
+        referenced by the grid of holes in the Cheese_diff cell.
+
+        Returns:
+            gdspy.library.Cell: The cell with the hole at (0,0).
+        """
+        hole_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_hole'
+        hole_cell = self.lib.new_cell(hole_cell_name, overwrite_duplicate=True)
+        hole_cell.add(
+            gdspy.PolygonSet(self.one_hole_cell.get_polygons(),
+                             layer=self.layer,
+                             datatype=self.datatype_cheese + 1))
+        return hole_cell
+
+    def _subtract_holes_from_ground(self) -> Union[gdspy.library.Cell, None]:
         """Get reference to ground cell and then subtract the holes from
         ground. Place the difference into a new cell, which will eventually
         be added under Top.
 
-        Args:
-            diff_holes_cell ([type]): Cell which contains all the holes.
+        Where the whole pitch around a clear hole is in the ground, the
+        cheesed ground is a frame, the pitch minus the hole.  The frames are
+        placed as one gdspy.CellArray per run of consecutive holes in a row.
+        The rest of the ground is cut by the rectangles of the runs and by
+        the remaining holes, in one boolean, instead of by every hole.
 
         Returns:
             Union[gdspy.library.Cell, None]: If worked, the new cell with
@@ -506,26 +639,131 @@ class Cheesing():
         ground_cell_name = f'ground_{self.chip_name}_{self.layer}'
         if top_chip_layer_name in self.lib.cells.keys():
             ground_cell = self.lib.cells[ground_cell_name]
-            # Need to keep the depth at 0, otherwise all the
-            # cell references (junctions) will be added for boolean.
-            ground_cheese = gdspy.boolean(ground_cell.get_polygons(depth=0),
-                                          diff_holes_cell.get_polygonsets(),
-                                          'not',
-                                          max_points=self.max_points,
-                                          precision=self.precision,
-                                          layer=self.layer,
-                                          datatype=self.datatype_cheese)
             ground_cheese_cell_name = (f'TOP_{self.chip_name}_{self.layer}'
                                        f'_Cheese_{self.datatype_cheese}')
             ground_cheese_cell = self.lib.new_cell(ground_cheese_cell_name,
                                                    overwrite_duplicate=True)
-            return ground_cheese_cell.add(ground_cheese)
+
+            if 'ground_cheese' not in self.computed:
+                # Need to keep the depth at 0, otherwise all the
+                # cell references (junctions) will be added for boolean.
+                framed, ground_cheese = self._ground_minus_holes(
+                    ground_cell.get_polygons(depth=0))
+                self.computed.update(framed=framed, ground_cheese=ground_cheese)
+
+            x_holes, y_holes, _ = self.hole_grid
+            framed = self.computed['framed']
+            if framed.any():
+                frame_cell = self._frame_cell()
+                for row, col, columns in self._clear_runs(~framed):
+                    ground_cheese_cell.add(
+                        gdspy.CellArray(frame_cell,
+                                        columns,
+                                        1, (self.delta_x, self.delta_y),
+                                        origin=(x_holes[col], y_holes[row])))
+            if self.computed['ground_cheese'] is not None:
+                ground_cheese_cell.add(self.computed['ground_cheese'])
+            return ground_cheese_cell
 
         self.logger.warning(
             f'The cell:{top_chip_layer_name} was not found in self.lib. '
             f'Cheesing not implemented.')
         return None
 
+    def _ground_minus_holes(self, ground: list) -> tuple:
+        """Subtract the holes from the ground, except where the ground is
+        framed.
+
+        Args:
+            ground (list): Polygons of the ground, as arrays of points.
+
+        Returns:
+            tuple: The mask of the framed holes from _framed_holes, and the
+            rest of the cheesed ground.  None if there is none.
+        """
+        x_holes, y_holes, blocked = self.hole_grid
+        framed = self._framed_holes(ground)
+        half_x, half_y = self.delta_x / 2, self.delta_y / 2
+
+        # The rectangles of the runs of frames.
+        cut = []
+        for row, col, columns in self._clear_runs(~framed):
+            x_0, y_0 = x_holes[col] - half_x, y_holes[row] - half_y
+            x_1, y_1 = x_0 + columns * self.delta_x, y_0 + self.delta_y
+            cut.append(
+                np.array([(x_0, y_0), (x_1, y_0), (x_1, y_1), (x_0, y_1)]))
+
+        hole_polys = self.one_hole_cell.get_polygons()
+        rows, cols = np.nonzero(~blocked & ~framed)
+        cut.extend(points + (x_loc, y_loc)
+                   for x_loc, y_loc in zip(x_holes[cols], y_holes[rows])
+                   for points in hole_polys)
+        # The holes cut by the keepout.
+        if self.computed['diff_holes'] is not None:
+            cut.extend(self.computed['diff_holes'].polygons)
+
+        ground_cheese = gds_backend.boolean(ground,
+                                            cut,
+                                            'not',
+                                            max_points=self.max_points,
+                                            precision=self.precision,
+                                            layer=self.layer,
+                                            datatype=self.datatype_cheese,
+                                            backend=self.backend)
+        return framed, ground_cheese
+
+    def _framed_holes(self, ground: list) -> np.ndarray:
+        """Find the clear holes where the whole pitch around the hole is in
+        the ground.
+
+        Args:
+            ground (list): Polygons of the ground, as arrays of points.
+
+        Returns:
+            np.ndarray: Boolean array of shape (rows, columns), like
+            self.hole_grid.
+        """
+        x_holes, y_holes, blocked = self.hole_grid
+        framed = ~blocked
+        if not framed.any() or not ground:
+            return np.zeros_like(blocked)
+
+        # The polygons from the booleans can have cuts to holes, so
+        # make them valid before the union.
+        ground_poly = shapely.union_all(
+            shapely.make_valid([shapely.Polygon(points) for points in ground]))
+        shapely.prepare(ground_poly)
+
+        rows, cols = np.nonzero(framed)
+        x_ctr, y_ctr = x_holes[cols], y_holes[rows]
+        half_x, half_y = self.delta_x / 2, self.delta_y / 2
+        framed[rows, cols] = shapely.covered_by(
+            shapely.box(x_ctr - half_x, y_ctr - half_y, x_ctr + half_x,
+                        y_ctr + half_y), ground_poly)
+        return framed
+
+    def _frame_cell(self) -> gdspy.library.Cell:
+        """Make the cell with the ground of one pitch minus the hole, on
+        datatype_cheese, which is referenced by the cheesed ground.
+
+        Returns:
+            gdspy.library.Cell: The cell with the frame centered at (0,0).
+        """
+        half_x, half_y = self.delta_x / 2, self.delta_y / 2
+        frame_cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_frame'
+        frame_cell = self.lib.new_cell(frame_cell_name,
+                                       overwrite_duplicate=True)
+        frame = gds_backend.boolean(gdspy.Rectangle((-half_x, -half_y),
+                                                    (half_x, half_y)),
+                                    self.one_hole_cell.get_polygons(),
+                                    'not',
+                                    max_points=self.max_points,
+                                    precision=self.precision,
+                                    layer=self.layer,
+                                    datatype=self.datatype_cheese,
+                                    backend=self.backend)
+        return frame_cell.add(frame)
+
     def _move_to_under_top_chip_layer_name(self, a_cell: gdspy.library.Cell):
         """Move the cell to under TOP_<chip name>_<layer number>.
 
@@ -534,18 +772,38 @@ class Cheesing():
         """
         chip_only_top_chip_layer_name = f'TOP_{self.chip_name}_{self.layer}'
         if chip_only_top_chip_layer_name in self.lib.cells:
-            if a_cell.get_bounding_box() is not None:
+            if not self._is_empty(a_cell):
                 self.lib.cells[chip_only_top_chip_layer_name].add(
                     gdspy.CellReference(a_cell))
             else:
                 self.lib.remove(a_cell)
 
+    @staticmethod
+    def _is_empty(a_cell: gdspy.library.Cell) -> bool:
+        """Check if the cell, and the cells it references, have no polygon.
+        Faster than get_bounding_box(), which goes through every reference
+        of the gdspy.CellArray's.
+
+        Args:
+            a_cell (gdspy.library.Cell): A GDSPY cell.
+
+        Returns:
+            bool: True if the cell has no polygon.
+        """
+        if a_cell.polygons or a_cell.paths:
+            return False
+        return all(
+            Cheesing._is_empty(reference.ref_cell)
+            for reference in a_cell.references)
+
     def _remove_cheese_diff_cell(self):
-        """ For a lib, chip and layer, remove the Cheese_diff cell.
+        """ For a lib, chip and layer, remove the Cheese_diff cell and the
+        cell with the hole it references.
         """
-        cell_name = f'TOP_{self.chip_name}_{self.layer}_Cheese_diff'
-        if cell_name in self.lib.cells:
-            self.lib.remove(cell_name)
+        for suffix in ('Cheese_diff', 'Cheese_hole'):
+            cell_name = f'TOP_{self.chip_name}_{self.layer}_{suffix}'
+            if cell_name in self.lib.cells:
+                self.lib.remove(cell_name)
 
     def _remove_ground_chip_layer(self):
         """[For a lib, chip and layer, remove the ground cell
@@ -367,6 +367,18 @@ class PlotCanvas(FigureCanvas):
         self.panzoom.logger = self.logger
         self.panzoom._statusbar_label = self.statusbar_label
 
+        # The renderer only draws the view of the axis.  After a pan or zoom,
+        # wait for the view to settle, then render the new view.
+        self._view_timer = QTimer(self)
+        self._view_timer.setSingleShot(True)
+        self._view_timer.setInterval(150)
+        self._view_timer.timeout.connect(self._update_view)
+
+        # Copy of the canvas without the animated artists of the edited
+        # components, taken after each full draw.  Used for blitting.
+        self._blit_background = None
+        self.mpl_connect('draw_event', self._on_draw_event)
+
         self.setup_figure_and_axes()
 
         self.metal_renderer = QMplRenderer(canvas=self,
@@ -403,6 +415,7 @@ class PlotCanvas(FigureCanvas):
                 self.style_axis(ax, num)
                 ax.set_xlim([-0.5, 0.5])
                 ax.set_ylim([-0.5, 0.5])
+                self._connect_view_callbacks(ax)
 
     def setup_rendering(self):
         """Line segment simplificatio: For plots that have line segments (e.g.
@@ -477,6 +490,10 @@ class PlotCanvas(FigureCanvas):
             with mpl.rc_context(rc=self.mpl_context):
                 if clear:
                     self.clear_axis(ax)
+                    if 'xlim' in self._state:
+                        # Render the view that final() restores.
+                        ax.set_xlim(self._state['xlim'])
+                        ax.set_ylim(self._state['ylim'])
                 self._plot(ax)
                 self._watermark_axis(ax)
 
@@ -503,6 +520,79 @@ class PlotCanvas(FigureCanvas):
             main_plot()
             final()
 
+    def _connect_view_callbacks(self, ax: plt.Axes):
+        """Call _on_view_changed when the limits of the axis change.  Clearing
+        the axis disconnects them.
+
+        Args:
+            ax (plt.Axes): axes
+        """
+        ax.callbacks.connect('xlim_changed', self._on_view_changed)
+        ax.callbacks.connect('ylim_changed', self._on_view_changed)
+
+    def _on_view_changed(self, ax: plt.Axes):
+        """Called when the limits of an axis change.  If the renderer needs
+        the new view, render it once the view stops changing.
+
+        Args:
+            ax (plt.Axes): axes
+        """
+        if hasattr(self, 'metal_renderer') and \
+                self.metal_renderer.view_changed(ax):
+            self._view_timer.start()
+
+    def _update_view(self):
+        """Render the current view of the axis, without clearing it."""
+        if self.gui.is_busy:
+            # The design is being rebuilt.  It is plotted when done.
+            return
+        ax = self.get_axis()
+        if not self.metal_renderer.view_changed(ax):
+            return
+        try:
+            with mpl.rc_context(rc=self.mpl_context):
+                self.metal_renderer.render_view(ax)
+        except Exception as e:
+            log_error_easy(self.logger, post_text=f'Plotting error: {e}')
+        self.draw_idle()
+
+    def refresh_component(self, name: str):
+        """Draw a component again after it was rebuilt, without drawing the
+        rest of the design.  Its artists are replaced and drawn over the
+        last full draw, with blitting.
+
+        Args:
+            name (str): Name of the component in the design
+        """
+        ax = self.get_axis()
+        component_id = self.design.components[name].id
+        with mpl.rc_context(rc=self.mpl_context):
+            full_draw = self.metal_renderer.render_component(ax, component_id)
+        if full_draw or self._blit_background is None:
+            self.draw_idle()
+            return
+
+        self.restore_region(self._blit_background)
+        self._draw_animated()
+        self.blit(self.figure.bbox)
+        self.flush_events()
+
+    def _on_draw_event(self, event):
+        """After a full draw, keep a copy of the canvas for blitting, then
+        draw the animated artists, which the full draw skips.
+
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): The draw event
+        """
+        self._blit_background = self.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """Draw the animated artists of the edited components."""
+        if hasattr(self, 'metal_renderer'):
+            for artist in self.metal_renderer.animated_artists():
+                self.figure.draw_artist(artist)
+
     def _watermark_axis(self, ax: plt.Axes):
         """Add a watermark.
 
@@ -539,9 +629,11 @@ class PlotCanvas(FigureCanvas):
         """
         if ax:
             clear_axis(ax)
+            self._connect_view_callbacks(ax)
         else:
             for ax in self.axes:
                 clear_axis(ax)
+                self._connect_view_callbacks(ax)
 
     def refresh(self):
         """Force refresh.
@@ -599,9 +691,22 @@ class PlotCanvas(FigureCanvas):
         pass  # self.figure.tight_layout()
 
     def auto_scale(self):
-        """Automaticlaly scale."""
+        """Automaticlaly scale to the bounds of the design.
+
+        The axes only hold the artists of the view when culling is on, so
+        the limits come from the bounds of the full element tables, and not
+        from ax.autoscale().
+        """
+        bounds = self.metal_renderer.get_bounds()
         for ax in self.figure.axes:
-            ax.autoscale()
+            if bounds is None:
+                ax.autoscale()
+                continue
+            minx, miny, maxx, maxy = bounds
+            xmargin, ymargin = ax.margins()
+            dx, dy = (maxx - minx) * xmargin, (maxy - miny) * ymargin
+            ax.set_xlim(minx - dx, maxx + dx)
+            ax.set_ylim(miny - dy, maxy + dy)
         self.refresh()
 
     def welcome_message(self):
@@ -15,7 +15,7 @@
 import logging
 import random
 import sys
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple
 
 import matplotlib as mpl
 import matplotlib.patches as patches
@@ -26,24 +26,25 @@ from cycler import cycler
 from .patch import PolygonPatch, Polygon
 from IPython.display import display
 from matplotlib.axes import Axes
-from matplotlib.backends.backend_qt5agg import \
-    FigureCanvasQTAgg as FigureCanvas
 from matplotlib.cbook import _OrderedSet
-from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.collections import (LineCollection, PatchCollection,
+                                    PolyCollection)
 from matplotlib.figure import Figure
+from matplotlib.path import Path
 from matplotlib.transforms import Bbox
 
+import shapely
 from shapely.geometry import CAP_STYLE, JOIN_STYLE, LineString
 
 from ... import Dict
 from ...designs import QDesign
-from .mpl_interaction import MplInteraction, PanAndZoom
 from .mpl_toolbox import _axis_set_watermark_img, clear_axis, get_prop_cycle
 
 from .. import config
 if not config.is_building_docs():
     from ...toolbox_python.utility_functions import log_error_easy
-    from qiskit_metal.toolbox_python.utility_functions import bad_fillet_idxs
+    from qiskit_metal.toolbox_metal.fillet import (FilletCache, fillet_corners,
+                                                   fillet_paths)
 
 if TYPE_CHECKING:
     from ..._gui.main_window import MetalGUI
@@ -84,7 +85,19 @@ class QMplRenderer():
         self.canvas = canvas
         self.ax = None
         self.design = design
-        self.options = Dict(resolution='16',)
+        self.options = Dict(
+            resolution='16',
+            # Only draw the geometries in the view, and a margin around it,
+            # as a fraction of the size of the view.
+            culling='True',
+            view_margin='0.5',
+            # Simplify the geometries with a tolerance of this many pixels.
+            # 0 to draw all the vertices.
+            lod_pixels='0.5',
+            # Draw geometries smaller than this many pixels as their
+            # bounding box.  0 to not replace them.
+            box_pixels='2',
+        )
 
         # Filter view options
         self.hidden_layers = set()
@@ -92,6 +105,19 @@ class QMplRenderer():
         # Set of component ids which are integers.
         self._hidden_components = set()
 
+        # Vertices and codes of the matplotlib path of each geometry row,
+        # after fillet and buffer.  See _path_arrays.
+        self._path_cache = FilletCache()
+
+        # The artists added by the last render, and the view they cover.
+        self._artists = []
+        self._view = None
+
+        # Ids of the components edited since the last render.  Each one is
+        # drawn by its own animated artists, so an edit only redraws it.
+        self._edited = set()
+        self._edited_artists = dict()
+
         self.colors = [
             '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b',
             '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'
@@ -145,6 +171,7 @@ class QMplRenderer():
         """
         self.design = design
         self.clear_options()
+        self._edited.clear()
         # TODO
 
     def clear_options(self):
@@ -159,7 +186,199 @@ class QMplRenderer():
         """
 
         self.logger.debug('Rendering element tables to plot window.')
+        self._edited.clear()
+        self._render(ax)
+
+    def _render(self, ax: Axes):
+        """Render the components, then each edited component with its own
+        artists.
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis to draw on
+        """
+        self._artists = []
+        self._edited_artists = dict()
+        self._view = self._get_view(ax)
         self.render_tables(ax)
+        for component_id in self._edited:
+            self._render_edited(ax, component_id)
+
+    def render_view(self, ax: Axes):
+        """Render the tables again for the current view of the axis,
+        replacing only the artists of the last render.  The edited
+        components are drawn with the others again, in the order of the
+        tables, so they no longer cover the metal of the other components.
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis to draw on
+        """
+        self._edited.clear()
+        self._render_again(ax)
+
+    def _render_again(self, ax: Axes):
+        """Replace the artists of the last render with a new render.
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis to draw on
+        """
+        self._remove_artists(self._artists)
+        for artists in self._edited_artists.values():
+            self._remove_artists(artists)
+        self._render(ax)
+
+    @staticmethod
+    def _remove_artists(artists: list):
+        """Remove artists from their axis.
+        Args:
+            artists (list): The artists
+        """
+        for artist in artists:
+            try:
+                artist.remove()
+            except ValueError:
+                pass  # Already removed by a clear of the axis.
+
+    def render_component(self, ax: Axes, component_id: int) -> bool:
+        """Draw a component again, after it was rebuilt.
+
+        The first time a component is edited, the tables are rendered again
+        without it, and it gets its own animated artists.  After that, only
+        its artists are replaced.  The canvas draws the animated artists over
+        a copy of the other layers, see PlotCanvas.refresh_component, so the
+        component is drawn above the rest of the design until the next
+        render or render_view.
+
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis to draw on
+            component_id (int): Id of the component
+        Returns:
+            bool: True if all the tables were rendered again, so the canvas
+            needs a full draw.
+        """
+        if component_id not in self._edited:
+            self._edited.add(component_id)
+            self._render_again(ax)
+            return True
+
+        self._remove_artists(self._edited_artists.pop(component_id, []))
+        self._render_edited(ax, component_id)
+        return False
+
+    def _render_edited(self, ax: Axes, component_id: int):
+        """Render one edited component with its own animated artists.
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis to draw on
+            component_id (int): Id of the component
+        """
+        start = len(self._artists)
+        self.render_tables(ax, components={component_id})
+        artists = self._artists[start:]
+        del self._artists[start:]
+        for artist in artists:
+            artist.set_animated(True)
+        self._edited_artists[component_id] = artists
+
+    def animated_artists(self) -> list:
+        """Get the artists of the edited components.
+        Returns:
+            list: The artists, drawn by the canvas with blitting
+        """
+        return [
+            artist for artists in self._edited_artists.values()
+            for artist in artists
+        ]
+
+    def view_changed(self, ax: Axes) -> bool:
+        """Check if the view of the axis needs a new render: it left the
+        region drawn by the last render, or it was zoomed to another level
+        of detail.
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis
+        Returns:
+            bool: True if render_view should be called
+        """
+        if self._view is None:
+            return False
+        view = self._get_view(ax)
+        if view is None or view.tolerance != self._view.tolerance:
+            return True
+        (minx, maxx), (miny, maxy) = ax.get_xlim(), ax.get_ylim()
+        rendered = self._view.box
+        return (minx < rendered[0] or miny < rendered[1] or
+                maxx > rendered[2] or maxy > rendered[3])
+
+    def _get_view(self, ax: Axes) -> Dict:
+        """Get the region of the axis to render, and its level of detail.
+        Args:
+            ax (matplotlib.axes.Axes): mpl axis
+        Returns:
+            Dict: None if culling is off.  Otherwise, box is the view with
+            the margin as (minx, miny, maxx, maxy), pixel is the size of a
+            pixel in data units, and tolerance is the simplify tolerance,
+            rounded down to a power of 2.
+        """
+        if str(self.options.culling).lower() not in ('true', '1'):
+            return None
+        (minx, maxx), (miny, maxy) = ax.get_xlim(), ax.get_ylim()
+        margin = float(self.options.view_margin)
+        dx, dy = (maxx - minx) * margin, (maxy - miny) * margin
+
+        width = ax.bbox.width
+        pixel = (maxx - minx) / width if width > 0 else 0.
+        tolerance = pixel * float(self.options.lod_pixels)
+        if tolerance > 0:
+            tolerance = 2.**np.floor(np.log2(tolerance))
+        return Dict(box=(minx - dx, miny - dy, maxx + dx, maxy + dy),
+                    pixel=pixel,
+                    tolerance=tolerance)
+
+    def _in_view(self, table: pd.DataFrame) -> pd.DataFrame:
+        """Keep the rows of table which intersect the view of the last
+        render, found with a shapely.STRtree.  Paths are kept if they are
+        within half of their width of the view.
+        Args:
+            table (pd.DataFrame): Element table
+        Returns:
+            pd.DataFrame: The rows in view, in the order of table.
+        """
+        if self._view is None or table.empty:
+            return table
+        margin = table['width'].max() / 2. if 'width' in table else 0.
+        if not margin > 0:
+            margin = 0.
+        minx, miny, maxx, maxy = self._view.box
+        tree = shapely.STRtree(np.asarray(table['geometry'], dtype=object))
+        idx = tree.query(
+            shapely.box(minx - margin, miny - margin, maxx + margin,
+                        maxy + margin))
+        return table.iloc[np.sort(idx)]
+
+    def get_bounds(self) -> Tuple[float, float, float, float]:
+        """Get the bounds of all the rows which are not hidden, whether they
+        are in the view or not.  Paths and junctions are expanded by half of
+        their width.
+        Returns:
+            Tuple[float, float, float, float]: (minx, miny, maxx, maxy), or
+            None if there is nothing to draw.
+        """
+        bounds = []
+        for element_type, table in self.qgeometry.tables.items():
+            if element_type == 'wirebond':
+                continue
+            table = table[self.get_mask(table)]
+            if table.empty:
+                continue
+            table_bounds = shapely.bounds(
+                np.asarray(table['geometry'], dtype=object))
+            if 'width' in table:
+                widths = np.nan_to_num(table['width'].to_numpy(dtype=float))
+                table_bounds[:, :2] -= widths[:, np.newaxis] / 2.
+                table_bounds[:, 2:] += widths[:, np.newaxis] / 2.
+            bounds.append(table_bounds)
+        if not bounds:
+            return None
+        bounds = np.concatenate(bounds)
+        if np.isnan(bounds).all():
+            return None
+        return (*np.nanmin(bounds[:, :2], axis=0),
+                *np.nanmax(bounds[:, 2:], axis=0))
 
     def get_mask(self, table: pd.DataFrame) -> pd.Series:
         """Gets the mask.
@@ -174,21 +393,127 @@ class QMplRenderer():
         # not direct access to underlying internal representation
 
         mask = table.layer.isin(self.hidden_layers)
-        mask = table.component.isin(self._hidden_components)
+        mask |= table.component.isin(self._hidden_components)
 
         return ~mask  # not
 
-    def _render_poly_array(self, ax: Axes, poly_array: np.array, mpl_kw: dict):
-        """Render the poly array.
+    def _render_poly_array(self, ax: Axes, table: pd.DataFrame, arrays: list,
+                           mpl_kw: dict):
+        """Render the paths of a table, with one PolyCollection per layer.
         Args:
             ax (Axes): The axis
-            poly_array (np.array): The poly
+            table (pd.DataFrame): The rows that are rendered
+            arrays (list): (vertices, codes) of each row, from _path_arrays
             mpl_kw (dict): The parameters dictionary
         """
-        if len(poly_array) > 0:
-            poly_array = to_poly_patch(poly_array)
-            ax.add_collection(PatchCollection(poly_array, **mpl_kw))
-            
+        layers = table['layer'].to_numpy()
+        for layer in pd.unique(layers):
+            rows = [
+                arrays[idx]
+                for idx in np.flatnonzero(layers == layer)
+                if len(arrays[idx][0])
+            ]
+            if rows:
+                collection = PolyCollection([], **mpl_kw)
+                collection.set_verts_and_codes(*zip(*rows))
+                ax.add_collection(collection)
+                self._artists.append(collection)
+
+    def _path_arrays(self, table: pd.DataFrame, element_type: str) -> list:
+        """Get the vertices and codes of the matplotlib path of every row.
+
+        Poly rows are drawn as they are.  Path rows are filleted, and path
+        and junction rows are buffered by half of their width.  Then they
+        are simplified to the level of detail of the view.  The result
+        of each row is cached by its geometry, width and level of detail, so
+        an unchanged row is not filleted or buffered again on replot.
+        Rows smaller than options.box_pixels are drawn as their bounding box.
+
+        Args:
+            table (pd.DataFrame): Element table
+            element_type (str): 'poly', 'path' or 'junction'
+        Returns:
+            list: Tuple of (vertices, codes) for each row of table.
+        """
+        resolution = int(self.options['resolution'])
+        geometries = np.asarray(table['geometry'], dtype=object)
+        widths = fillets = np.zeros(len(table))
+        if element_type != 'poly':
+            widths = table['width'].to_numpy(dtype=float)
+        if element_type == 'path':
+            fillets = table['fillet'].to_numpy(dtype=float)
+
+        tolerance = self._view.tolerance if self._view else 0.
+        arrays = [None] * len(table)
+        todo = np.arange(len(table))
+        box_size = float(
+            self.options.box_pixels) * (self._view.pixel if self._view else 0.)
+        if box_size > 0 and len(table):
+            bounds = shapely.bounds(geometries)
+            bounds[:, :2] -= np.nan_to_num(widths)[:, np.newaxis] / 2.
+            bounds[:, 2:] += np.nan_to_num(widths)[:, np.newaxis] / 2.
+            small = np.maximum(bounds[:, 2] - bounds[:, 0],
+                               bounds[:, 3] - bounds[:, 1]) < box_size
+            codes = np.array([Path.MOVETO] + [Path.LINETO] * 4,
+                             dtype=Path.code_type)
+            for idx in np.flatnonzero(small):
+                minx, miny, maxx, maxy = bounds[idx]
+                arrays[idx] = (np.array([(minx, miny), (maxx, miny),
+                                         (maxx, maxy), (minx, maxy),
+                                         (minx, miny)]), codes)
+            todo = np.flatnonzero(~small)
+
+        # NaN is not equal to itself, so it cannot be part of a key.
+        keys = dict()
+        for idx, wkb in zip(todo, shapely.to_wkb(geometries[todo])):
+            keys[idx] = (element_type, wkb, np.nan_to_num(widths[idx], nan=-1),
+                         np.nan_to_num(fillets[idx],
+                                       nan=-1), resolution, tolerance)
+            arrays[idx] = self._path_cache.get(keys[idx])
+        missing = np.array([idx for idx in todo if arrays[idx] is None],
+                           dtype=int)
+        if len(missing) == 0:
+            return arrays
+
+        new = geometries[missing]
+        if element_type == 'path':
+            new = self._fillet_paths(table.iloc[missing])
+        if element_type != 'poly':
+            new = shapely.buffer(new,
+                                 widths[missing] / 2.,
+                                 quad_segs=resolution,
+                                 cap_style='flat',
+                                 join_style='mitre')
+        if tolerance > 0:
+            new = shapely.simplify(new, tolerance, preserve_topology=True)
+
+        for idx, item in zip(missing, self._polygon_path_arrays(new)):
+            self._path_cache.set(keys[idx], item)
+            arrays[idx] = item
+        return arrays
+
+    @staticmethod
+    def _polygon_path_arrays(polygons: np.ndarray) -> list:
+        """Get the vertices and codes of the matplotlib path of polygons, as
+        in patch.PolygonPath, with one call to shapely for all of them.
+        Args:
+            polygons (np.ndarray): Polygons or MultiPolygons
+        Returns:
+            list: Tuple of (vertices, codes) for each polygon.
+        """
+        parts, part_index = shapely.get_parts(polygons, return_index=True)
+        rings, ring_index = shapely.get_rings(parts, return_index=True)
+        coords, coord_index = shapely.get_coordinates(rings, return_index=True)
+        owner = part_index[ring_index][coord_index]
+
+        codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+        ring_start = np.ones(len(coords), dtype=bool)
+        ring_start[1:] = coord_index[1:] != coord_index[:-1]
+        codes[ring_start] = Path.MOVETO
+
+        splits = np.cumsum(np.bincount(owner, minlength=len(polygons)))[:-1]
+        return list(zip(np.split(coords, splits), np.split(codes, splits)))
+
     @property
     def qgeometry(self) -> 'QGeometryTables':
         """Return the qgeometry of the design."""
@@ -245,15 +570,22 @@ class QMplRenderer():
 
         return kw
 
-    def render_tables(self, ax: Axes):
+    def render_tables(self, ax: Axes, components: set = None):
         """Render the tables.
         Args:
             ax (Axes): The axes
+            components (set): Ids of the components to render.  Defaults
+                to None, for all the components which were not edited.
         """
         for element_type, table in self.qgeometry.tables.items():
             if not element_type == 'wirebond':
                 # Mask the table
                 table = table[self.get_mask(table)]
+                if components is None:
+                    table = table[~table.component.isin(self._edited)]
+                else:
+                    table = table[table.component.isin(components)]
+                table = self._in_view(table)
 
                 # subtracted
                 mask = table['subtract'] == True
@@ -285,15 +617,11 @@ class QMplRenderer():
             mask = (table.width == 0) | table.width.isna()
             table1 = table[~mask]
             if len(table1) > 0:
-                table1.geometry = table1[['geometry', 'width']].apply(
-                    lambda x: x[0].buffer(distance=float(x[1]) / 2.,
-                                          cap_style=CAP_STYLE.flat,
-                                          join_style=JOIN_STYLE.mitre,
-                                          resolution=int(self.options[
-                                              'resolution'])),
-                    axis=1)
                 kw = self.get_style('JJ', subtracted=subtracted, extra=extra_kw)
-                self.render_poly(table1, ax, subtracted=subtracted, extra_kw=kw)
+                kw = self.get_style('poly', subtracted=subtracted, extra=kw)
+                self._render_poly_array(ax, table1,
+                                        self._path_arrays(table1, 'junction'),
+                                        kw)
             table1 = table[mask]
             if len(table1) > 0:
                 self.logger.warning(
@@ -315,7 +643,7 @@ class QMplRenderer():
             return
 
         kw = self.get_style('poly', subtracted=subtracted, extra=extra_kw)
-        self._render_poly_array(ax, table.geometry, kw)
+        self._render_poly_array(ax, table, self._path_arrays(table, 'poly'), kw)
 
     def render_fillet(self, table):
         """Renders fillet path.
@@ -324,9 +652,23 @@ class QMplRenderer():
         Returns:
             DataFrame table with geometry field updated with a polygon filleted path.
         """
-        table['geometry'] = table.apply(self.fillet_path, axis=1)
+        table['geometry'] = self._fillet_paths(table)
         return table
 
+    def _fillet_paths(self, table: pd.DataFrame) -> np.ndarray:
+        """Fillet all the paths of a table in one pass of the fillet engine.
+        Unchanged paths are served from its cache.
+
+        Args:
+            table (DataFrame): Table of elements with fillets
+        Returns:
+            np.ndarray: The filleted geometries, in the order of table.
+        """
+        return fillet_paths(table['geometry'],
+                            table['fillet'],
+                            points=int(self.options['resolution']),
+                            precision=self.design.template_options.PRECISION)
+
     def fillet_path(self, row):
         """Output the filleted path.
         Args:
@@ -334,30 +676,7 @@ class QMplRenderer():
         Returns:
             Polygon of the new filleted path.
         """
-        path = row["geometry"].coords
-        if len(path) <= 2:  # only start and end points, no need to fillet
-            return row["geometry"]
-        newpath = np.array([path[0]])
-
-        # Get list of vertices that can't be filleted
-        no_fillet = bad_fillet_idxs(path, row["fillet"],
-                                    self.design.template_options.PRECISION)
-
-        # Iterate through every three-vertex corner
-        for (i, (start, corner, end)) in enumerate(zip(path, path[1:],
-                                                       path[2:])):
-            if i + 1 in no_fillet:  # don't fillet this corner
-                newpath = np.concatenate((newpath, np.array([corner])))
-            else:
-                fillet = self._calc_fillet(np.array(start), np.array(corner),
-                                           np.array(end), row["fillet"],
-                                           int(self.options['resolution']))
-                if fillet is not False:
-                    newpath = np.concatenate((newpath, fillet))
-                else:
-                    newpath = np.concatenate((newpath, np.array([corner])))
-        newpath = np.concatenate((newpath, np.array([end])))
-        return LineString(newpath)
+        return self._fillet_paths(pd.DataFrame([row]))[0]
 
     def _calc_fillet(self,
                      vertex_start,
@@ -374,73 +693,11 @@ class QMplRenderer():
             radius (float): Fillet radius.
             points (int): Number of points to draw in the fillet corner.
         """
-        # Start, corner, and end vertices must be distinct
-        if np.array_equal(vertex_start, vertex_corner) or np.array_equal(
-                vertex_end, vertex_corner):
-            return False
-
-        # Vectors pointing from corner to start and end vertices, respectively
-        # Also calculate their lengths and unit vectors
-        sc_vec = vertex_start - vertex_corner
-        ec_vec = vertex_end - vertex_corner
-        sc_norm = np.linalg.norm(sc_vec)
-        ec_norm = np.linalg.norm(ec_vec)
-        sc_uvec = sc_vec / sc_norm
-        ec_uvec = ec_vec / ec_norm
-
-        # Angle between previous unit vectors
-        end_angle = np.arccos(np.dot(sc_uvec, ec_uvec))
-
-        # Start, corner, and end vertices can't be collinear
-        if (end_angle == 0) or (end_angle == np.pi):
-            return False
-
-        # Fillet circle must be small enough to fit inside corner
-        if radius / np.tan(end_angle / 2) > min(sc_norm, ec_norm):
-            return False
-
-        # Unit vector pointing from corner vertex to center of fillet circle
-        net_uvec = (sc_uvec + ec_uvec) / np.linalg.norm(sc_uvec + ec_uvec)
-
-        # Coordinates of center of fillet circle
-        circle_center = vertex_corner + net_uvec * radius / np.sin(
-            end_angle / 2)
-
-        # Deltas represent displacement from corner vertex to circle center
-        # Midpoint angle from circle center to corner, wrt to horizontal extending from former
-        # Note: arctan is fine for angles in range (-pi / 2, pi / 2] but needs extra pi factor otherwise
-        delta_x = vertex_corner[0] - circle_center[0]
-        delta_y = vertex_corner[1] - circle_center[1]
-        if delta_x:
-            theta_mid = np.arctan(delta_y / delta_x) + np.pi * int(delta_x < 0)
-        else:
-            theta_mid = np.pi * ((1 - 2 * int(delta_y < 0)) + int(delta_y < 0))
-
-        # Start and end sweep angles determined relative to midpoint angle
-        # Swap them as needed to resolve ambiguity in arctan
-        theta_start = theta_mid - (np.pi - end_angle) / 2
-        theta_end = theta_mid + (np.pi - end_angle) / 2
-        p1 = circle_center + radius * np.array(
-            [np.cos(theta_start), np.sin(theta_start)])
-        p2 = circle_center + radius * np.array(
-            [np.cos(theta_end), np.sin(theta_end)])
-        if np.linalg.norm(vertex_start - p2) < np.linalg.norm(vertex_start -
-                                                              p1):
-            theta_start, theta_end = theta_end, theta_start
-
-        # Populate the fillet corner, skipping the start point since it's already added
-        path = np.array([
-            circle_center + radius * np.array(
-                [np.cos(theta_start), np.sin(theta_start)])
-        ])
-        for theta in np.linspace(theta_start, theta_end, points)[1:]:
-            path = np.concatenate(
-                (path,
-                 np.array([
-                     circle_center + radius *
-                     np.array([np.cos(theta), np.sin(theta)])
-                 ])))
-        return path
+        arcs, valid = fillet_corners(np.array([vertex_start], dtype=float),
+                                     np.array([vertex_corner], dtype=float),
+                                     np.array([vertex_end], dtype=float),
+                                     radius, points)
+        return arcs[0] if valid[0] else False
 
     def render_path(self,
                     table: pd.DataFrame,
@@ -466,34 +723,25 @@ class QMplRenderer():
         # convert to polys - handle non zero width
         table1 = table[~mask]
 
-        mask2 = (table1.fillet == 0)
-
-        table2 = table1[~mask2]
-
-        for index, row in table2[table2.fillet.notnull()].iterrows():
-            table1.loc[index, 'geometry'] = self.fillet_path(row)
-
         if len(table1) > 0:
-            table1.geometry = table1[['geometry', 'width']].apply(lambda x: x[
-                0].buffer(distance=float(x[1]) / 2.,
-                          cap_style=CAP_STYLE.flat,
-                          join_style=JOIN_STYLE.mitre,
-                          resolution=int(self.options['resolution'])),
-                                                                  axis=1)
-
             kw = self.get_style('poly', subtracted=subtracted, extra=extra_kw)
 
-            # render components
-            self.render_poly(table1, ax, subtracted=subtracted, extra_kw=kw)
+            # render components, filleted and buffered
+            self._render_poly_array(ax, table1,
+                                    self._path_arrays(table1, 'path'), kw)
 
         # handle zero width
         table1 = table[mask]
-        # best way to plot?
-        # TODO: speed and vectorize?
         if len(table1) > 0:
             kw = self.get_style('path', subtracted=subtracted, extra=extra_kw)
-            line_segments = LineCollection(table1.geometry)
+            coords, index = shapely.get_coordinates(table1.geometry.values,
+                                                    return_index=True)
+            line_segments = LineCollection(
+                np.split(
+                    coords,
+                    np.cumsum(np.bincount(index, minlength=len(table1)))[:-1]))
             ax.add_collection(line_segments)
+            self._artists.append(line_segments)
 
 
 # DEFAULT['renderer_mpl'] = Dict(
@@ -0,0 +1,758 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable-msg=import-outside-toplevel
+# pylint: disable-msg=broad-except
+# pylint: disable-msg=attribute-defined-outside-init
+"""Qiskit Metal benchmarks of the hot paths, on synthetic designs which
+scale with the number of qubits, routes and chips.
+
+The benchmarks follow the conventions of asv (airspeed velocity): each class
+has the optional attributes params, param_names, number and repeat, a setup
+and a teardown called with the parameters, and time_* methods.  A setup which
+raises SkipBenchmark skips the benchmark, for example when Gmsh is not
+installed.  The setup is not timed, and is called before
+each repeat, so that the benchmarks may change the design.
+
+Run them and save the results as json, to track regressions between
+releases:
+
+.. code-block:: bash
+
+    python -m qiskit_metal.tests.benchmarks -o results_0.1.5.json
+    python -m qiskit_metal.tests.benchmarks -o new.json \\
+        --compare results_0.1.5.json
+    python -m qiskit_metal.tests.benchmarks -b GDS --quick
+
+The matplotlib benchmarks draw on Agg figures and do not open a window, so
+they run with QISKIT_METAL_HEADLESS=1 and without a display.
+"""
+
+import argparse
+import inspect
+import itertools
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime
+from typing import Callable, List
+
+from qiskit_metal import Dict, __version__
+
+RESULTS_VERSION = 1
+"""Version of the format of the json results"""
+
+QUBIT_PITCH = 3
+"""Distance in mm between the qubits of the synthetic designs"""
+
+
+class SkipBenchmark(Exception):
+    """Raised by the setup of a benchmark which cannot run here.  The
+    benchmark is reported as skipped, not as an error."""
+
+
+###########################################################################
+### Synthetic designs
+
+
+def _add_qubits(design,
+                num_qubits: int,
+                chip: str = 'main',
+                layer: int = 1,
+                center_x: float = 0.,
+                prefix: str = 'Q') -> List[List[str]]:
+    """Add TransmonPockets on a square grid, and size the chip to fit them.
+
+    Args:
+        design (QDesign): The design.
+        num_qubits (int): Number of qubits.
+        chip (str): Name of the chip.  Defaults to 'main'.
+        layer (int): Layer of the qubits.  Defaults to 1.
+        center_x (float): Center of the chip, in mm.  Defaults to 0.
+        prefix (str): Prefix of the names of the qubits.  Defaults to 'Q'.
+
+    Returns:
+        List[List[str]]: Names of the qubits, row by row.
+    """
+    from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+
+    columns = math.ceil(math.sqrt(num_qubits))
+    rows = math.ceil(num_qubits / columns)
+    size_x, size_y = columns * QUBIT_PITCH, rows * QUBIT_PITCH
+    design.chips[chip].size.update(center_x=f'{center_x}mm',
+                                   center_y='0mm',
+                                   size_x=f'{size_x}mm',
+                                   size_y=f'{size_y}mm')
+
+    names = []
+    for num in range(num_qubits):
+        row, column = divmod(num, columns)
+        if column == 0:
+            names.append([])
+        name = f'{prefix}{num}'
+        TransmonPocket(
+            design,
+            name,
+            options=dict(
+                chip=chip,
+                layer=layer,
+                pos_x=
+                f'{center_x + (column + 0.5) * QUBIT_PITCH - size_x / 2}mm',
+                pos_y=f'{(row + 0.5) * QUBIT_PITCH - size_y / 2}mm',
+                connection_pads=dict(a=dict(loc_W=+1, loc_H=+1),
+                                     b=dict(loc_W=-1, loc_H=+1))))
+        names[-1].append(name)
+    return names
+
+
+def _add_routes(design,
+                qubits: List[List[str]],
+                num_routes: int,
+                chip: str = 'main',
+                layer: int = 1,
+                route_types: tuple = ('RouteMeander', 'RoutePathfinder'),
+                airbridges: bool = False) -> List[str]:
+    """Connect neighbour qubits of the same row, alternating the route types.
+
+    Args:
+        design (QDesign): The design.
+        qubits (List[List[str]]): Names of the qubits, row by row.
+        num_routes (int): Number of routes.  At most the number of
+            neighbour pairs.
+        chip (str): Name of the chip.  Defaults to 'main'.
+        layer (int): Layer of the routes.  Defaults to 1.
+        route_types (tuple): Names of the route classes, used in turn.
+            Defaults to ('RouteMeander', 'RoutePathfinder').
+        airbridges (bool): Set gds_make_airbridge on the routes.
+            Defaults to False.
+
+    Returns:
+        List[str]: Names of the routes.
+    """
+    from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
+    from qiskit_metal.qlibrary.tlines.pathfinder import RoutePathfinder
+    classes = dict(RouteMeander=RouteMeander, RoutePathfinder=RoutePathfinder)
+
+    pairs = [
+        (row[i], row[i + 1]) for row in qubits for i in range(len(row) - 1)
+    ]
+    names = []
+    for num, (start, end) in enumerate(pairs[:num_routes]):
+        route_type = route_types[num % len(route_types)]
+        options = Dict(chip=chip,
+                       layer=layer,
+                       fillet='90um',
+                       pin_inputs=Dict(start_pin=Dict(component=start, pin='a'),
+                                       end_pin=Dict(component=end, pin='b')),
+                       lead=Dict(start_straight='100um', end_straight='100um'))
+        if route_type == 'RouteMeander':
+            options.update(total_length='6mm',
+                           meander=Dict(spacing='200um', asymmetry='0um'))
+        if airbridges:
+            options.gds_make_airbridge = True
+        name = f'{route_type}_{start}_{end}'
+        classes[route_type](design, name, options=options)
+        names.append(name)
+    return names
+
+
+def make_planar_design(num_qubits: int,
+                       num_routes: int = None,
+                       airbridges: bool = False,
+                       enable_renderers: bool = False):
+    """DesignPlanar with num_qubits TransmonPockets on a grid, and routes
+    between neighbours.
+
+    Args:
+        num_qubits (int): Number of qubits.
+        num_routes (int): Number of routes.  None for one per neighbour pair.
+            Defaults to None.
+        airbridges (bool): Set gds_make_airbridge on the routes.
+            Defaults to False.
+        enable_renderers (bool): Passed to the design.  Defaults to False.
+
+    Returns:
+        DesignPlanar: The design.
+    """
+    from qiskit_metal.designs.design_planar import DesignPlanar
+
+    design = DesignPlanar(enable_renderers=enable_renderers)
+    design.overwrite_enabled = True
+    qubits = _add_qubits(design, num_qubits)
+    if num_routes is None:
+        num_routes = num_qubits
+    _add_routes(design, qubits, num_routes, airbridges=airbridges)
+    return design
+
+
+def make_multiplanar_design(num_chips: int,
+                            qubits_per_chip: int = 4,
+                            enable_renderers: bool = False):
+    """MultiPlanar with num_chips chips side by side.  Chip number i has its
+    metal on layer 10 * i + 1 and its dielectric on layer 10 * i + 3.
+
+    Args:
+        num_chips (int): Number of chips.
+        qubits_per_chip (int): Number of qubits of each chip, connected by
+            routes.  Defaults to 4.
+        enable_renderers (bool): Passed to the design.  Defaults to False.
+
+    Returns:
+        MultiPlanar: The design.  Its attribute layer_types holds the metal
+        and dielectric layers, as expected by QGmshRenderer.
+    """
+    from qiskit_metal.designs.design_multiplanar import MultiPlanar
+
+    chips = ['main'] + [f'chip{num}' for num in range(1, num_chips)]
+    handle, filename = tempfile.mkstemp(suffix='.csv')
+    with os.fdopen(handle, 'w') as layer_stack:
+        layer_stack.write('chip_name,layer,datatype,material,thickness,'
+                          'z_coord,fill\n')
+        for num, chip in enumerate(chips):
+            layer_stack.write(
+                f"'{chip}',{10 * num + 1},0,'pec','2um','0um','True'\n"
+                f"'{chip}',{10 * num + 3},0,'silicon','-750um','0um','True'\n")
+    try:
+        design = MultiPlanar(enable_renderers=enable_renderers,
+                             layer_stack_filename=filename)
+    finally:
+        os.remove(filename)
+    design.overwrite_enabled = True
+
+    columns = math.ceil(math.sqrt(qubits_per_chip))
+    chip_width = (columns + 1) * QUBIT_PITCH
+    for num, chip in enumerate(chips):
+        if chip not in design.chips:
+            design.chips[chip] = Dict(size=Dict())
+        qubits = _add_qubits(design,
+                             qubits_per_chip,
+                             chip=chip,
+                             layer=10 * num + 1,
+                             center_x=num * chip_width,
+                             prefix=f'Q{num}_')
+        _add_routes(design,
+                    qubits,
+                    qubits_per_chip,
+                    chip=chip,
+                    layer=10 * num + 1)
+    design.layer_types = dict(
+        metal=[10 * num + 1 for num in range(num_chips)],
+        dielectric=[10 * num + 3 for num in range(num_chips)])
+    return design
+
+
+###########################################################################
+### Benchmarks
+
+
+class TimeParseValue:
+    """parse_value of strings, expressions, variables and option dicts."""
+
+    number = 20
+
+    def setup(self):
+        from qiskit_metal.designs.design_planar import DesignPlanar
+        from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+        self.design = DesignPlanar(enable_renderers=False)
+        self.design.variables.update(cpw_width='10um', cpw_gap='6um')
+        self.values = [
+            '10um', '2.5 mm', '-3.2e-3 m', '2*cpw_width', 'cpw_gap',
+            '[1, 2.5, 3]', '2*130um', '(cpw_width, cpw_gap)', 'True', '1e-6',
+            'text'
+        ] * 50
+        self.options = TransmonPocket.get_template_options(self.design)
+
+    def time_strings(self):
+        parse_value = self.design.parse_value
+        for value in self.values:
+            parse_value(value)
+
+    def time_options(self):
+        self.design.parse_value(self.options)
+
+
+class TimeInstantiate:
+    """Create the components of a design."""
+
+    params = [[16, 64, 256]]
+    param_names = ['num_qubits']
+    repeat = 3
+
+    def setup(self, num_qubits):
+        from qiskit_metal.designs.design_planar import DesignPlanar
+        self.design = DesignPlanar(enable_renderers=False)
+
+    def time_transmon_pockets(self, num_qubits):
+        _add_qubits(self.design, num_qubits)
+
+
+class TimeRoutes:
+    """Create the routes of a design, between existing qubits."""
+
+    params = [['RouteMeander', 'RoutePathfinder'], [8, 32]]
+    param_names = ['route_type', 'num_routes']
+    repeat = 3
+
+    def setup(self, route_type, num_routes):
+        from qiskit_metal.designs.design_planar import DesignPlanar
+        self.design = DesignPlanar(enable_renderers=False)
+        # Enough qubits for num_routes neighbour pairs
+        self.qubits = _add_qubits(self.design, num_routes * 3 // 2 + 2)
+
+    def time_routes(self, route_type, num_routes):
+        _add_routes(self.design,
+                    self.qubits,
+                    num_routes,
+                    route_types=(route_type,))
+
+
+class TimeRebuild:
+    """QDesign.rebuild of the whole design."""
+
+    params = [['planar', 'multiplanar'], [16, 64]]
+    param_names = ['design', 'num_qubits']
+    repeat = 3
+
+    def setup(self, design, num_qubits):
+        if design == 'planar':
+            self.design = make_planar_design(num_qubits)
+        else:
+            self.design = make_multiplanar_design(4, num_qubits // 4)
+
+    def time_rebuild(self, design, num_qubits):
+        self.design.rebuild()
+
+
+class TimeAddQGeometry:
+    """QGeometryTables.add_qgeometry, called as by the make of components,
+    with a few polygons each time."""
+
+    params = [[100, 1000]]
+    param_names = ['num_calls']
+    repeat = 3
+
+    def setup(self, num_calls):
+        from shapely.geometry import box
+        self.design = make_planar_design(1, 0)
+        self.component_id = self.design.components.Q0.id
+        self.geometry = [{
+            f'poly_{num}_{part}': box(num, part, num + 0.5, part + 0.5)
+            for part in range(4)
+        }
+                         for num in range(num_calls)]
+
+    def time_add_qgeometry(self, num_calls):
+        add_qgeometry = self.design.qgeometry.add_qgeometry
+        for geometry in self.geometry:
+            add_qgeometry('poly', self.component_id, geometry)
+
+
+class TimeDesignCheck:
+    """Design rule checks of QDesign.check, full and incremental."""
+
+    params = [[16, 64]]
+    param_names = ['num_qubits']
+    repeat = 3
+
+    def setup(self, num_qubits):
+        self.design = make_planar_design(num_qubits)
+        self.design.check()
+        # One edit for the incremental check
+        self.design.components.Q0.options.pad_gap = '31um'
+        self.design.components.Q0.rebuild()
+
+    def time_check(self, num_qubits):
+        self.design.check()
+
+    def time_check_incremental(self, num_qubits):
+        self.design.check(incremental=True)
+
+
+class TimeMplRender:
+    """QMplRenderer render of the design, and replot after a pan, as done by
+    the GUI canvas."""
+
+    params = [[16, 64]]
+    param_names = ['num_qubits']
+    repeat = 3
+
+    def setup(self, num_qubits):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from qiskit_metal import logger
+        from qiskit_metal.renderers.renderer_mpl.mpl_renderer import \
+            QMplRenderer
+
+        self.design = make_planar_design(num_qubits)
+        self.figure = Figure(figsize=(8, 6), dpi=100)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+        self.renderer = QMplRenderer(None, self.design, logger)
+        self.renderer.render(self.ax)
+        self.ax.autoscale()
+        self.figure.canvas.draw()
+
+    def time_render(self, num_qubits):
+        self.ax.clear()
+        self.renderer.render(self.ax)
+        self.figure.canvas.draw()
+
+    def time_replot(self, num_qubits):
+        (minx, maxx), (miny, maxy) = self.ax.get_xlim(), self.ax.get_ylim()
+        self.ax.set_xlim(minx + (maxx - minx) / 10, maxx + (maxx - minx) / 10)
+        self.renderer.render_view(self.ax)
+        self.figure.canvas.draw()
+
+
+class TimeGDSExport:
+    """QGDSRenderer.export_to_gds, with or without cheesing and airbridges,
+    from scratch and again after an edit (incremental)."""
+
+    params = [['plain', 'cheese_airbridges'], [16, 64]]
+    param_names = ['features', 'num_qubits']
+    repeat = 2
+
+    def setup(self, features, num_qubits):
+        extras = features == 'cheese_airbridges'
+        self.design = make_planar_design(num_qubits,
+                                         airbridges=extras,
+                                         enable_renderers=True)
+        if 'gds' not in self.design.renderers:
+            raise SkipBenchmark('The GDS renderer is not registered.')
+        self.renderer = self.design.renderers.gds
+        self.renderer.options.cheese.view_in_file = Dict(main={1: extras})
+        self.renderer.options.no_cheese.view_in_file = Dict(main={1: extras})
+        self.renderer.options.make_airbridges = extras
+        self.folder = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.folder.name, 'design.gds')
+
+        # Export once for the incremental export, then edit one qubit
+        self.renderer.options.incremental = True
+        self.renderer.export_to_gds(self.filename)
+        self.design.components.Q0.options.pad_gap = '31um'
+        self.design.components.Q0.rebuild()
+
+    def teardown(self, features, num_qubits):
+        self.folder.cleanup()
+
+    def time_export(self, features, num_qubits):
+        self.renderer.options.incremental = False
+        self.renderer.export_to_gds(self.filename)
+
+    def time_export_incremental(self, features, num_qubits):
+        self.renderer.export_to_gds(self.filename)
+
+
+class TimeGmshGeometry:
+    """QGmshRenderer build of the geometry of a multi-chip MultiPlanar
+    design, without meshing."""
+
+    params = [[1, 3]]
+    param_names = ['num_chips']
+    repeat = 2
+
+    def setup(self, num_chips):
+        try:
+            from qiskit_metal.renderers.renderer_gmsh.gmsh_renderer import \
+                QGmshRenderer
+        except ImportError as error:
+            raise SkipBenchmark(f'Gmsh is not installed: {error}') from error
+        self.design = make_multiplanar_design(num_chips)
+        self.renderer = QGmshRenderer(self.design,
+                                      layer_types=self.design.layer_types)
+
+    def teardown(self, num_chips):
+        self.renderer.close()
+
+    def time_render_design(self, num_chips):
+        self.renderer.render_design(mesh_geoms=False)
+
+
+###########################################################################
+### Runner
+
+
+def get_benchmarks(pattern: str = None) -> List[Dict]:
+    """The benchmarks of this module.
+
+    Args:
+        pattern (str): Regular expression.  Only the benchmarks whose name,
+            such as 'TimeRebuild.time_rebuild', matches are returned.
+            Defaults to None.
+
+    Returns:
+        List[Dict]: The benchmarks, with the keys name, cls and method.
+    """
+    benchmarks = []
+    module = sys.modules[__name__]
+    for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+        if not cls_name.startswith('Time') or cls.__module__ != __name__:
+            continue
+        for method in sorted(vars(cls)):
+            if not method.startswith('time_'):
+                continue
+            name = f'{cls_name}.{method}'
+            if pattern and not re.search(pattern, name):
+                continue
+            benchmarks.append(Dict(name=name, cls=cls, method=method))
+    return benchmarks
+
+
+def run_benchmark(benchmark: Dict,
+                  params: tuple,
+                  repeat: int = None,
+                  number: int = None) -> dict:
+    """Time one benchmark for one combination of its parameters.
+
+    Args:
+        benchmark (Dict): Returned by get_benchmarks.
+        params (tuple): Values of the parameters.
+        repeat (int): Number of samples.  None for the repeat of the class,
+            or 3.  Defaults to None.
+        number (int): Number of calls per sample.  None for the number of
+            the class, or 1.  Defaults to None.
+
+    Returns:
+        dict: The result, with the keys name, params, status ('ok', 'skipped'
+        or 'error'), error, times (seconds per call, one per sample), min and
+        median.
+    """
+    cls = benchmark.cls
+    repeat = repeat or getattr(cls, 'repeat', 3)
+    number = number or getattr(cls, 'number', 1)
+    result = dict(name=benchmark.name,
+                  params=dict(zip(getattr(cls, 'param_names', []), params)),
+                  status='ok',
+                  error=None,
+                  times=[],
+                  min=None,
+                  median=None)
+
+    for _ in range(repeat):
+        instance = cls()
+        try:
+            if hasattr(instance, 'setup'):
+                instance.setup(*params)
+        except SkipBenchmark as error:
+            result.update(status='skipped', error=repr(error))
+            return result
+        except Exception:
+            result.update(status='error', error=traceback.format_exc())
+            return result
+
+        method = getattr(instance, benchmark.method)
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                method(*params)
+            result['times'].append((time.perf_counter() - start) / number)
+        except Exception:
+            result.update(status='error', error=traceback.format_exc())
+            return result
+        finally:
+            if hasattr(instance, 'teardown'):
+                try:
+                    instance.teardown(*params)
+                except Exception:
+                    pass
+
+    result['min'] = min(result['times'])
+    result['median'] = statistics.median(result['times'])
+    return result
+
+
+def _git_commit() -> str:
+    """Commit of the qiskit_metal source tree, if it is a git repository.
+
+    Returns:
+        str: The commit hash, or None.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL,
+                              check=True,
+                              universal_newlines=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(pattern: str = None,
+                   quick: bool = False,
+                   callback: Callable = None) -> dict:
+    """Run the benchmarks, for every combination of their parameters.
+
+    Args:
+        pattern (str): Only run the benchmarks whose name matches this
+            regular expression.  Defaults to None.
+        quick (bool): Only run the first value of each parameter, once.
+            Used to check that the benchmarks work.  Defaults to False.
+        callback (Callable): Called with each result.  Defaults to None.
+
+    Returns:
+        dict: The results, with the machine, the version and commit of
+        qiskit_metal, and the key results holding the results of
+        run_benchmark.
+    """
+    results = []
+    for benchmark in get_benchmarks(pattern):
+        params = getattr(benchmark.cls, 'params', [])
+        if quick:
+            params = [values[:1] for values in params]
+        for combination in itertools.product(*params):
+            result = run_benchmark(benchmark,
+                                   combination,
+                                   repeat=1 if quick else None,
+                                   number=1 if quick else None)
+            results.append(result)
+            if callback:
+                callback(result)
+
+    return dict(version=RESULTS_VERSION,
+                qiskit_metal=__version__,
+                commit=_git_commit(),
+                date=datetime.now().isoformat(timespec='seconds'),
+                python=platform.python_version(),
+                platform=platform.platform(),
+                machine=platform.machine(),
+                cpu_count=os.cpu_count(),
+                quick=quick,
+                results=results)
+
+
+def _key(result: dict) -> str:
+    """Key of a result, from its name and parameters.
+
+    Args:
+        result (dict): Result of run_benchmark.
+
+    Returns:
+        str: The key.
+    """
+    params = ', '.join(
+        f'{name}={value}' for name, value in result['params'].items())
+    return f"{result['name']}({params})"
+
+
+def compare_results(baseline: dict,
+                    results: dict,
+                    factor: float = 1.2) -> List[dict]:
+    """Compare the minimum times of the benchmarks run in both results.
+
+    Args:
+        baseline (dict): Results of run_benchmarks, for example of the last
+            release.
+        results (dict): New results of run_benchmarks.
+        factor (float): A benchmark slower than factor times its baseline
+            is a regression.  Defaults to 1.2.
+
+    Returns:
+        List[dict]: One entry per benchmark in both results, with the keys
+        key, baseline, new, ratio and regression.
+    """
+    old = {
+        _key(result): result['min']
+        for result in baseline['results']
+        if result['status'] == 'ok'
+    }
+    comparison = []
+    for result in results['results']:
+        key = _key(result)
+        if result['status'] != 'ok' or not old.get(key):
+            continue
+        ratio = result['min'] / old[key]
+        comparison.append(
+            dict(key=key,
+                 baseline=old[key],
+                 new=result['min'],
+                 ratio=ratio,
+                 regression=ratio > factor))
+    return comparison
+
+
+def _print_result(result: dict):
+    """Print one line per result.
+
+    Args:
+        result (dict): Result of run_benchmark.
+    """
+    if result['status'] == 'ok':
+        print(f"{_key(result):70s} {result['min'] * 1e3:10.2f} ms", flush=True)
+    else:
+        error = result['error'].strip().splitlines()[-1]
+        print(f"{_key(result):70s} {result['status']}: {error}", flush=True)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv (List[str]): Arguments.  None for sys.argv[1:].
+            Defaults to None.
+
+    Returns:
+        int: Exit status.  1 if a benchmark failed or regressed, else 0.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m qiskit_metal.tests.benchmarks',
+        description='Run the Qiskit Metal benchmarks.')
+    parser.add_argument('-b',
+                        '--bench',
+                        help='only run the benchmarks matching this regular '
+                        'expression')
+    parser.add_argument('-o', '--output', help='json file of the results')
+    parser.add_argument('--compare',
+                        help='json file of baseline results to compare with')
+    parser.add_argument('--factor',
+                        type=float,
+                        default=1.2,
+                        help='slowdown reported as a regression '
+                        '(default: %(default)s)')
+    parser.add_argument('--quick',
+                        action='store_true',
+                        help='run the first parameters once, to check that '
+                        'the benchmarks work')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.bench, args.quick, callback=_print_result)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+
+    status = int(
+        any(result['status'] == 'error' for result in results['results']))
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        print(f"\nCompared with {baseline.get('qiskit_metal')} "
+              f"({baseline.get('commit')}):")
+        for entry in compare_results(baseline, results, args.factor):
+            flag = '  REGRESSION' if entry['regression'] else ''
+            print(f"{entry['key']:70s} {entry['ratio']:6.2f}x{flag}")
+            if entry['regression']:
+                status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
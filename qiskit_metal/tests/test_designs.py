@@ -218,6 +218,43 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
         self.assertEqual('my_name-1' in design.name_to_id, False)
         self.assertEqual('my_name-2' in design.name_to_id, False)
 
+    def test_design_rebuild_progress(self):
+        """Test the progress callback of rebuild in design_base.py."""
+        design = DesignPlanar(metadata={})
+        TransmonPocket(design, 'my_name-1')
+        TransmonPocket(design, 'my_name-2', options=dict(pos_x='1mm'))
+
+        calls = []
+        design.rebuild(progress=lambda *args: calls.append(args))
+        self.assertEqual(calls, [(0, 2, 'my_name-1'), (1, 2, 'my_name-2'),
+                                 (2, 2, '')])
+
+        def cancel(done, total, name):
+            raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            design.rebuild(progress=cancel)
+
+    def test_design_change_callback(self):
+        """Test the change callbacks of design_base.py."""
+        design = DesignPlanar(metadata={})
+        events = []
+
+        def callback(event, component_id):
+            events.append((event, component_id))
+
+        design.add_change_callback(callback)
+        comp = QComponent(design, 'my_name-1', make=False)
+        design.rename_component(comp.id, 'new-name')
+        design.delete_component('new-name')
+        design.delete_all_components()
+        self.assertEqual(events, [('add', comp.id), ('rename', comp.id),
+                                  ('delete', comp.id), ('reset', None)])
+
+        design.remove_change_callback(callback)
+        QComponent(design, 'my_name-2', make=False)
+        self.assertEqual(len(events), 4)
+
     def test_design_get_and_set_design_name(self):
         """Test getting the design name in design_base.py."""
         design = DesignPlanar(metadata={})
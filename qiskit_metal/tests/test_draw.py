@@ -21,6 +21,7 @@
 import unittest
 
 import numpy as np
+import shapely.affinity
 
 from shapely.geometry import Polygon
 from shapely.geometry import LineString
@@ -306,6 +307,40 @@ class TestDraw(unittest.TestCase, AssertionsMixin):
                                               expected[x][i][j],
                                               rel_tol=1e-3)
 
+    def test_draw_basic_compose(self):
+        """Test compose in basic.py."""
+        poly = Polygon([(0, 0), (0.5, 0), (0.25, 0.5)])
+        line = LineString([(0, 0), (1, 2), (3, 1)])
+        objs = {'poly': poly, 'more': [line, (poly,)]}
+
+        actual = basic.compose(objs, basic.rotate_matrix(30),
+                               basic.translate_matrix(2, 5))
+        expected = shapely.affinity.translate(
+            shapely.affinity.rotate(poly, 30, origin=(0, 0)), 2, 5)
+
+        self.assertEqual(list(objs.keys()), list(actual.keys()))
+        self.assertIsInstance(actual['more'][1], tuple)
+        self.assertTrue(actual['poly'].equals_exact(expected, 1e-12))
+        self.assertTrue(actual['more'][1][0].equals_exact(expected, 1e-12))
+        self.assertTrue(actual['more'][0].equals_exact(
+            shapely.affinity.translate(
+                shapely.affinity.rotate(line, 30, origin=(0, 0)), 2, 5), 1e-12))
+        # input is left untouched
+        self.assertTrue(objs['poly'].equals_exact(poly, 0))
+
+    def test_draw_basic_affine_matches_shapely(self):
+        """Test the batch affine path matches shapely.affinity."""
+        poly = Polygon([(0, 0), (0.5, 0), (0.25, 0.5)])
+        objs = [poly, [poly, {'a': poly}]]
+
+        rotated = basic.rotate(objs, 65, origin=(1, 2))
+        scaled = basic.scale(objs, -1, 2, origin=(1, 2))
+        expected_rot = shapely.affinity.rotate(poly, 65, origin=(1, 2))
+        expected_scl = shapely.affinity.scale(poly, -1, 2, origin=(1, 2))
+
+        self.assertTrue(rotated[1][1]['a'].equals_exact(expected_rot, 1e-12))
+        self.assertTrue(scaled[1][1]['a'].equals_exact(expected_scl, 1e-12))
+
     def test_draw_basic_buffer(self):
         """Test buffer in basic.py."""
         poly = Polygon([(0, 0), (0.5, 0), (0.25, 0.5)])
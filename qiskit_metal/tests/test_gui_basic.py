@@ -19,9 +19,23 @@
 Test a planar design and launching the GUI.
 """
 
+import logging
+import os
+import threading
+import time
 import unittest
+from unittest.mock import patch
+
+from PySide2.QtWidgets import QApplication, QDockWidget
+
+from qiskit_metal import Dict, config, designs, logger
+from qiskit_metal._gui.widgets.all_components.table_model_all_components import \
+    QTableModel_AllComponents
 from qiskit_metal._gui.widgets.bases.dict_tree_base import BranchNode
 from qiskit_metal._gui.widgets.bases.dict_tree_base import LeafNode
+from qiskit_metal._gui.widgets.log_widget.log_metal import (
+    LogHandler_for_QTextLog, QTextEditLogger)
+from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
 
 
 class TestGUIBasic(unittest.TestCase):
@@ -51,6 +65,84 @@ class TestGUIBasic(unittest.TestCase):
             message = "LeafNode instantiation failed"
             self.fail(message)
 
+    def test_table_model_all_components_refresh_component(self):
+        """Test that refresh_component of QTableModel_AllComponents in
+        table_model_all_components.py only updates the row of the
+        component."""
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        app = QApplication.instance() or QApplication([])  # pylint: disable=unused-variable
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        TransmonPocket(design, 'Q2', options=dict(pos_x='1mm'))
+        TransmonPocket(design, 'Q3', options=dict(pos_x='2mm'))
+        model = QTableModel_AllComponents(Dict(design=design), logger)
+        model.refresh()
+        model._flush()
+        self.assertEqual(model.rowCount(), 3)
+
+        changed = []
+        model.dataChanged.connect(lambda first, last, *args: changed.append(
+            (first.row(), last.row())))
+        model.modelReset.connect(lambda: changed.append('reset'))
+        model.refresh_component('Q2')
+        model.refresh_component('Q2')
+        model.refresh_component('not a component')
+        model._flush()
+        self.assertEqual(changed, [(1, 1)])
+
+        # Nothing left to notify
+        model._flush()
+        self.assertEqual(changed, [(1, 1)])
+
+        # A deleted row is dropped, the pending rows after it move up
+        model.refresh_component('Q1')
+        model.refresh_component('Q3')
+        model.refresh_component('Q2')
+        model._apply_design_change('delete', design.components['Q2'].id)
+        model._flush()
+        self.assertEqual(changed, [(1, 1), (0, 1)])
+
+    def test_log_metal_batches_records(self):
+        """Test that QTextEditLogger in log_metal.py shows the records
+        logged from another thread in one batch, and keeps only the last
+        num_lines lines."""
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        app = QApplication.instance() or QApplication([])
+        with patch.dict(config.GUI_CONFIG.logger, num_lines=20):
+            log_text = QTextEditLogger(dock_window=QDockWidget())
+        test_logger = logging.getLogger('test_log_metal')
+        test_logger.setLevel(logging.INFO)
+        test_logger.propagate = False
+        handler = LogHandler_for_QTextLog('test', None, log_text, test_logger)
+        self.addCleanup(test_logger.removeHandler, handler)
+
+        def log_records():
+            for num in range(100):
+                test_logger.info('message %d', num)
+
+        with patch.object(log_text,
+                          '_show_messages',
+                          wraps=log_text._show_messages) as show_messages:
+            thread = threading.Thread(target=log_records)
+            thread.start()
+            thread.join()
+            # Nothing is shown before the GUI thread runs the flush timer
+            show_messages.assert_not_called()
+            self.assertEqual(len(log_text._pending), 20)
+
+            deadline = time.time() + 5
+            while log_text._pending and time.time() < deadline:
+                app.processEvents()
+                time.sleep(0.01)
+            show_messages.assert_called_once()
+
+        self.assertEqual(len(log_text.logged_lines), 20)
+        document = log_text.document()
+        self.assertEqual(document.maximumBlockCount(), 20)
+        self.assertLessEqual(document.blockCount(), 20)
+        self.assertIn('message 99', document.lastBlock().text())
+        self.assertNotIn('message 79', document.toPlainText())
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -28,6 +28,7 @@ from qiskit_metal.qlibrary._template import MyQComponent
 from qiskit_metal.qlibrary.core import QComponent
 from qiskit_metal.qlibrary.core import QRoute
 from qiskit_metal.qlibrary.core import BaseQubit
+from qiskit_metal.qlibrary.core.design_check import QDesignCheck
 from qiskit_metal.qlibrary.lumped.cap_n_interdigital import CapNInterdigital
 from qiskit_metal.qlibrary.couplers.coupled_line_tee import CoupledLineTee
 from qiskit_metal.qlibrary.couplers.cap_n_interdigital_tee import CapNInterdigitalTee
@@ -51,6 +52,7 @@ from qiskit_metal.qlibrary.qubits import transmon_pocket_6
 from qiskit_metal.qlibrary.qubits.transmon_pocket_teeth import TransmonPocketTeeth
 from qiskit_metal.qlibrary.qubits.SQUID_loop import SQUID_LOOP
 from qiskit_metal.qlibrary.couplers import tunable_coupler_01
+from qiskit_metal.qlibrary.sample_shapes.rectangle import Rectangle
 from qiskit_metal.tests.assertions import AssertionsMixin
 
 #pylint: disable-msg=line-too-long
@@ -539,6 +541,86 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
         self.assertFalse(component_id in after_junction_list)
         self.assertFalse(component_id in after_poly_list)
 
+    def test_qlibrary_design_check_overlap(self):
+        """Test overlap_tester in design_check.py."""
+        design = designs.DesignPlanar()
+        Rectangle(design, 'r1', options=dict(pos_x='0um'))
+        Rectangle(design, 'r2', options=dict(pos_x='400um'))
+        Rectangle(design, 'r3', options=dict(pos_x='2mm'))
+
+        violations = QDesignCheck(design).overlap_tester()
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations['rule'][0], 'overlap')
+        self.assertEqual(
+            {violations['component_1'][0], violations['component_2'][0]},
+            {'r1', 'r2'})
+        self.assertAlmostEqual(violations['value'][0], 0.1 * 0.3)
+        self.assertAlmostEqual(violations['x'][0], 0.2)
+        self.assertAlmostEqual(violations['y'][0], 0.)
+
+    def test_qlibrary_design_check_rules(self):
+        """Test spacing, width and keep-out rules in design_check.py."""
+        design = designs.DesignPlanar()
+        Rectangle(design, 'r1', options=dict(pos_x='0um'))
+        Rectangle(design, 'r2', options=dict(pos_x='503um'))
+        Rectangle(design, 'thin', options=dict(pos_y='1mm', width='1um'))
+
+        drc = QDesignCheck(design,
+                           options=dict(min_spacing='5um', min_width='2um'))
+        drc.add_keepout(draw.rectangle(0.1, 0.1, 0.5, 0.), name='no_metal')
+        violations = drc.run()
+
+        spacing = violations[violations['rule'] == 'min_spacing']
+        self.assertEqual(len(spacing), 1)
+        self.assertAlmostEqual(spacing['value'].iloc[0], 0.003)
+
+        width = violations[violations['rule'] == 'min_width']
+        self.assertEqual(width['component_1'].tolist(), ['thin'])
+
+        keepout = violations[violations['rule'] == 'keepout']
+        self.assertEqual(keepout['component_1'].tolist(), ['r2'])
+        self.assertEqual(keepout['name_2'].tolist(), ['no_metal'])
+
+    def test_qlibrary_design_check_tiled(self):
+        """Test the tiled mode of design_check.py gives the same violations."""
+        design = designs.DesignPlanar()
+        Rectangle(design, 'r1', options=dict(pos_x='0um'))
+        Rectangle(design, 'r2', options=dict(pos_x='400um'))
+        Rectangle(design, 'r3', options=dict(pos_x='903um'))
+
+        drc = QDesignCheck(design, options=dict(min_spacing='5um'))
+        expected = drc.run()
+        drc.options.update(tile_size='200um', workers='1')
+        actual = drc.run()
+
+        columns = ['rule', 'component_1', 'component_2']
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(sorted(map(tuple, actual[columns].values.tolist())),
+                         sorted(map(tuple, expected[columns].values.tolist())))
+
+    def test_qlibrary_design_check_incremental(self):
+        """Test the incremental mode of design_check.py."""
+        design = designs.DesignPlanar()
+        Rectangle(design, 'r1', options=dict(pos_x='0um'))
+        r2 = Rectangle(design, 'r2', options=dict(pos_x='2mm'))
+        Rectangle(design, 'r3', options=dict(pos_x='-2mm'))
+
+        violations = design.check(incremental=True,
+                                  options=dict(min_spacing='5um'))
+        self.assertEqual(len(violations), 0)
+
+        r2.options.pos_x = '400um'
+        r2.rebuild()
+        violations = design.check(incremental=True)
+        self.assertEqual(violations['rule'].tolist(), ['overlap'])
+
+        r2.options.pos_x = '503um'
+        r2.rebuild()
+        violations = design.check(incremental=True)
+        self.assertEqual(violations['rule'].tolist(), ['min_spacing'])
+        self.assertEqual(len(design.check()), 1)
+
     def test_qlibrary_anchored_path_intersecting(self):
         """Test intersecting function in anchored_path.py"""
         self.assertTrue(
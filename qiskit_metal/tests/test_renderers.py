@@ -19,10 +19,23 @@
 # pylint: disable-msg=protected-access
 """Qiskit Metal unit tests analyses functionality."""
 
+import os
+import tempfile
 import unittest
-from unittest.mock import MagicMock
+import pathlib
+from unittest.mock import MagicMock, patch
+import gdspy
 import matplotlib.pyplot as _plt
+import numpy as np
 import pandas as pd
+import shapely
+from geopandas import GeoDataFrame
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.path import Path
+from PySide2.QtWidgets import QApplication, QMainWindow
+
+import qiskit_metal
 
 from qiskit_metal import designs, Dict, draw
 from qiskit_metal.renderers import setup_default
@@ -32,7 +45,12 @@ from qiskit_metal.renderers.renderer_ansys.hfss_renderer import QHFSSRenderer
 from qiskit_metal.renderers.renderer_base.renderer_base import QRenderer
 from qiskit_metal.renderers.renderer_base.renderer_gui_base import QRendererGui
 from qiskit_metal.renderers.renderer_gds.gds_renderer import QGDSRenderer
+from qiskit_metal.renderers.renderer_gds import gds_renderer
+from qiskit_metal.renderers.renderer_gds import gds_backend
+from qiskit_metal.renderers.renderer_gds.make_cheese import Cheesing
 from qiskit_metal.renderers.renderer_mpl.mpl_interaction import MplInteraction
+from qiskit_metal.renderers.renderer_mpl.mpl_canvas import PlotCanvas
+from qiskit_metal.renderers.renderer_mpl.mpl_renderer import QMplRenderer
 from qiskit_metal.renderers.renderer_gmsh.gmsh_renderer import QGmshRenderer
 from qiskit_metal.renderers.renderer_elmer.elmer_renderer import QElmerRenderer
 from qiskit_metal.renderers.renderer_ansys_pyaedt.hfss_renderer_eigenmode_aedt import QHFSSEigenmodePyaedt
@@ -45,11 +63,35 @@ from qiskit_metal.qgeometries.qgeometries_handler import QGeometryTables
 from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
 from qiskit_metal.qlibrary.terminations.open_to_ground import OpenToGround
 from qiskit_metal.qlibrary.tlines.mixed_path import RouteMixed
+from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
 from qiskit_metal.renderers.renderer_gds.airbridge import Airbridge_forGDS
 
 from qiskit_metal.renderers.renderer_gds.make_airbridge import Airbridging
 
 
+def _plot_canvas(design: designs.QDesign) -> PlotCanvas:
+    """Make the plot canvas of the design, in a window without the rest of
+    the GUI."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    _plot_canvas.app = QApplication.instance() or QApplication([])
+    window = QMainWindow()
+    window.gui = Dict(is_busy=False,
+                      path_imgs=pathlib.Path(qiskit_metal.__file__).parent /
+                      '_gui' / '_imgs')
+    canvas = PlotCanvas(design, parent=window, logger=qiskit_metal.logger)
+    canvas.resize(800, 600)
+    canvas.window = window
+    return canvas
+
+
+def _mpl_axis() -> 'matplotlib.axes.Axes':
+    """Make an axis of an Agg figure, 800 pixels wide."""
+    figure = Figure(figsize=(8, 8), dpi=100)
+    FigureCanvasAgg(figure)
+    figure.subplots_adjust(left=0, right=1, bottom=0, top=1)
+    return figure.add_subplot(111)
+
+
 class TestRenderers(unittest.TestCase):
     """Unit test class."""
 
@@ -328,7 +370,7 @@ class TestRenderers(unittest.TestCase):
         renderer = QGDSRenderer(design)
         options = renderer.default_options
 
-        self.assertEqual(len(options), 18)
+        self.assertEqual(len(options), 24)
         self.assertEqual(options['short_segments_to_not_fillet'], 'True')
         self.assertEqual(options['check_short_segments_by_scaling_fillet'],
                          '2.0')
@@ -343,6 +385,12 @@ class TestRenderers(unittest.TestCase):
                          '../resources/Fake_Junctions.GDS')
         self.assertEqual(options['junction_pad_overlap'], '5um')
         self.assertEqual(options['max_points'], '199')
+        self.assertEqual(options['workers'], '1')
+        self.assertEqual(options['ground_plane_tile_size'], '0mm')
+        self.assertEqual(options['stream'], 'False')
+        self.assertEqual(options['incremental'], 'True')
+        self.assertEqual(options['backend'], 'gdspy')
+        self.assertEqual(options['merge_polygons'], 'False')
         self.assertEqual(options['bounding_box_scale_x'], '1.2')
         self.assertEqual(options['bounding_box_scale_y'], '1.2')
 
@@ -582,6 +630,287 @@ class TestRenderers(unittest.TestCase):
         self.assertEqual(actual[0], 15.0)
         self.assertEqual(actual[1], 22.5)
 
+    def test_renderer_gdsrenderer_boolean_not(self):
+        """Test the ground plane boolean job in gds_renderer.py."""
+        hole = QGDSRenderer._get_polygons(
+            [gdspy.Rectangle((1, 1), (2, 2), layer=3)])
+        job = (gdspy.Rectangle((0, 0), (3, 3),
+                               layer=3), hole, 3, 1e-9, 199, None)
+
+        actual = gds_renderer._boolean_not(job)
+        self.assertEqual(actual.layers, [3] * len(actual.polygons))
+        self.assertAlmostEqual(actual.area(), 8.0)
+
+        job = (hole, gdspy.Rectangle((0, 0), (3, 3),
+                                     layer=3), 3, 1e-9, 199, None)
+        self.assertIsNone(gds_renderer._boolean_not(job))
+
+        # Clipped to the left half of the rectangle.
+        job = (gdspy.Rectangle((0, 0), (3, 3),
+                               layer=3), hole, 3, 1e-9, 199, (0, 0, 1.5, 3))
+        self.assertAlmostEqual(gds_renderer._boolean_not(job).area(), 4.0)
+
+    def test_renderer_gdsrenderer_tiles(self):
+        """Test make_tiles and polygons_by_tile in gds_renderer.py."""
+        tiles = QGDSRenderer._make_tiles((0, 0, 2.5, 1), 1)
+        self.assertEqual(tiles.shape, (3, 4))
+        self.assertEqual(tiles[-1].tolist(), [2, 0, 2.5, 1])
+
+        polygons = QGDSRenderer._get_polygons(
+            [gdspy.Rectangle((0.2, 0.2), (0.4, 0.4))])
+        by_tile = QGDSRenderer._polygons_by_tile(polygons, tiles)
+        self.assertEqual([len(polys) for polys in by_tile], [1, 0, 0])
+
+    def test_renderer_gdsrenderer_merge_polygons(self):
+        """Test _merge_polygons in gds_renderer.py."""
+        design = designs.DesignPlanar()
+        renderer = QGDSRenderer(design)
+        table = GeoDataFrame({
+            'component': [1, 1, 2, 3],
+            'layer': [1, 1, 1, 1],
+            'geometry': [
+                draw.rectangle(1, 1, 0.5, 0.5),
+                draw.rectangle(1, 1, 1.5, 0.5),
+                draw.rectangle(1, 1, 5, 5),
+                draw.LineString([(0, 0), (3, 3)])
+            ]
+        })
+        self.assertIs(renderer._merge_polygons(table), table)
+
+        renderer.options.merge_polygons = 'True'
+        actual = renderer._merge_polygons(table)
+        self.assertEqual(len(actual), 3)
+        self.assertEqual(actual['component'].tolist(), [2, 3, 1])
+        merged = actual.geometry.iloc[-1]
+        self.assertAlmostEqual(merged.area, 2.0)
+        self.assertEqual(len(merged.exterior.coords), 5)
+
+    def test_renderer_gdsrenderer_export_cache(self):
+        """Test _ExportCache and _job_digest in gds_renderer.py."""
+        cache = gds_renderer._ExportCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.end_export()
+        self.assertEqual(cache.get('a'), 1)
+        cache.end_export()
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+        hole = [np.array([(1.0, 1.0), (2.0, 1.0), (2.0, 2.0)])]
+        job = (gdspy.Rectangle((0, 0), (3, 3)), hole, 3, 1e-9, 199, None)
+        same = (gdspy.Rectangle((0, 0),
+                                (3, 3)), [hole[0].copy()], 3, 1e-9, 199, None)
+        moved = (gdspy.Rectangle((0, 0),
+                                 (3, 3)), [hole[0] + 0.5], 3, 1e-9, 199, None)
+        self.assertEqual(QGDSRenderer._job_digest(job),
+                         QGDSRenderer._job_digest(same))
+        self.assertNotEqual(QGDSRenderer._job_digest(job),
+                            QGDSRenderer._job_digest(moved))
+
+    def test_renderer_gdsrenderer_cheese_cache(self):
+        """Test that export_to_gds in gds_renderer.py reuses the cheese of an
+        unchanged chip and layer."""
+        design = designs.DesignPlanar()
+        open_to_ground = OpenToGround(design,
+                                      'Open',
+                                      options=Dict(pos_x='1000um', pos_y='0um'))
+        renderer = QGDSRenderer(design)
+
+        with tempfile.TemporaryDirectory() as directory, patch.object(
+                Cheesing,
+                '_ground_minus_holes',
+                autospec=True,
+                side_effect=Cheesing._ground_minus_holes) as ground_minus_holes:
+            path = os.path.join(directory, 'cheese.gds')
+            self.assertEqual(renderer.export_to_gds(path), 1)
+            first = gdspy.GdsLibrary(infile=path).cells['TOP_main_1_Cheese_100']
+            self.assertEqual(renderer.export_to_gds(path), 1)
+            second = gdspy.GdsLibrary(
+                infile=path).cells['TOP_main_1_Cheese_100']
+            self.assertEqual(ground_minus_holes.call_count, 1)
+            self.assertAlmostEqual(second.area(), first.area())
+
+            open_to_ground.options.pos_y = '500um'
+            open_to_ground.rebuild()
+            self.assertEqual(renderer.export_to_gds(path), 1)
+            self.assertEqual(ground_minus_holes.call_count, 2)
+
+    def test_renderer_gdsrenderer_split_coordinates(self):
+        """Test _split_coordinates in gds_renderer.py."""
+        geometries = np.array([
+            draw.LineString([(0, 0), (1, 0)]),
+            draw.LineString([(0, 1), (1, 1), (2, 2)])
+        ])
+        actual = QGDSRenderer._split_coordinates(geometries)
+        self.assertEqual(len(actual), 2)
+        self.assertEqual(actual[0].tolist(), [[0, 0], [1, 0]])
+        self.assertEqual(actual[1].tolist(), [[0, 1], [1, 1], [2, 2]])
+
+    def test_renderer_gds_backend(self):
+        """Test check_backend and boolean in gds_backend.py."""
+        logger = MagicMock()
+        self.assertEqual(gds_backend.check_backend('gdspy', logger), 'gdspy')
+        self.assertEqual(gds_backend.check_backend('unknown', logger), 'gdspy')
+
+        rectangle = gdspy.Rectangle((0, 0), (3, 3))
+        points = gds_backend._to_points(
+            [rectangle, [(0, 0), (1, 0), (1, 1)],
+             np.zeros((4, 2))])
+        self.assertEqual(len(points), 3)
+
+        for backend in gds_backend.BACKENDS:
+            if gds_backend.check_backend(backend, logger) != backend:
+                continue
+            actual = gds_backend.boolean(rectangle,
+                                         gdspy.Rectangle((1, 1), (2, 2)),
+                                         'not',
+                                         precision=1e-9,
+                                         layer=3,
+                                         backend=backend)
+            self.assertAlmostEqual(actual.area(), 8.0)
+            self.assertEqual(set(actual.layers), {3})
+
+    @unittest.skipIf(gds_backend.gdstk is None, 'gdstk is not installed')
+    def test_renderer_gds_backend_write_gds(self):
+        """Test that export_to_gds with the gdstk backend writes the same
+        cells, layers and datatypes as with gdspy."""
+        design = designs.DesignPlanar()
+        design.chips.main.size.update(size_x='4mm', size_y='3mm')
+        for num in range(4):
+            TransmonPocket(design,
+                           f'Q{num}',
+                           options=dict(pos_x=f'{num - 1.5}mm',
+                                        connection_pads=dict(a=dict(loc_W=+1,
+                                                                    loc_H=+1),
+                                                             b=dict(loc_W=-1,
+                                                                    loc_H=+1))))
+        for num in range(3):
+            RouteMeander(design,
+                         f'cpw{num}',
+                         options=Dict(total_length='2mm',
+                                      fillet='49um',
+                                      gds_make_airbridge=True,
+                                      pin_inputs=Dict(
+                                          start_pin=Dict(component=f'Q{num}',
+                                                         pin='a'),
+                                          end_pin=Dict(component=f'Q{num + 1}',
+                                                       pin='b'))))
+        renderer = QGDSRenderer(design)
+        renderer.options.make_airbridges = True
+
+        # gdspy keeps numpy integers as layers and datatypes
+        lib = gdspy.GdsLibrary(unit=1e-3, precision=1e-9)
+        cell = lib.new_cell('cell', overwrite_duplicate=True)
+        cell.add(
+            gdspy.PolygonSet([[(0, 0), (1, 0), (1, 1)]],
+                             layer=np.int64(2),
+                             datatype=np.int64(5)))
+        cell.add(
+            gdspy.FlexPath([(0, 0), (2, 0)],
+                           0.1,
+                           layer=np.int64(3),
+                           datatype=np.int64(1)))
+        top = lib.new_cell('top', overwrite_duplicate=True)
+        top.add(gdspy.CellArray(cell, np.int64(2), np.int64(3), (3, 3)))
+
+        def read_specs(path: str) -> dict:
+            return {
+                name: set(cell.get_polygons(by_spec=True))
+                for name, cell in gdspy.GdsLibrary(infile=path).cells.items()
+            }
+
+        specs = dict()
+        with tempfile.TemporaryDirectory() as directory:
+            for backend in gds_backend.BACKENDS:
+                path = os.path.join(directory, f'{backend}.gds')
+                renderer.options.backend = backend
+                self.assertEqual(renderer.export_to_gds(path), 1)
+                specs[backend] = read_specs(path)
+
+                path = os.path.join(directory, f'lib_{backend}.gds')
+                gds_backend.write_gds(lib, path, backend)
+                specs[f'lib_{backend}'] = read_specs(path)
+
+        self.assertEqual(specs['gdstk'], specs['gdspy'])
+        self.assertIn((1, 0), specs['gdstk']['TOP_main_1'])
+        self.assertEqual(specs['lib_gdstk'], specs['lib_gdspy'])
+        self.assertEqual(specs['lib_gdstk']['top'], {(2, 5), (3, 1)})
+
+    def test_renderer_gds_read_junction_cells(self):
+        """Test _read_junction_cells in gds_renderer.py."""
+        junction = gdspy.Cell('junction_cell', exclude_from_current=True)
+        junction.add(gdspy.Rectangle((0, 0), (1, 2)))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'junction.gds')
+            gdspy.GdsLibrary(unit=1e-6,
+                             precision=1e-9).write_gds(path, cells=[junction])
+
+            first = gds_renderer._read_junction_cells(path, 1e-3, 1e-9)
+            second = gds_renderer._read_junction_cells(path, 1e-3, 1e-9)
+            self.assertIs(first, second)
+            self.assertEqual([cell.name for cell in first], ['junction_cell'])
+            self.assertAlmostEqual(first[0].area(), 2e-6)
+
+            other_unit = gds_renderer._read_junction_cells(path, 1e-6, 1e-9)
+            self.assertIsNot(first, other_unit)
+            self.assertAlmostEqual(other_unit[0].area(), 2.0)
+
+    def test_renderer_gdsrenderer_cheese_clear_runs(self):
+        """Test _clear_runs in make_cheese.py."""
+        blocked = np.array([[False, False, True, False],
+                            [True, True, True, True]])
+        actual = list(Cheesing._clear_runs(blocked))
+        self.assertEqual(actual, [(0, 0, 2), (0, 3, 1)])
+
+    def test_renderer_gdsrenderer_cheese_ground(self):
+        """Test the cheesed ground of a positive mask in make_cheese.py."""
+        gdspy.current_library.cells.clear()
+        lib = gdspy.GdsLibrary()
+        lib.new_cell('TOP_main_1')
+        ground = gdspy.boolean(gdspy.Rectangle((0, 0), (1, 1)),
+                               gdspy.Rectangle((0.3, 0.3), (0.55, 0.5)),
+                               'not',
+                               layer=1)
+        lib.new_cell('ground_main_1').add(ground)
+        keepout = shapely.geometry.box(0.3, 0.3, 0.55, 0.5).buffer(0.02)
+        keepout_gds = [
+            gdspy.Polygon(list(keepout.exterior.coords), layer=1, datatype=99)
+        ]
+
+        cheese = Cheesing(shapely.geometry.MultiPolygon([keepout]),
+                          keepout_gds,
+                          lib,
+                          0,
+                          0,
+                          1,
+                          1,
+                          'main',
+                          0.05,
+                          1,
+                          False,
+                          100,
+                          99,
+                          False,
+                          MagicMock(),
+                          8191,
+                          1e-9,
+                          shape_0_x=0.02,
+                          shape_0_y=0.02,
+                          delta_x=0.05,
+                          delta_y=0.05)
+        cheese.apply_cheesing()
+
+        # The frames are referenced, not flattened into the ground.
+        ground_cheese = lib.cells['TOP_main_1_Cheese_100']
+        self.assertTrue(ground_cheese.references)
+        self.assertIn('TOP_main_1_Cheese_frame', lib.cells)
+
+        holes = lib.cells['TOP_main_1_Cheese_diff'].get_polygons()
+        expected = gdspy.boolean(ground, holes, 'not')
+        self.assertAlmostEqual(ground_cheese.area(), expected.area())
+        diff = gdspy.boolean(ground_cheese.get_polygons(), expected, 'xor')
+        self.assertTrue(diff is None or diff.area() < 1e-12)
+
     # pylint: disable-msg=unused-variable
     def test_renderer_gdsrenderer_check_qcomps(self):
         """Test check_qcomps in gds_renderer.py."""
@@ -612,6 +941,320 @@ class TestRenderers(unittest.TestCase):
         mpl.disconnect()
         self.assertEqual(mpl.figure, None)
 
+    def test_renderer_mpl_canvas_auto_scale(self):
+        """Test that auto_scale in mpl_canvas.py fits the whole design, and
+        not only the view drawn with culling."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1', options=dict(pos_x='-3mm'))
+        TransmonPocket(design, 'Q2', options=dict(pos_x='+3mm'))
+        canvas = _plot_canvas(design)
+        ax = canvas.get_axis()
+        ax.set_xlim(-3.2, -2.8)
+        ax.set_ylim(-0.2, 0.2)
+        canvas.plot()
+        self.assertTrue(canvas.metal_renderer._view is not None)
+
+        canvas.auto_scale()
+        bounds = np.array([
+            design.components[name].qgeometry_bounds() for name in ('Q1', 'Q2')
+        ])
+        minx, miny = bounds[:, :2].min(axis=0)
+        maxx, maxy = bounds[:, 2:].max(axis=0)
+        (xmin, xmax), (ymin, ymax) = ax.get_xlim(), ax.get_ylim()
+        self.assertLessEqual(xmin, minx)
+        self.assertGreaterEqual(xmax, maxx)
+        self.assertLessEqual(ymin, miny)
+        self.assertGreaterEqual(ymax, maxy)
+        self.assertLess(minx, -3.2)
+        self.assertGreater(maxx, 3.2)
+
+    def test_renderer_mpl_polygon_path_arrays(self):
+        """Test _polygon_path_arrays of QMplRenderer in mpl_renderer.py."""
+        square = shapely.box(0, 0, 4, 4)
+        with_hole = square.difference(shapely.box(1, 1, 2, 2))
+        multi = shapely.MultiPolygon([shapely.box(0, 0, 1, 1), with_hole])
+        empty = shapely.Polygon()
+        arrays = QMplRenderer._polygon_path_arrays(
+            np.array([square, empty, with_hole, multi], dtype=object))
+        self.assertEqual(len(arrays), 4)
+
+        ring = [Path.MOVETO] + [Path.LINETO] * 4
+        vertices, codes = arrays[0]
+        self.assertEqual(list(codes), ring)
+        self.assertTrue(np.allclose(vertices, shapely.get_coordinates(square)))
+
+        vertices, codes = arrays[1]
+        self.assertEqual(len(vertices), 0)
+        self.assertEqual(len(codes), 0)
+
+        # Exterior then hole, each starting with a MOVETO
+        vertices, codes = arrays[2]
+        self.assertEqual(list(codes), ring * 2)
+        self.assertTrue(
+            np.allclose(vertices, shapely.get_coordinates(with_hole)))
+
+        # Every ring of every part
+        vertices, codes = arrays[3]
+        self.assertEqual(list(codes), ring * 3)
+        self.assertTrue(np.allclose(vertices, shapely.get_coordinates(multi)))
+
+    def test_renderer_mpl_path_cache(self):
+        """Test that QMplRenderer in mpl_renderer.py does not fillet and
+        buffer the unchanged rows again on replot."""
+        design = designs.DesignPlanar()
+        options = dict(connection_pads=dict(a=dict(loc_W=+1, loc_H=+1)))
+        TransmonPocket(design, 'Q1', options=options)
+        q2 = TransmonPocket(design, 'Q2', options=dict(pos_x='1mm', **options))
+        renderer = QMplRenderer(None, design, qiskit_metal.logger)
+        ax = _mpl_axis()
+
+        def replot():
+            ax.clear()
+            ax.set_xlim(-1, 2)
+            ax.set_ylim(-1.5, 1.5)
+            renderer.render(ax)
+
+        replot()
+        self.assertGreater(len(renderer._path_cache), 0)
+
+        with patch.object(renderer,
+                          '_polygon_path_arrays',
+                          wraps=renderer._polygon_path_arrays) as new_arrays:
+            replot()
+            new_arrays.assert_not_called()
+
+            # Only the rows of the moved component are drawn again
+            q2.options.pos_x = '1.2mm'
+            q2.rebuild()
+            replot()
+            num_rows = sum(
+                len(table[table.component == q2.id])
+                for name, table in design.qgeometry.tables.items()
+                if name in ('poly', 'path', 'junction'))
+            self.assertEqual(
+                sum(len(call.args[0]) for call in new_arrays.call_args_list),
+                num_rows)
+
+    def test_renderer_mpl_get_mask(self):
+        """Test that get_mask of QMplRenderer in mpl_renderer.py hides both
+        the hidden layers and the hidden components."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        TransmonPocket(design, 'Q2', options=dict(pos_x='1mm', layer='2'))
+        TransmonPocket(design, 'Q3', options=dict(pos_x='2mm'))
+        renderer = QMplRenderer(None, design, qiskit_metal.logger)
+        table = design.qgeometry.tables['poly']
+
+        renderer.hide_layer(2)
+        renderer.hide_component('Q3')
+        shown = table[renderer.get_mask(table)]
+        self.assertEqual(set(shown.component), {design.components['Q1'].id})
+
+        renderer.show_layer(2)
+        shown = table[renderer.get_mask(table)]
+        self.assertEqual(
+            set(shown.component),
+            {design.components['Q1'].id, design.components['Q2'].id})
+
+    def test_renderer_mpl_render_component(self):
+        """Test render_component of QMplRenderer in mpl_renderer.py: the
+        first edit of a component renders all the tables again, later edits
+        only replace the animated artists of the component."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        q2 = TransmonPocket(design, 'Q2', options=dict(pos_x='1mm'))
+        renderer = QMplRenderer(None, design, qiskit_metal.logger)
+        ax = _mpl_axis()
+        ax.set_xlim(-1, 2)
+        ax.set_ylim(-1.5, 1.5)
+        renderer.render(ax)
+        self.assertEqual(renderer.animated_artists(), [])
+
+        self.assertTrue(renderer.render_component(ax, q2.id))
+        artists = list(renderer._artists)
+        edited = renderer.animated_artists()
+        self.assertGreater(len(edited), 0)
+        self.assertTrue(all(artist.get_animated() for artist in edited))
+        self.assertFalse(any(artist.get_animated() for artist in artists))
+
+        q2.options.pos_x = '1.2mm'
+        q2.rebuild()
+        self.assertFalse(renderer.render_component(ax, q2.id))
+        self.assertEqual(renderer._artists, artists)
+        for artist in artists:
+            self.assertIs(artist.axes, ax)
+        for artist in edited:
+            self.assertNotIn(artist, ax.collections)
+        new_edited = renderer.animated_artists()
+        self.assertEqual(len(new_edited), len(edited))
+        for artist in new_edited:
+            self.assertIn(artist, ax.collections)
+            self.assertTrue(artist.get_animated())
+
+        # A new view draws the component with the others again, in the
+        # order of the tables, so it is not kept above them
+        renderer.render_view(ax)
+        self.assertEqual(renderer.animated_artists(), [])
+        self.assertFalse(
+            any(artist.get_animated() for artist in renderer._artists))
+        for artist in new_edited:
+            self.assertNotIn(artist, ax.collections)
+        self.assertTrue(renderer.render_component(ax, q2.id))
+
+        # A full render draws the component with the others again
+        renderer.render(ax)
+        self.assertEqual(renderer.animated_artists(), [])
+
+    def test_renderer_mpl_canvas_refresh_component(self):
+        """Test that refresh_component of PlotCanvas in mpl_canvas.py draws
+        the canvas on the first edit, and blits the component after."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        q2 = TransmonPocket(design, 'Q2', options=dict(pos_x='1mm'))
+        canvas = _plot_canvas(design)
+        canvas.plot()
+        # Not render the view again while the events are flushed
+        canvas._view_timer.stop()
+        self.assertIsNotNone(canvas._blit_background)
+
+        with patch.object(canvas, 'draw_idle') as draw_idle, \
+                patch.object(canvas, 'blit') as blit:
+            canvas.refresh_component('Q2')
+            draw_idle.assert_called_once()
+            blit.assert_not_called()
+
+            canvas.draw()
+            q2.options.pos_x = '1.2mm'
+            q2.rebuild()
+            canvas.refresh_component('Q2')
+            draw_idle.assert_called_once()
+            blit.assert_called_once()
+
+    def test_renderer_mpl_get_view(self):
+        """Test _get_view and view_changed of QMplRenderer in
+        mpl_renderer.py."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        renderer = QMplRenderer(None, design, qiskit_metal.logger)
+        ax = _mpl_axis()
+        ax.set_xlim(-1, 1)
+        ax.set_ylim(-1, 1)
+
+        view = renderer._get_view(ax)
+        for actual, expected in zip(view.box, (-2, -2, 2, 2)):
+            self.assertAlmostEqual(actual, expected)
+        self.assertAlmostEqual(view.pixel, 2 / 800)
+        # 0.5 pixel, rounded down to a power of 2
+        self.assertEqual(view.tolerance, 2.**-10)
+
+        renderer.options.culling = 'False'
+        self.assertEqual(renderer._get_view(ax), None)
+        renderer.options.culling = 'True'
+
+        # Nothing rendered yet
+        self.assertFalse(renderer.view_changed(ax))
+        renderer.render(ax)
+        self.assertFalse(renderer.view_changed(ax))
+
+        # Pan within the margin, then out of it
+        ax.set_xlim(0, 2)
+        self.assertFalse(renderer.view_changed(ax))
+        ax.set_xlim(2, 4)
+        self.assertTrue(renderer.view_changed(ax))
+        renderer.render_view(ax)
+        self.assertFalse(renderer.view_changed(ax))
+
+        # Zoom in, within the view, to another level of detail
+        ax.set_xlim(2.9, 3.1)
+        ax.set_ylim(-0.1, 0.1)
+        self.assertTrue(renderer.view_changed(ax))
+
+    def test_renderer_mpl_box_pixels(self):
+        """Test that _path_arrays of QMplRenderer in mpl_renderer.py draws
+        the rows smaller than box_pixels as their bounding box."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1', options=dict(orientation='45'))
+        table = design.qgeometry.tables['poly']
+        bounds = shapely.bounds(np.asarray(table['geometry'], dtype=object))
+        renderer = QMplRenderer(None, design, qiskit_metal.logger)
+        ax = _mpl_axis()
+
+        def is_box(vertices, row_bounds):
+            minx, miny, maxx, maxy = row_bounds
+            return len(vertices) == 5 and np.allclose(vertices, [(minx, miny),
+                                                                 (maxx, miny),
+                                                                 (maxx, maxy),
+                                                                 (minx, maxy),
+                                                                 (minx, miny)])
+
+        # Zoomed out: the pocket is less than 2 pixels wide
+        ax.set_xlim(-400, 400)
+        ax.set_ylim(-400, 400)
+        renderer.render(ax)
+        arrays = renderer._path_arrays(table, 'poly')
+        for (vertices, codes), row_bounds in zip(arrays, bounds):
+            self.assertTrue(is_box(vertices, row_bounds))
+            self.assertEqual(list(codes), [Path.MOVETO] + [Path.LINETO] * 4)
+
+        # Zoomed in: the rotated rectangles are drawn as they are
+        ax.set_xlim(-1, 1)
+        ax.set_ylim(-1, 1)
+        renderer.render_view(ax)
+        arrays = renderer._path_arrays(table, 'poly')
+        self.assertFalse(
+            any(
+                is_box(vertices, row_bounds)
+                for (vertices, _), row_bounds in zip(arrays, bounds)))
+
+        # No boxes when box_pixels is 0
+        ax.set_xlim(-400, 400)
+        ax.set_ylim(-400, 400)
+        renderer.options.box_pixels = '0'
+        renderer.render_view(ax)
+        arrays = renderer._path_arrays(table, 'poly')
+        self.assertFalse(
+            any(
+                is_box(vertices, row_bounds)
+                for (vertices, _), row_bounds in zip(arrays, bounds)))
+
+    def test_renderer_gds_airbridge_cells(self):
+        """Test that export_to_gds in gds_renderer.py makes the airbridge
+        cell only when airbridges are placed."""
+        design = designs.DesignPlanar()
+        OpenToGround(design,
+                     'Open_start',
+                     options=Dict(pos_x='1000um',
+                                  pos_y='0um',
+                                  orientation='-90'))
+        OpenToGround(design,
+                     'Open_end',
+                     options=Dict(pos_x='1200um',
+                                  pos_y='500um',
+                                  orientation='0'))
+        route = RouteMixed(design,
+                           'route',
+                           options=Dict(pin_inputs=Dict(
+                               start_pin=Dict(component='Open_start',
+                                              pin='open'),
+                               end_pin=Dict(component='Open_end', pin='open')),
+                                        fillet='49.99um',
+                                        gds_make_airbridge=True))
+        renderer = QGDSRenderer(design)
+        renderer.options.make_airbridges = True
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'airbridges.gds')
+            self.assertEqual(renderer.export_to_gds(path), 1)
+            cells = gdspy.GdsLibrary(infile=path).cells
+            self.assertIn('TOP_main_ab_bridge', cells)
+            self.assertGreater(len(cells['TOP_main_ab'].references), 0)
+
+            route.options.gds_make_airbridge = False
+            route.rebuild()
+            self.assertEqual(renderer.export_to_gds(path), 1)
+            cells = gdspy.GdsLibrary(infile=path).cells
+            self.assertNotIn('TOP_main_ab_bridge', cells)
+
     def test_renderer_gds_check_uniform_airbridge(self):
         """Tests uniform airbridge placement via Airbridging"""
         design = designs.DesignPlanar()
@@ -651,6 +1294,23 @@ class TestRenderers(unittest.TestCase):
                               (1.0146417320084844, 0.4853582679915155, 45.0)]
         self.assertEqual(ab_placement_result, ab_placement_check)
 
+        all_placement_result = airbridging.find_all_uniform_ab_placements(
+            bridge_pitch=0.3, bridge_minimum_spacing=0.005)
+        self.assertEqual(all_placement_result.tolist(),
+                         [list(check) for check in ab_placement_check])
+
+        placement, owner = Airbridging._uniform_ab_placement(
+            points=[np.array([(0, 0), (1, 0)]),
+                    np.array([(0, 0), (0, 0.5)])],
+            fillets=[0, 0],
+            bridge_pitch=0.3,
+            bridge_minimum_spacing=0,
+            precision=0.000001)
+        self.assertEqual(owner.tolist(), [0, 0, 0, 1])
+        np.testing.assert_allclose(placement[:, 0], [0.35, 0.65, 0.95, 0],
+                                   atol=1e-12)
+        np.testing.assert_allclose(placement[:, 2], [0, 0, 0, 90])
+
         test_ab_qgeom = pd.DataFrame({
             'geometry': [draw.Polygon([(0, 0), (1, 0), (0, 1)])],
             'layer': [1]
@@ -18,8 +18,14 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests for speed."""
 
+import json
+import os
+import subprocess
+import sys
 import unittest
 import time
+from qiskit_metal import Dict
+from qiskit_metal.tests import benchmarks
 from qiskit_metal.tests.custom_decorators import timeout
 
 
@@ -42,6 +48,66 @@ class TestSpeed(unittest.TestCase):
         time.sleep(4)
         self.assertEqual(4, 2 + 2)
 
+    @timeout(60)
+    def test_import_headless(self):
+        """Test that a headless import of qiskit_metal is fast and loads
+        neither Qt, pyplot nor the GUI, analyses and renderers."""
+        code = (
+            'import sys, time\n'
+            'start = time.perf_counter()\n'
+            'import qiskit_metal\n'
+            'print(time.perf_counter() - start)\n'
+            'for name in (\'PySide2\', \'matplotlib.pyplot\',\n'
+            '             \'qiskit_metal._gui\', \'qiskit_metal.analyses\',\n'
+            '             \'qiskit_metal.renderers\'):\n'
+            '    print(name in sys.modules)\n')
+        env = dict(os.environ, QISKIT_METAL_HEADLESS='1')
+        output = subprocess.run([sys.executable, '-c', code],
+                                env=env,
+                                stdout=subprocess.PIPE,
+                                check=True,
+                                universal_newlines=True).stdout.split()
+
+        self.assertLess(float(output[0]), 5)
+        self.assertEqual(output[1:], ['False'] * 5)
+
+    @timeout(60)
+    def test_benchmarks_quick(self):
+        """Test that the benchmarks run and their results are json."""
+        names = [benchmark.name for benchmark in benchmarks.get_benchmarks()]
+        self.assertIn('TimeRebuild.time_rebuild', names)
+        self.assertIn('TimeGDSExport.time_export', names)
+
+        results = benchmarks.run_benchmarks('TimeParseValue', quick=True)
+        results = json.loads(json.dumps(results))
+        self.assertEqual(len(results['results']), 2)
+        for result in results['results']:
+            self.assertEqual(result['status'], 'ok')
+            self.assertEqual(len(result['times']), 1)
+
+        comparison = benchmarks.compare_results(results, results)
+        self.assertEqual(len(comparison), 2)
+        self.assertFalse(any(entry['regression'] for entry in comparison))
+
+        # Only SkipBenchmark skips, the other errors of a setup are reported
+        class TimeSetup:
+            """Benchmark whose setup raises the error given as parameter."""
+
+            def setup(self, error):
+                raise error
+
+            def time_nothing(self, error):
+                pass
+
+        benchmark = Dict(name='TimeSetup.time_nothing',
+                         cls=TimeSetup,
+                         method='time_nothing')
+        result = benchmarks.run_benchmark(
+            benchmark, (benchmarks.SkipBenchmark('Not here'),))
+        self.assertEqual(result['status'], 'skipped')
+        result = benchmarks.run_benchmark(benchmark, (ImportError('No'),))
+        self.assertEqual(result['status'], 'error')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
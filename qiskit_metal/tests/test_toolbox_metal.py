@@ -18,14 +18,21 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests analyses functionality."""
 
+import os
+import tempfile
 import unittest
 import numpy as np
 from typing import Union
 
+from shapely.geometry import LineString
+
 from qiskit_metal.toolbox_metal import about
 from qiskit_metal.toolbox_metal import parsing
 from qiskit_metal.toolbox_metal import math_and_overrides
 from qiskit_metal.toolbox_metal import bounds_for_path_and_poly_tables
+from qiskit_metal.toolbox_metal import fillet
+from qiskit_metal.toolbox_metal import batch
+from qiskit_metal.toolbox_metal.qlibrary_index import QLibraryIndex
 from qiskit_metal.toolbox_metal.bounds_for_path_and_poly_tables import BoundsForPathAndPolyTables
 from qiskit_metal.toolbox_metal.layer_stack_handler import LayerStackHandler
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalExceptions
@@ -858,5 +865,147 @@ class TestToolboxMetal(unittest.TestCase, AssertionsMixin):
                 multiplanar_design,
                 (ls_file_path, None)).layer_stack_handler_pilot_error(), None)
 
+    def test_toolbox_metal_fillet_bad_fillet_idxs_batch(self):
+        """Test bad_fillet_idxs_batch in fillet.py matches bad_fillet_idxs."""
+        lines = [
+            LineString([(1.0, 1.0), (1.5, 1.5), (1.51, 1.5), (2.0, 2.0)]),
+            LineString([(0, 0), (1, 0), (1, 1)]),
+            LineString([(0, 0), (1, 0)])
+        ]
+        results = fillet.bad_fillet_idxs_batch(lines, [0.1, 0.1, 0.1])
+        self.assertEqual(results, [[1, 2], [], []])
+
+        results = fillet.bad_fillet_idxs_batch(lines[1:2], [2.0])
+        self.assertEqual(results, [[1]])
+
+    def test_toolbox_metal_fillet_paths(self):
+        """Test fillet_paths in fillet.py."""
+        cache = fillet.FilletCache()
+        lines = [
+            LineString([(0, 0), (1, 0), (1, 1)]),
+            LineString([(0, 0), (1, 0), (1, 1)]),
+            LineString([(0, 0), (1, 0)])
+        ]
+        results = fillet.fillet_paths(lines, [0.1, float('nan'), 0.1],
+                                      points=5,
+                                      cache=cache)
+
+        coords = np.array(results[0].coords)
+        self.assertEqual(len(coords), 7)
+        for actual, expected in zip(coords[1], (0.9, 0)):
+            self.assertAlmostEqualRel(actual,
+                                      expected,
+                                      rel_tol=1e-9,
+                                      abs_tol=1e-12)
+        for actual, expected in zip(coords[5], (1, 0.1)):
+            self.assertAlmostEqualRel(actual,
+                                      expected,
+                                      rel_tol=1e-9,
+                                      abs_tol=1e-12)
+        self.assertIs(results[1], lines[1])
+        self.assertIs(results[2], lines[2])
+        self.assertEqual(len(cache), 1)
+
+        cached = fillet.fillet_paths(lines[:1], [0.1], points=5, cache=cache)
+        self.assertIs(cached[0], results[0])
+
+    def test_toolbox_metal_qlibrary_index(self):
+        """Test QLibraryIndex in qlibrary_index.py."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'my_qubit.py')
+            with open(path, 'w') as handle:
+                handle.write('class MyQubit(TransmonPocket):\n'
+                             '    """.. image::\n        my.png\n\n'
+                             '    .. meta::\n        My Qubit\n    """\n'
+                             '    default_options = Dict(a=\'1um\', '
+                             'b=dict(c=[1, 2]))\n')
+            index_file = os.path.join(folder, 'index.json')
+            qubits = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                  'qlibrary', 'qubits')
+
+            index = QLibraryIndex(index_file)
+            self.assertGreater(index.update([folder, qubits]), 1)
+            entry = index.get(path)
+            self.assertEqual(entry.icon, 'my.png')
+            self.assertEqual(entry.name, 'My Qubit')
+            self.assertEqual(entry.classes.MyQubit.default_options,
+                             dict(a='1um', b=dict(c=[1, 2])))
+            # Inherited from TransmonPocket
+            self.assertEqual(
+                index.tooltip(path),
+                index.tooltip(os.path.join(qubits, 'transmon_pocket.py')))
+            self.assertNotEqual(index.tooltip(path), '')
+
+            # Saved, and unchanged files are not parsed again
+            index = QLibraryIndex(index_file)
+            self.assertEqual(index.update([folder, qubits]), 0)
+            with open(path, 'a') as handle:
+                handle.write('    TOOLTIP = """Mine"""\n')
+            self.assertEqual(index.tooltip(path), 'Mine')
+
+    def test_toolbox_metal_batch(self):
+        """Test the parameter tables and the variants of batch.py."""
+        with tempfile.TemporaryDirectory() as folder:
+            table_csv = os.path.join(folder, 'variants.csv')
+            with open(table_csv, 'w') as handle:
+                handle.write('name,pad_gap,pos_x\nsmall,20um,0mm\n'
+                             'large,40um,\n')
+            table_json = os.path.join(folder, 'variants.json')
+            with open(table_json, 'w') as handle:
+                handle.write('[{"pad_gap": "20um"}, {"pad_gap": "40um"}]')
+            script = os.path.join(folder, 'chip.py')
+            with open(script, 'w') as handle:
+                handle.write(
+                    'from qiskit_metal import designs\n'
+                    'from qiskit_metal.qlibrary.qubits.transmon_pocket '
+                    'import TransmonPocket\n'
+                    'design = designs.DesignPlanar()\n'
+                    'TransmonPocket(design, "Q1", options=params)\n')
+
+            rows = batch.load_parameter_table(table_csv)
+            self.assertEqual([row.name for row in rows], ['small', 'large'])
+            self.assertEqual(rows[1].params, dict(pad_gap='40um'))
+            rows = batch.load_parameter_table(table_json)
+            self.assertEqual([row.name for row in rows], [None, None])
+            with self.assertRaises(InputError):
+                batch.load_parameter_table(script)
+
+            variants = batch.make_variants([script], rows)
+            self.assertEqual([variant.name for variant in variants],
+                             ['variant_000', 'variant_001'])
+            self.assertEqual(batch.make_variants([script])[0].name, 'chip')
+            with self.assertRaises(InputError):
+                batch.make_variants([script, script], rows)
+
+            result = batch.build_variant(variants[1], folder, gds=False)
+            self.assertEqual(result['status'], 'ok')
+            self.assertEqual(result['num_components'], 1)
+            self.assertIn('build', result['timings'])
+
+            design = batch._load_design(script, dict(pad_gap='40um'))
+            batch._apply_params(design, {
+                'Q1.pad_gap': '50um',
+                'variables.cpw_width': '12um'
+            })
+            self.assertEqual(design.components.Q1.options.pad_gap, '50um')
+            self.assertEqual(design.variables.cpw_width, '12um')
+            with self.assertRaises(InputError):
+                batch._apply_params(design, {'Q2.pad_gap': '50um'})
+
+        # The workers are started headless, this process is not changed
+        headless = os.environ.pop('QISKIT_METAL_HEADLESS', None)
+        try:
+            with batch._headless_environ():
+                self.assertEqual(os.environ['QISKIT_METAL_HEADLESS'], '1')
+            self.assertNotIn('QISKIT_METAL_HEADLESS', os.environ)
+            os.environ['QISKIT_METAL_HEADLESS'] = ''
+            with batch._headless_environ():
+                self.assertEqual(os.environ['QISKIT_METAL_HEADLESS'], '1')
+            self.assertEqual(os.environ['QISKIT_METAL_HEADLESS'], '')
+        finally:
+            os.environ.pop('QISKIT_METAL_HEADLESS', None)
+            if headless is not None:
+                os.environ['QISKIT_METAL_HEADLESS'] = headless
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
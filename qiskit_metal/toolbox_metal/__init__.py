@@ -41,12 +41,14 @@ Submodules
     :toctree: ../stubs/
 
     about
+    batch
     import_export
     math_and_overrides
     parsing
     layer_stack_handler
     bounds_for_path_and_poly_tables
     determine_larger_box
+    fillet
 
 """
 
@@ -62,8 +64,10 @@ if config.is_building_docs():
     from . import about
     from .exceptions import QiskitMetalDesignError
     from .exceptions import QiskitMetalExceptions
+    from . import batch
     from . import import_export
     from . import parsing
     from . import math_and_overrides
     from . import layer_stack_handler
     from . import bounds_for_path_and_poly_tables
+    from . import fillet
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Build variants of designs in parallel worker processes and export them,
+without the GUI.  Used by the ``qiskit-metal build`` command.
+
+A variant is a source and a set of parameters:
+
+* A build script (.py) is run with the parameters in its global ``params``.
+  If it defines ``build_design``, this function is called with the
+  parameters as keyword arguments and returns the design.  Otherwise the
+  script must assign the design to the global ``design``.
+* A saved design (.metal) is loaded, the parameters are applied and the
+  design is rebuilt.  A parameter ``variables.name`` sets a design variable
+  and ``Q1.pad_gap`` or ``Q1.connection_pads.a.pad_width`` sets an option of
+  the component Q1.
+
+Each variant is exported to its own folder of the output directory, and the
+outputs and timings of all the variants are written to a json manifest.
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import runpy
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Union
+
+from .. import Dict, __version__, logger
+from .exceptions import InputError
+
+__all__ = [
+    'load_parameter_table', 'make_variants', 'build_variant', 'run_batch'
+]
+
+SCRIPT_SUFFIXES = ('.py',)
+"""Suffixes of the design build scripts"""
+
+MANIFEST_VERSION = 1
+"""Version of the format of the manifest"""
+
+
+def load_parameter_table(path: Union[str, Path]) -> List[Dict]:
+    """Read a table of parameters, one row per variant.
+
+    A .csv file has a header with the names of the parameters; all values
+    are read as strings, as for the options of the components.  An empty
+    cell leaves the parameter unset for this row.  A .json
+    file holds a list of objects, or an object which maps the name of each
+    variant to its parameters.  The optional column or key ``name`` names the
+    variant.
+
+    Args:
+        path (Union[str, Path]): Path of the .csv or .json file.
+
+    Returns:
+        List[Dict]: The rows.  Each row has the keys name (None if not given)
+        and params.
+
+    Raises:
+        InputError: If the file is not a .csv or .json table.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.csv':
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+        table = pd.read_csv(path, dtype=str, keep_default_na=False)
+        rows = table.to_dict(orient='records')
+        # An empty cell leaves the parameter unset
+        for row in rows:
+            for key in [key for key, value in row.items() if value == '']:
+                del row[key]
+    elif suffix == '.json':
+        with open(path, encoding='utf-8') as handle:
+            rows = json.load(handle)
+        if isinstance(rows, dict):
+            rows = [dict(params, name=name) for name, params in rows.items()]
+    else:
+        raise InputError(
+            f'The parameter table {path} must be a .csv or .json file.')
+
+    if not isinstance(rows, list) or not all(
+            isinstance(row, dict) for row in rows):
+        raise InputError(
+            f'The parameter table {path} must hold a list of parameter sets.')
+
+    result = []
+    for row in rows:
+        row = dict(row)
+        name = row.pop('name', None)
+        result.append(Dict(name=str(name) if name else None, params=row))
+    return result
+
+
+def _safe_name(name: str) -> str:
+    """Name usable as a folder and file name.
+
+    Args:
+        name (str): Name of the variant.
+
+    Returns:
+        str: The name, with the characters other than letters, digits, '-',
+        '_' and '.' replaced by '_'.
+    """
+    return re.sub(r'[^\w\-.]', '_', name).strip('.') or '_'
+
+
+def make_variants(sources: List[Union[str, Path]],
+                  table: List[Dict] = None) -> List[Dict]:
+    """Combine every source with every row of the parameter table.
+
+    Args:
+        sources (List[Union[str, Path]]): Build scripts and saved designs.
+        table (List[Dict]): Rows returned by load_parameter_table.  None
+            builds each source once, without parameters.  Defaults to None.
+
+    Returns:
+        List[Dict]: The variants, with the keys name, source and params.
+
+    Raises:
+        InputError: If a source does not exist, or if two variants have the
+            same name.
+    """
+    if not table:
+        table = [Dict(name=None, params={})]
+
+    variants = []
+    for source in sources:
+        source = Path(source)
+        if not source.is_file():
+            raise InputError(f'The design source {source} does not exist.')
+        for num, row in enumerate(table):
+            name = row.name if row.name else f'variant_{num:03d}'
+            if len(table) == 1 and not row.name:
+                name = source.stem
+            elif len(sources) > 1:
+                name = f'{source.stem}-{name}'
+            variants.append(
+                Dict(name=_safe_name(name),
+                     source=str(source.resolve()),
+                     params=dict(row.params)))
+
+    names = [variant.name for variant in variants]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise InputError(f'The variant names {duplicates} are not unique. '
+                         'Give each row of the parameter table a name.')
+    return variants
+
+
+def _apply_params(design, params: dict):
+    """Apply parameters to a loaded design.
+
+    Args:
+        design (QDesign): The design.
+        params (dict): Maps 'variables.name' or 'component.option.path' to
+            the value.
+
+    Raises:
+        InputError: If a parameter does not name a variable or an option of
+            a component.
+    """
+    for key, value in params.items():
+        first, _, rest = key.partition('.')
+        if not rest:
+            raise InputError(f'The parameter {key} must be variables.<name> or '
+                             '<component>.<option>.')
+        if first == 'variables':
+            design.variables[rest] = value
+            continue
+        if first not in design.components:
+            raise InputError(
+                f'The parameter {key} names the component {first}, which is '
+                'not in the design.')
+        options = design.components[first].options
+        *path, last = rest.split('.')
+        for part in path:
+            options = options[part]
+        options[last] = value
+
+
+def _load_design(source: str, params: dict):
+    """Build or load the design of a variant.
+
+    Args:
+        source (str): Path of the build script or saved design.
+        params (dict): Parameters of the variant.
+
+    Returns:
+        QDesign: The design.
+
+    Raises:
+        InputError: If a build script does not produce a design.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .._is_design import is_design
+
+    if source.lower().endswith(SCRIPT_SUFFIXES):
+        namespace = runpy.run_path(source,
+                                   init_globals=dict(params=Dict(params)),
+                                   run_name='__qiskit_metal_build__')
+        if callable(namespace.get('build_design')):
+            design = namespace['build_design'](**params)
+        else:
+            design = namespace.get('design')
+        if not is_design(design):
+            raise InputError(
+                f'The build script {source} must define build_design(**params)'
+                ' returning the design, or assign it to the global design.')
+        return design
+
+    from .import_export import load_metal_design
+    design = load_metal_design(source)
+    if params:
+        _apply_params(design, params)
+        design.rebuild()
+    return design
+
+
+def _renderer(design, name: str):
+    """Renderer registered in the design.
+
+    Args:
+        design (QDesign): The design.
+        name (str): Name of the renderer, such as 'gds'.
+
+    Returns:
+        QRenderer: The renderer.
+
+    Raises:
+        InputError: If the renderer is not registered.
+    """
+    renderer = design.renderers.get(name)
+    if renderer is None:
+        raise InputError(
+            f'The renderer {name} is not registered in the design.  Create '
+            'the design with enable_renderers=True and check that the '
+            f'dependencies of the {name} renderer are installed.')
+    return renderer
+
+
+def build_variant(variant: Dict,
+                  out_dir: str,
+                  gds: bool = True,
+                  gmsh: bool = False,
+                  elmer: bool = False) -> dict:
+    """Build one variant and export it to out_dir/<name>.  Runs in a worker
+    process.  Errors are caught and recorded in the result.
+
+    Args:
+        variant (Dict): Variant returned by make_variants.
+        out_dir (str): Output directory of the batch.
+        gds (bool): Export the GDS file.  Defaults to True.
+        gmsh (bool): Render the design in Gmsh and export the mesh.
+            Defaults to False.
+        elmer (bool): Write the mesh and the simulation input file of
+            ElmerFEM for a capacitance simulation.  Defaults to False.
+
+    Returns:
+        dict: Entry of the variant in the manifest, with the keys name,
+        source, params, status ('ok' or 'error'), error, outputs, timings
+        (in seconds) and num_components.
+    """
+    start = time.perf_counter()
+    folder = Path(out_dir, variant.name).resolve()
+    folder.mkdir(parents=True, exist_ok=True)
+    result = dict(name=variant.name,
+                  source=variant.source,
+                  params=variant.params,
+                  status='ok',
+                  error=None,
+                  outputs={},
+                  timings={},
+                  num_components=None)
+    step = 'build'
+    try:
+        tic = time.perf_counter()
+        design = _load_design(variant.source, variant.params)
+        result['num_components'] = len(design.components)
+        result['timings']['build'] = time.perf_counter() - tic
+
+        if gds:
+            step = 'gds'
+            tic = time.perf_counter()
+            path = folder / f'{variant.name}.gds'
+            if not _renderer(design, 'gds').export_to_gds(str(path)):
+                raise RuntimeError(f'The GDS export to {path} failed.')
+            result['outputs']['gds'] = str(path)
+            result['timings']['gds'] = time.perf_counter() - tic
+
+        if gmsh:
+            step = 'gmsh'
+            tic = time.perf_counter()
+            renderer = _renderer(design, 'gmsh')
+            path = folder / f'{variant.name}.msh'
+            try:
+                renderer.render_design()
+                renderer.export_mesh(str(path))
+            finally:
+                renderer.close()
+            result['outputs']['gmsh'] = str(path)
+            result['timings']['gmsh'] = time.perf_counter() - tic
+
+        if elmer:
+            step = 'elmer'
+            tic = time.perf_counter()
+            renderer = _renderer(design, 'elmer')
+            sim_dir = folder / 'elmer'
+            renderer.options.simulation_dir = str(sim_dir)
+            # Absolute, since ElmerGrid runs from simulation_dir
+            renderer.options.mesh_file = str(folder /
+                                             f'{variant.name}_elmer.msh')
+            try:
+                renderer.render_design()
+                renderer.export_mesh()
+                renderer.add_solution_setup('capacitance')
+            finally:
+                renderer.close()
+            result['outputs']['elmer'] = str(sim_dir)
+            result['outputs']['elmer_mesh'] = renderer.options.mesh_file
+            result['timings']['elmer'] = time.perf_counter() - tic
+
+    except Exception:  # pylint: disable=broad-except
+        result['status'] = 'error'
+        result['error'] = f'{step}: {traceback.format_exc()}'
+
+    result['timings']['total'] = time.perf_counter() - start
+    return result
+
+
+@contextmanager
+def _headless_environ():
+    """Set QISKIT_METAL_HEADLESS while the worker processes are started, so
+    that they inherit it before they import qiskit_metal.  It is restored
+    after, so that this process is not changed."""
+    headless = os.environ.get('QISKIT_METAL_HEADLESS')
+    os.environ['QISKIT_METAL_HEADLESS'] = '1'
+    try:
+        yield
+    finally:
+        if headless is None:
+            del os.environ['QISKIT_METAL_HEADLESS']
+        else:
+            os.environ['QISKIT_METAL_HEADLESS'] = headless
+
+
+def run_batch(sources: List[Union[str, Path]],
+              out_dir: Union[str, Path],
+              table: Union[str, Path] = None,
+              jobs: int = None,
+              gds: bool = True,
+              gmsh: bool = False,
+              elmer: bool = False,
+              manifest: str = 'manifest.json',
+              callback: Callable = None) -> dict:
+    """Build and export every variant, each in a worker process, and write
+    the manifest.
+
+    The workers run headless (QISKIT_METAL_HEADLESS) and are started with
+    the spawn method, so that no Qt or Gmsh state is shared with this
+    process.
+
+    Args:
+        sources (List[Union[str, Path]]): Build scripts and saved designs.
+        out_dir (Union[str, Path]): Output directory.  Created if needed.
+        table (Union[str, Path]): Parameter table, see load_parameter_table.
+            None to build each source once.  Defaults to None.
+        jobs (int): Number of worker processes.  None for the number of
+            cores.  Defaults to None.
+        gds (bool): Export the GDS files.  Defaults to True.
+        gmsh (bool): Export the Gmsh meshes.  Defaults to False.
+        elmer (bool): Write the ElmerFEM inputs.  Defaults to False.
+        manifest (str): File name of the manifest, in out_dir.
+            Defaults to 'manifest.json'.
+        callback (Callable): Called as callback(done, total, result) in this
+            process when a variant is done.  Defaults to None.
+
+    Returns:
+        dict: The manifest.  Its key variants holds the results of
+        build_variant, in the order of the sources and of the table.
+    """
+    start = time.perf_counter()
+    rows = load_parameter_table(table) if table else None
+    variants = make_variants(sources, rows)
+    out_dir = Path(out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(variants)))
+
+    logger.info(f'Building {len(variants)} variants with {jobs} workers '
+                f'into {out_dir}')
+
+    results = {}
+    with _headless_environ(), ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {
+            executor.submit(build_variant, variant, str(out_dir), gds, gmsh,
+                            elmer): variant for variant in variants
+        }
+        for future in as_completed(futures):
+            variant = futures[future]
+            try:
+                result = future.result()
+            except Exception:  # pylint: disable=broad-except
+                # The worker process died, for example out of memory
+                result = dict(name=variant.name,
+                              source=variant.source,
+                              params=variant.params,
+                              status='error',
+                              error=traceback.format_exc(),
+                              outputs={},
+                              timings={},
+                              num_components=None)
+            results[variant.name] = result
+            if callback:
+                callback(len(results), len(variants), result)
+
+    variant_results = [results[variant.name] for variant in variants]
+    report = dict(
+        version=MANIFEST_VERSION,
+        qiskit_metal=__version__,
+        created=datetime.now().isoformat(timespec='seconds'),
+        sources=[str(Path(source).resolve()) for source in sources],
+        table=str(Path(table).resolve()) if table else None,
+        jobs=jobs,
+        exports=dict(gds=gds, gmsh=gmsh, elmer=elmer),
+        num_ok=sum(result['status'] == 'ok' for result in variant_results),
+        num_error=sum(result['status'] != 'ok' for result in variant_results),
+        wall_time=time.perf_counter() - start,
+        variants=variant_results,
+    )
+    with open(out_dir / manifest, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+    return report
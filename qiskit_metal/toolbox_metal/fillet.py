@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Fillet engine shared by the renderers.
+
+Works on all the LineStrings of a qgeometry table at once. The coordinates
+of every path are concatenated into one ragged array, so which corners can
+be filleted, and the fillet arcs themselves, are computed with NumPy over
+the whole table instead of corner by corner. Results are cached by the WKB
+of the geometry, so redrawing an unchanged design does not redo the work.
+
+The rules are the same as `utility_functions.bad_fillet_idxs`: a corner is
+not filleted if one of its segments is shorter than twice the fillet radius,
+or shorter than the radius for the first and last segments of a path.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import shapely
+
+__all__ = [
+    'FilletCache', 'fillet_cache', 'bad_fillet_idxs_batch', 'fillet_corners',
+    'fillet_paths'
+]
+
+
+class FilletCache:
+    """Least recently used cache of fillet results, keyed by the WKB of the
+    geometry and the fillet parameters."""
+
+    def __init__(self, maxsize: int = 50000):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept.  Defaults to 50000.
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key (tuple): Cache key
+            default (object): Returned if key is not cached.  Defaults to None.
+
+        Returns:
+            object: The cached value, or default
+        """
+        if key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+        return default
+
+    def set(self, key, value):
+        """Cache a value, dropping the least recently used entries if full.
+
+        Args:
+            key (tuple): Cache key
+            value (object): Value to cache
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all the cached values."""
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Shared by all the renderers of the session.
+fillet_cache = FilletCache()
+
+
+def _ragged_coords(geometries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate the 2D coordinates of the geometries.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (N, 2) coordinates, and the offsets
+        of each geometry into them, of length len(geometries) + 1.
+    """
+    coords, index = shapely.get_coordinates(geometries, return_index=True)
+    counts = np.bincount(index, minlength=len(geometries))
+    offsets = np.zeros(len(geometries) + 1, dtype=int)
+    np.cumsum(counts, out=offsets[1:])
+    return coords, offsets
+
+
+def _bad_vertex_mask(coords: np.ndarray,
+                     offsets: np.ndarray,
+                     fradius: np.ndarray,
+                     precision: int = 9,
+                     isclosed: bool = False) -> np.ndarray:
+    """Flag, for every vertex of the ragged array, whether it cannot be
+    filleted. For open paths the end vertices are never flagged.
+
+    Args:
+        coords (np.ndarray): Ragged (N, 2) coordinates
+        offsets (np.ndarray): Offsets of each path into coords
+        fradius (np.ndarray): Fillet radius of each path
+        precision (int): Digits of precision used to round the segment
+            lengths.  Defaults to 9.
+        isclosed (bool): The paths are closed rings.  Defaults to False.
+
+    Returns:
+        np.ndarray: Boolean mask of length N
+    """
+    num = len(coords)
+    counts = np.diff(offsets)
+    row = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(num) - offsets[row]
+    length = counts[row]
+    radius = np.asarray(fradius, dtype=float)[row]
+
+    if isclosed:
+        prev_idx = np.where(local == 0,
+                            np.arange(num) + length - 1,
+                            np.arange(num) - 1)
+        next_idx = np.where(local == length - 1,
+                            np.arange(num) - length + 1,
+                            np.arange(num) + 1)
+        left = np.hypot(*(coords - coords[prev_idx]).T)
+        right = np.hypot(*(coords[next_idx] - coords).T)
+        return np.minimum(np.round(left, precision), np.round(
+            right, precision)) < 2 * radius
+
+    # seg[k] is the length of the segment from vertex k to k+1; the entries
+    # that span two paths are never used.
+    seg = np.round(np.hypot(*np.diff(coords, axis=0).T), precision)
+    inner = (local > 0) & (local < length - 1)
+    bad = np.zeros(num, dtype=bool)
+    idx = np.flatnonzero(inner)
+    # The first and last segments only need to fit one radius.
+    left_limit = np.where(local[idx] == 1, 1., 2.) * radius[idx]
+    right_limit = np.where(local[idx] == length[idx] - 2, 1., 2.) * radius[idx]
+    bad[idx] = (seg[idx - 1] < left_limit) | (seg[idx] < right_limit)
+    return bad
+
+
+def bad_fillet_idxs_batch(geometries: Iterable,
+                          fradius: Iterable,
+                          precision: int = 9,
+                          isclosed: bool = False) -> List[List[int]]:
+    """Batch version of `utility_functions.bad_fillet_idxs`.
+
+    Args:
+        geometries (Iterable): LineStrings (or LinearRings if isclosed)
+        fradius (Iterable): Fillet radius of each geometry
+        precision (int, optional): Digits of precision used for round().
+            Defaults to 9.
+        isclosed (bool, optional): Whether the shapes are closed.
+            Defaults to False.
+
+    Returns:
+        List[List[int]]: For each geometry, the indices of the vertices too
+        close to their neighbors to be filleted.
+    """
+    geometries = np.asarray(list(geometries), dtype=object)
+    if len(geometries) == 0:
+        return []
+    coords, offsets = _ragged_coords(geometries)
+    bad = _bad_vertex_mask(coords, offsets, np.asarray(list(fradius), float),
+                           precision, isclosed)
+    return [
+        np.flatnonzero(bad[start:stop]).tolist()
+        for start, stop in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+def fillet_corners(vertex_start: np.ndarray,
+                   vertex_corner: np.ndarray,
+                   vertex_end: np.ndarray,
+                   radius: np.ndarray,
+                   points: int = 16) -> Tuple[np.ndarray, np.ndarray]:
+    """Fillet arcs of many corners at once.
+
+    Args:
+        vertex_start (np.ndarray): (M, 2) coordinates of the start vertices
+        vertex_corner (np.ndarray): (M, 2) coordinates of the corner vertices
+        vertex_end (np.ndarray): (M, 2) coordinates of the end vertices
+        radius (np.ndarray): Fillet radius of each corner, or a scalar
+        points (int): Number of points to draw in each fillet corner.
+            Defaults to 16.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (M, points, 2) arcs, and a boolean
+        mask of the corners that can be filleted.  A corner cannot be
+        filleted if its vertices are not distinct, if they are collinear, or
+        if the fillet circle does not fit inside the corner.
+    """
+    radius = np.broadcast_to(np.asarray(radius, dtype=float),
+                             (len(vertex_corner),))[:, None]
+    sc_vec = vertex_start - vertex_corner
+    ec_vec = vertex_end - vertex_corner
+    sc_norm = np.hypot(*sc_vec.T)[:, None]
+    ec_norm = np.hypot(*ec_vec.T)[:, None]
+    valid = (sc_norm[:, 0] > 0) & (ec_norm[:, 0] > 0)
+
+    with np.errstate(all='ignore'):
+        sc_uvec = sc_vec / sc_norm
+        ec_uvec = ec_vec / ec_norm
+        # Angle between the two segments of the corner
+        end_angle = np.arccos(
+            np.clip(np.sum(sc_uvec * ec_uvec, axis=1), -1., 1.))[:, None]
+        valid &= (end_angle[:, 0] != 0) & (end_angle[:, 0] != np.pi)
+        # Fillet circle must be small enough to fit inside corner
+        valid &= ~(radius / np.tan(end_angle / 2) > np.minimum(
+            sc_norm, ec_norm))[:, 0]
+
+        net_vec = sc_uvec + ec_uvec
+        net_uvec = net_vec / np.hypot(*net_vec.T)[:, None]
+        circle_center = vertex_corner + net_uvec * radius / np.sin(
+            end_angle / 2)
+
+        # Midpoint angle from circle center to corner, then the start and
+        # end sweep angles, swapped so the arc runs from the start vertex.
+        delta = vertex_corner - circle_center
+        theta_mid = np.arctan2(delta[:, 1], delta[:, 0])[:, None]
+        theta_start = theta_mid - (np.pi - end_angle) / 2
+        theta_end = theta_mid + (np.pi - end_angle) / 2
+        p1 = circle_center + radius * np.hstack(
+            (np.cos(theta_start), np.sin(theta_start)))
+        p2 = circle_center + radius * np.hstack(
+            (np.cos(theta_end), np.sin(theta_end)))
+        swap = (np.hypot(*(vertex_start - p2).T) <
+                np.hypot(*(vertex_start - p1).T))[:, None]
+        theta_start, theta_end = (np.where(swap, theta_end, theta_start),
+                                  np.where(swap, theta_start, theta_end))
+
+        theta = np.linspace(theta_start[:, 0], theta_end[:, 0], points, axis=1)
+        arcs = circle_center[:, None, :] + radius[:, :, None] * np.stack(
+            (np.cos(theta), np.sin(theta)), axis=-1)
+
+    # Nearly collinear corners give a degenerate circle
+    valid &= np.isfinite(arcs).all(axis=(1, 2))
+    return arcs, valid
+
+
+def _fillet_paths_uncached(geometries: np.ndarray, fradius: np.ndarray,
+                           points: int, precision: int) -> np.ndarray:
+    """Fillet LineStrings with at least 3 vertices, without the cache."""
+    coords, offsets = _ragged_coords(geometries)
+    counts = np.diff(offsets)
+    row = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(len(coords)) - offsets[row]
+    inner = np.flatnonzero((local > 0) & (local < counts[row] - 1))
+
+    bad = _bad_vertex_mask(coords, offsets, fradius, precision)
+    arcs, valid = fillet_corners(coords[inner - 1], coords[inner],
+                                 coords[inner + 1], fradius[row[inner]], points)
+    filleted = np.zeros(len(coords), dtype=bool)
+    filleted[inner] = valid & ~bad[inner]
+
+    # Each vertex becomes either itself or the points of its arc.
+    sizes = np.where(filleted, points, 1)
+    starts = np.cumsum(sizes) - sizes
+    out = np.empty((sizes.sum(), 2))
+    keep = ~filleted
+    out[starts[keep]] = coords[keep]
+    arc_rows = filleted[inner]
+    out[starts[inner[arc_rows]][:, None] + np.arange(points)] = arcs[arc_rows]
+
+    out_index = np.repeat(row, sizes)
+    return shapely.linestrings(out, indices=out_index)
+
+
+def fillet_paths(geometries: Iterable,
+                 fradius: Iterable,
+                 points: int = 16,
+                 precision: int = 9,
+                 cache: FilletCache = fillet_cache) -> np.ndarray:
+    """Fillet the corners of many LineStrings at once.
+
+    Corners for which `bad_fillet_idxs` applies, or that `fillet_corners`
+    cannot fillet, are kept as they are. Geometries that are not
+    LineStrings with at least 3 vertices, or that have no positive
+    fillet radius, are returned unchanged.
+
+    Args:
+        geometries (Iterable): LineStrings, such as the geometry column of
+            the path table
+        fradius (Iterable): Fillet radius of each geometry, such as the
+            fillet column of the path table
+        points (int): Number of points to draw in each fillet corner.
+            Defaults to 16.
+        precision (int): Digits of precision used for round().  Defaults to 9.
+        cache (FilletCache): Cache to use, None to not cache.
+            Defaults to the shared fillet_cache.
+
+    Returns:
+        np.ndarray: The filleted geometries, in the same order
+    """
+    geometries = np.asarray(list(geometries), dtype=object)
+    fradius = np.asarray(list(fradius), dtype=float)
+    result = geometries.copy()
+    if len(geometries) == 0:
+        return result
+
+    todo = (shapely.get_type_id(geometries) == 1) & (fradius > 0)
+    todo[todo] &= shapely.get_num_coordinates(geometries[todo]) > 2
+    todo = np.flatnonzero(todo)
+    if len(todo) == 0:
+        return result
+
+    keys = None
+    if cache is not None:
+        keys = [
+            (wkb, rad, points, precision)
+            for wkb, rad in zip(shapely.to_wkb(geometries[todo]), fradius[todo])
+        ]
+        hits = [cache.get(key) for key in keys]
+        missing = np.array([hit is None for hit in hits])
+        result[todo[~missing]] = [hit for hit in hits if hit is not None]
+    else:
+        missing = np.ones(len(todo), dtype=bool)
+
+    if missing.any():
+        idx = todo[missing]
+        new = _fillet_paths_uncached(geometries[idx], fradius[idx], points,
+                                     precision)
+        result[idx] = new
+        if cache is not None:
+            missing_keys = [key for key, miss in zip(keys, missing) if miss]
+            for key, geom in zip(missing_keys, new):
+                cache.set(key, geom)
+    return result
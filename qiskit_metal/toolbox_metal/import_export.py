@@ -43,6 +43,9 @@ def save_metal(filename: str, design):
     self = design  # cludge for lazy tying
     logger = self.logger
     self.logger = None
+    # The callbacks of the GUI cannot be pickled
+    change_callbacks = getattr(self, '_change_callbacks', [])
+    self._change_callbacks = []
 
     # Pickle
     # TODO: Right now just does pickle. Need to serialize object into JSON
@@ -61,6 +64,7 @@ def save_metal(filename: str, design):
 
     # restore -- also need to do in the load function
     self.logger = logger
+    self._change_callbacks = change_callbacks
     return result
 
 
@@ -176,8 +176,6 @@ from typing import Union
 
 import ast
 import numpy as np
-import pint
-from pint import UnitRegistry
 
 from .. import Dict, config, logger
 
@@ -217,7 +215,41 @@ def is_true(value: Union[str, int, bool, float]) -> bool:
 
 
 # The unit registry stores the definitions and relationships between units.
-UREG = pint.UnitRegistry()
+# Made on first use, as it takes a while. Available as UREG.
+_UREG = None
+
+
+def _unit_registry():
+    """The unit registry of pint, made on first use.
+
+    Returns:
+        pint.UnitRegistry: The registry.
+    """
+    global _UREG  # pylint: disable=global-statement
+    if _UREG is None:
+        import pint  # pylint: disable=import-outside-toplevel
+        _UREG = pint.UnitRegistry()
+    return _UREG
+
+
+def __getattr__(name: str):
+    """Make the unit registry on first access of UREG, u_reg or Q.
+
+    Args:
+        name (str): Name of the attribute.
+
+    Returns:
+        The registry, or its Quantity class for Q.
+
+    Raises:
+        AttributeError: If name is not part of the module.
+    """
+    if name in ('UREG', 'u_reg'):
+        return _unit_registry()
+    if name == 'Q':
+        return _unit_registry().Quantity
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 #########################################################################
 # Basic string to number
@@ -251,7 +283,7 @@ def _parse_string_to_float(expr: str):
         Exception: Errors in parsing
     """
     try:
-        return UREG.Quantity(expr).to(units).magnitude
+        return _unit_registry().Quantity(expr).to(units).magnitude
 
     except Exception:
         # DimensionalityError, UndefinedUnitError, TypeError
@@ -463,11 +495,7 @@ LENGTH_UNIT = 'meter'
 # we can assume the following using
 LENGTH_UNIT_ASSUMED = 'mm'
 
-try:
-    u_reg = UnitRegistry()
-    Q = u_reg.Quantity
-except (ImportError, ModuleNotFoundError):
-    pass  # raise NameError ("Pint module not installed. Please install.")
+# The unit registry, u_reg, and its Quantity, Q, are the ones of UREG.
 
 
 def extract_value_unit(expr, units):
@@ -478,7 +506,7 @@ def extract_value_unit(expr, units):
     """
     # pylint: disable=broad-except
     try:
-        return Q(expr).to(units).magnitude
+        return _unit_registry().Quantity(expr).to(units).magnitude
     except Exception:
         try:
             return float(expr)
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Index of the QComponent classes of the QLibrary, used by the library
+browser of the GUI.
+
+The files are parsed with ast, never imported, so browsing the library does
+not run any code.  The index is saved to a json file and only the files
+which changed since the last save are parsed again.
+"""
+
+import ast
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Union
+
+from .. import Dict, logger
+
+__all__ = ['QLibraryIndex']
+
+
+def _literal(node: ast.AST):
+    """Value of an ast node made of literals, dict literals and Dict(...)
+    calls, as used by default_options.
+
+    Args:
+        node (ast.AST): Node to evaluate.
+
+    Returns:
+        Value of the node.
+
+    Raises:
+        ValueError: If the node is not made of literals.
+    """
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and \
+            node.func.id in ('Dict', 'dict') and not node.args:
+        result = {}
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                result.update(_literal(keyword.value))
+            else:
+                result[keyword.arg] = _literal(keyword.value)
+        return result
+    if isinstance(node, ast.Dict):
+        result = {}
+        for key, value in zip(node.keys, node.values):
+            if key is None:
+                result.update(_literal(value))
+            else:
+                result[_literal(key)] = _literal(value)
+        return result
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_literal(item) for item in node.elts]
+    return ast.literal_eval(node)
+
+
+def _parse_file(path: str) -> Dict:
+    """Read the classes of a python file, without importing it.
+
+    Args:
+        path (str): Path of the python file.
+
+    Returns:
+        Dict: The entry of the file in the index.  Has the keys name, icon
+        and classes.  classes maps the name of each class defined in the file
+        to a Dict with the keys bases, tooltip, default_options and
+        component_metadata.  Values which are not literals are None.
+    """
+    text = Path(path).read_text(encoding='utf-8', errors='replace')
+    entry = Dict(name=None, icon=None, classes={})
+
+    # Same docstring fields as used by QFileSystemLibraryModel
+    matches = re.findall(r'\.\. image::[\r\n]+([^\r\n]+)', text)
+    if matches:
+        entry.icon = matches[0].strip()
+    matches = re.findall(r'\.\. meta::[\r\n]+([^\r\n]+)', text)
+    if matches:
+        entry.name = matches[0].strip()
+
+    try:
+        tree = ast.parse(text, filename=path)
+    except SyntaxError as error:
+        logger.debug(f'QLibraryIndex could not parse {path}: {error}')
+        return entry
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        info = Dict(bases=[
+            base.attr if isinstance(base, ast.Attribute) else getattr(
+                base, 'id', None) for base in node.bases
+        ],
+                    tooltip=None,
+                    default_options=None,
+                    component_metadata=None)
+        for item in node.body:
+            if not isinstance(item, ast.Assign) or len(item.targets) != 1 or \
+                    not isinstance(item.targets[0], ast.Name):
+                continue
+            name = item.targets[0].id
+            key = name.lower() if name == 'TOOLTIP' else name
+            if key not in info or key == 'bases':
+                continue
+            try:
+                info[key] = _literal(item.value)
+            except (ValueError, TypeError, SyntaxError):
+                pass
+        entry.classes[node.name] = info
+    return entry
+
+
+class QLibraryIndex():
+    """Persistent index of the QComponent classes of python files.
+
+    Each file is stored with its modification time and size, and parsed
+    again when they change.
+
+    Example:
+        .. code-block:: python
+
+            index = QLibraryIndex('qlibrary_index.json')
+            index.update([qiskit_metal.qlibrary.__path__[0]])
+            index.tooltip(path_to_transmon_pocket_py)
+    """
+
+    version = 1
+    """Version of the format of the saved index"""
+
+    def __init__(self, file: str = None):
+        """
+        Args:
+            file (str): json file where the index is saved.  None to not
+                save it.  Defaults to None.
+        """
+        self.file = file
+        self._entries = {}
+        self._changed = False
+        self.load()
+
+    def load(self):
+        """Load the saved index.  A missing or invalid file gives an empty
+        index."""
+        self._entries = {}
+        if not self.file or not os.path.isfile(self.file):
+            return
+        try:
+            with open(self.file, encoding='utf-8') as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as error:
+            logger.debug(f'QLibraryIndex could not read {self.file}: {error}')
+            return
+        if data.get('version') == self.version:
+            self._entries = {
+                path: Dict(entry)
+                for path, entry in data.get('files', {}).items()
+            }
+
+    def save(self):
+        """Save the index, if it changed since it was loaded or saved."""
+        if not self.file or not self._changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.file)),
+                        exist_ok=True)
+            with open(self.file, 'w', encoding='utf-8') as handle:
+                json.dump(dict(version=self.version, files=self._entries),
+                          handle)
+            self._changed = False
+        except (OSError, TypeError, ValueError) as error:
+            logger.debug(f'QLibraryIndex could not write {self.file}: {error}')
+
+    def update(self, paths: Iterable[Union[str, Path]]) -> int:
+        """Index the python files under the paths, then save the index.
+        Only the new and changed files are parsed, and the files which no
+        longer exist are dropped.
+
+        Args:
+            paths (Iterable[Union[str, Path]]): Folders or python files.
+
+        Returns:
+            int: Number of files parsed.
+        """
+        parsed = 0
+        seen = set()
+        roots = [os.path.abspath(path) for path in paths]
+        for root in roots:
+            if os.path.isfile(root):
+                files = [root]
+            else:
+                files = (os.path.join(folder, name)
+                         for folder, dirs, names in os.walk(root)
+                         for name in names
+                         if name.endswith('.py') and not name.startswith('__'))
+            for path in files:
+                seen.add(path)
+                if self._refresh(path):
+                    parsed += 1
+
+        for path in list(self._entries):
+            if path not in seen and any(
+                    path.startswith(root) for root in roots):
+                del self._entries[path]
+                self._changed = True
+
+        self.save()
+        return parsed
+
+    def get(self, path: Union[str, Path]) -> Dict:
+        """Entry of a python file, parsed again if it changed.
+
+        Args:
+            path (Union[str, Path]): Path of the python file.
+
+        Returns:
+            Dict: The entry, see _parse_file.  None if the file does not
+            exist or is not a python file.
+        """
+        path = os.path.abspath(path)
+        if not path.endswith('.py'):
+            return None
+        self._refresh(path)
+        return self._entries.get(path)
+
+    def _refresh(self, path: str) -> bool:
+        """Parse a file if it is not in the index or changed.
+
+        Args:
+            path (str): Absolute path of the python file.
+
+        Returns:
+            bool: True if the file was parsed.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if self._entries.pop(path, None) is not None:
+                self._changed = True
+            return False
+        entry = self._entries.get(path)
+        if entry is not None and entry.mtime == stat.st_mtime and \
+                entry.size == stat.st_size:
+            return False
+        entry = _parse_file(path)
+        entry.mtime = stat.st_mtime
+        entry.size = stat.st_size
+        self._entries[path] = entry
+        self._changed = True
+        return True
+
+    def main_class(self, path: Union[str, Path]) -> str:
+        """Name of the QComponent class of a file.  As for the GUI, this is
+        the first class in alphabetical order defined in the file.
+
+        Args:
+            path (Union[str, Path]): Path of the python file.
+
+        Returns:
+            str: Name of the class.  None if there is none.
+        """
+        entry = self.get(path)
+        if not entry or not entry.classes:
+            return None
+        return sorted(entry.classes)[0]
+
+    def tooltip(self, path: Union[str, Path]) -> str:
+        """TOOLTIP of the QComponent class of a file.  When the class does
+        not define it, it is looked up in its base classes, by name, among
+        the indexed files.
+
+        Args:
+            path (Union[str, Path]): Path of the python file.
+
+        Returns:
+            str: The TOOLTIP.  '' if it is not found.
+        """
+        entry = self.get(path)
+        name = self.main_class(path)
+        if name is None:
+            return ''
+        info = entry.classes[name]
+        seen = set()
+        while info is not None and info.tooltip is None:
+            seen.add(name)
+            info, name = self._find_base(info.bases, seen)
+        return info.tooltip if info is not None else ''
+
+    def _find_base(self, bases: list, seen: set) -> tuple:
+        """Find the first base class in the index.
+
+        Args:
+            bases (list): Names of the base classes.
+            seen (set): Names of the classes already visited.
+
+        Returns:
+            tuple: The info and name of the class, or (None, None).
+        """
+        for base in bases:
+            if base in seen:
+                continue
+            for entry in self._entries.values():
+                if base in entry.classes:
+                    return entry.classes[base], base
+        return None, None
@@ -44,6 +44,26 @@ Submodules
 """
 
 from .attr_dict import Dict
-from .display import format_dict_ala_z, Headings
-from .display import MetalTutorialMagics
-from .display import Color
+
+# display imports IPython, which is slow.  Imported on first access.
+_display_names = [
+    'format_dict_ala_z', 'Headings', 'MetalTutorialMagics', 'Color'
+]
+
+
+def __getattr__(name: str):
+    """Import the names of display on first access.
+
+    Args:
+        name (str): Name of the attribute.
+
+    Returns:
+        The object.
+
+    Raises:
+        AttributeError: If name is not part of the module.
+    """
+    if name in _display_names:
+        from . import display  # pylint: disable=import-outside-toplevel
+        return getattr(display, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
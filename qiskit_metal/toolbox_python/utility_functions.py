@@ -429,7 +429,8 @@ def good_fillet_idxs(coords: list,
 def get_range_of_vertex_to_not_fillet(coords: list,
                                       fradius: float,
                                       precision: int = 9,
-                                      add_endpoints: bool = True) -> list:
+                                      add_endpoints: bool = True,
+                                      bad_idxs: list = None) -> list:
     """Provide a list of tuples for a list of integers that correspond to
     coords. Each tuple corresponds to a range of indexes within coords.  A
     range denotes vertexes that are too short to be fillet'd.
@@ -443,6 +444,8 @@ def get_range_of_vertex_to_not_fillet(coords: list,
         precision (int, optional): Digits of precision used for round(). Defaults to 9.
         add_endpoints (bool): Default is True.  If the second to endpoint is in list,
             add the endpoint to list.  Used for GDS, not add_qgeometry.
+        bad_idxs (list): Result of bad_fillet_idxs for coords, if already
+            computed, such as by fillet.bad_fillet_idxs_batch.  Defaults to None.
 
     Returns:
         list: A compressed list of tuples.  So, it combines adjacent vertexes into a longer one.
@@ -450,7 +453,13 @@ def get_range_of_vertex_to_not_fillet(coords: list,
     length = len(coords)
 
     # isclosed=False is for LineString
-    unique_vertex = bad_fillet_idxs(coords, fradius, precision, isclosed=False)
+    if bad_idxs is None:
+        unique_vertex = bad_fillet_idxs(coords,
+                                        fradius,
+                                        precision,
+                                        isclosed=False)
+    else:
+        unique_vertex = list(bad_idxs)
 
     if add_endpoints:
         # The endpoints of LineString are never fillet'd. If the second vertex or second to last vertex
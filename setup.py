@@ -61,6 +61,9 @@ setup(
     },
     python_requires=">=3.9",
     install_requires=requirements,
+    entry_points={
+        "console_scripts": ["qiskit-metal=qiskit_metal.__main__:main"],
+    },
     project_urls={
         "Bug Tracker": "https://github.com/Qiskit/qiskit-metal/issues",
         "Documentation": "https://qiskit-community.github.io/qiskit-metal/",